@@ -0,0 +1,167 @@
+"""
+ASGI 동시성 벤치마크 - 동기 API(config.urls) vs async API(config.asgi_urls)
+
+워커 하나(이벤트 루프 하나, django ASGIHandler)에 자주 호출되는 읽기 API 4개
+(auth:me, auth:check, locations:list, event-list)를 동시 요청 수를 늘려 가며 보내고
+  - 처리량과 지연(p50/p95)
+  - 요청 하나가 스레드를 붙잡고 있는 시간 (sync_to_async 스레드에서 실행된 시간, thread_ms/req)
+  - 평균적으로 일하고 있는 스레드 수 (busy_threads) 와 그 스레드 하나당 진행 중인 요청 수
+    (inflight/busy) - 스레드 수가 정해진 워커가 동시에 감당할 수 있는 요청 수의 비율
+를 비교한다. 동기 API 는 뷰 전체가 스레드에서 돌고, async API 는 ORM 호출 동안만 스레드를 쓴다.
+
+네트워크 너머 DB 서버의 왕복 지연을 흉내 내려고 쿼리마다 BENCH_DB_LATENCY_MS 만큼 쉰다.
+
+    python -m pytest benchmarks/bench_async_concurrency.py -s
+    BENCH_CONCURRENCY=1,16,64 BENCH_DB_LATENCY_MS=5 python -m pytest benchmarks/bench_async_concurrency.py -s
+"""
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from asgiref.sync import SyncToAsync
+from django.core.handlers.asgi import ASGIHandler
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+
+from benchmarks.stats import latency_summary
+from events.tests.factories import EventFactory
+from locations.tests.factories import LocationFactory
+from users.tests.factories import UserFactory
+
+CONCURRENCY = [int(n) for n in os.environ.get('BENCH_CONCURRENCY', '1,8,32,128').split(',')]
+REQUESTS = int(os.environ.get('BENCH_REQUESTS', 512))
+DB_LATENCY = float(os.environ.get('BENCH_DB_LATENCY_MS', 2)) / 1000
+URL_NAMES = ('auth:me', 'auth:check', 'locations:list', 'event-list')
+
+
+def _db_latency(execute, sql, params, many, context):
+    time.sleep(DB_LATENCY)
+    return execute(sql, params, many, context)
+
+
+def _add_db_latency(sender, connection, **kwargs):
+    if _db_latency not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _db_latency)
+
+
+class ThreadTime:
+    """sync_to_async 스레드에서 함수가 실행된 시간 합계"""
+
+    def __init__(self):
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def wrap(self, thread_handler):
+        def timed(handler, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return thread_handler(handler, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self.total += time.perf_counter() - started
+
+        return timed
+
+
+async def _get(app, path: str, cookie: str) -> int:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+        'server': ('testserver', 80),
+        'client': ('127.0.0.1', 50000),
+    }
+    body = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    disconnected = asyncio.Event()
+    status = []
+
+    async def receive():
+        if body:
+            return body.pop()
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            status.append(message['status'])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def _run(app, paths, cookie: str, concurrency: int):
+    """동시 요청 concurrency 개를 유지하며 paths 를 순서대로 보낸다"""
+    queue = list(reversed(paths))
+    samples, statuses = [], []
+    peak_threads = threading.active_count()
+
+    async def worker():
+        nonlocal peak_threads
+        while queue:
+            path = queue.pop()
+            started = time.perf_counter()
+            statuses.append(await _get(app, path, cookie))
+            samples.append(time.perf_counter() - started)
+            peak_threads = max(peak_threads, threading.active_count())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, statuses, time.perf_counter() - started, peak_threads
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_async_read_apis_concurrency(settings, monkeypatch):
+    user = UserFactory()
+    LocationFactory.create_batch(50)
+    EventFactory.create_batch(50)
+    client = Client()
+    client.force_login(user)
+    cookie = f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}'
+
+    connection_created.connect(_add_db_latency, dispatch_uid='bench_async_concurrency')
+    thread_time = ThreadTime()
+    monkeypatch.setattr(SyncToAsync, 'thread_handler', thread_time.wrap(SyncToAsync.thread_handler))
+
+    print(f'\nDB latency {DB_LATENCY * 1000:.1f}ms/query, {REQUESTS} requests per run')
+    print(f"{'':<8}{'concurrency':>12}{'req/s':>10}{'p50_ms':>10}{'p95_ms':>10}"
+          f"{'thread_ms/req':>15}{'busy_threads':>14}{'inflight/busy':>15}{'threads':>9}")
+    thread_ms_per_request = {}
+    try:
+        for urlconf in ('config.urls', 'config.asgi_urls'):
+            settings.ROOT_URLCONF = urlconf
+            paths = [reverse(URL_NAMES[n % len(URL_NAMES)]) for n in range(REQUESTS)]
+            app = ASGIHandler()
+            label = 'async' if urlconf == 'config.asgi_urls' else 'sync'
+
+            for concurrency in CONCURRENCY:
+                thread_time.total = 0.0
+                # 서버처럼 이 스레드에서 이벤트 루프를 직접 돌린다 (async_to_sync 로 돌리면
+                # sync_to_async 호출이 전부 이 스레드 하나로 모인다)
+                samples, statuses, elapsed, peak_threads = asyncio.run(_run(app, paths, cookie, concurrency))
+                assert set(statuses) == {200}
+
+                summary = latency_summary(samples)
+                busy_threads = thread_time.total / elapsed
+                thread_ms_per_request[label, concurrency] = thread_time.total / REQUESTS * 1000
+                print(
+                    f'{label:<8}{concurrency:>12}{REQUESTS / elapsed:>10.0f}'
+                    f"{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+                    f'{thread_ms_per_request[label, concurrency]:>15.2f}{busy_threads:>14.2f}'
+                    f'{concurrency / busy_threads:>15.2f}{peak_threads:>9}'
+                )
+    finally:
+        connection_created.disconnect(dispatch_uid='bench_async_concurrency')
+
+    busiest = max(CONCURRENCY)
+    assert thread_ms_per_request['async', busiest] < thread_ms_per_request['sync', busiest]
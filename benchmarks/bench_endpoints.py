@@ -0,0 +1,48 @@
+"""
+전체 엔드포인트 부하/지연 벤치마크 (benchmarks.harness)
+
+    BENCH_SCALE=1x|10x|100x BENCH_ITERATIONS=50 python -m pytest benchmarks/bench_endpoints.py -s
+
+BENCH_REPORT 에 경로를 주면 보고서를 JSON 으로 저장하고, BENCH_BASELINE 에 이전 보고서를 주면
+p50 이 BENCH_TOLERANCE 배(기본 1.25) 넘게 느려졌거나 쿼리 수가 늘어난 엔드포인트가 있을 때 실패한다.
+"""
+import os
+import time
+
+import pytest
+
+from benchmarks import harness
+
+SCALE = os.environ.get('BENCH_SCALE', '1x')
+ITERATIONS = int(os.environ.get('BENCH_ITERATIONS', 50))
+TOLERANCE = float(os.environ.get('BENCH_TOLERANCE', 1.25))
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_endpoints(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / 'media'
+
+    started = time.perf_counter()
+    dataset = harness.seed(scale=SCALE)
+    seeded = time.perf_counter() - started
+
+    recorder = harness.run(dataset=dataset, iterations=ITERATIONS)
+    report = recorder.report()
+
+    print()
+    print(f'scale={SCALE} iterations={ITERATIONS} seed={seeded:.1f}s')
+    print(harness.format_report(report))
+    print('requests/sec by scenario:', recorder.throughput())
+
+    if os.environ.get('BENCH_REPORT'):
+        harness.report_save(os.environ['BENCH_REPORT'], scale=SCALE, report=report)
+
+    # 시나리오 요청은 모두 성공해야 측정값이 의미 있다
+    assert not {endpoint: row['errors'] for endpoint, row in report.items() if row['errors']}
+
+    if os.environ.get('BENCH_BASELINE'):
+        baseline = harness.report_load(os.environ['BENCH_BASELINE'])
+        assert baseline['scale'] == SCALE, '같은 규모의 기준선과 비교해야 합니다.'
+        found = harness.regressions(report=report, baseline=baseline['endpoints'], tolerance=TOLERANCE)
+        assert not found, '\n'.join(found)
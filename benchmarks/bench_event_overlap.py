@@ -0,0 +1,122 @@
+"""
+장소 중복 예약 검사 벤치마크
+
+이벤트 100,000건이 쌓인 상태에서
+  1) 단건 생성 시 (location, event_date, start_time) 인덱스를 타는 중복 검사 지연
+  2) 반복 일정 후보 1,000건(장소 20곳 x 주간 50회) 일괄 검사:
+     후보마다 쿼리 vs event_schedule_conflicts (구간 트리)
+를 측정한다.
+
+    python -m pytest benchmarks/bench_event_overlap.py -s
+"""
+import os
+import random
+import time as timer
+from datetime import date, time, timedelta
+
+import pytest
+from django.db import connection
+
+from benchmarks.stats import format_summary
+from events.models import Event
+from events.services import _event_overlapping_qs, event_schedule_conflicts
+from locations.tests.factories import LocationFactory
+from users.tests.factories import UserFactory
+
+EVENT_COUNT = int(os.environ.get('BENCH_EVENT_COUNT', 100_000))
+LOCATION_COUNT = int(os.environ.get('BENCH_LOCATION_COUNT', 200))
+PROBE_COUNT = int(os.environ.get('BENCH_PROBE_COUNT', 1000))
+FIRST_DAY = date(2024, 1, 1)
+DAYS = 3 * 365
+
+
+def _random_slot(rng):
+    start_hour = rng.randrange(8, 21)
+    return time(start_hour), time(start_hour + rng.randrange(1, 3))
+
+
+def _seed_events(rng):
+    locations = LocationFactory.create_batch(LOCATION_COUNT)
+    user = UserFactory()
+
+    events = []
+    for n in range(EVENT_COUNT):
+        start_time, end_time = _random_slot(rng)
+        events.append(Event(
+            title=f'벤치마크 이벤트 {n}',
+            description='',
+            event_date=FIRST_DAY + timedelta(days=rng.randrange(DAYS)),
+            start_time=start_time,
+            end_time=end_time,
+            location=rng.choice(locations),
+            max_participants=50,
+            created_by=user,
+        ))
+    Event.objects.bulk_create(events, batch_size=5000)
+    return locations
+
+
+def _random_proposals(rng, locations, count):
+    proposals = []
+    for _ in range(count):
+        start_time, end_time = _random_slot(rng)
+        proposals.append({
+            'location_id': rng.choice(locations).id,
+            'event_date': FIRST_DAY + timedelta(days=rng.randrange(DAYS)),
+            'start_time': start_time,
+            'end_time': end_time,
+        })
+    return proposals
+
+
+def _weekly_series_proposals(rng, locations, count, weeks=50):
+    """장소마다 같은 요일/시간대로 매주 반복되는 일정 후보"""
+    proposals = []
+    for location in rng.sample(locations, count // weeks):
+        first_day = FIRST_DAY + timedelta(days=rng.randrange(DAYS - weeks * 7))
+        start_time, end_time = _random_slot(rng)
+        for week in range(weeks):
+            proposals.append({
+                'location_id': location.id,
+                'event_date': first_day + timedelta(weeks=week),
+                'start_time': start_time,
+                'end_time': end_time,
+            })
+    return proposals
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_event_overlap_checks():
+    rng = random.Random(42)
+    locations = _seed_events(rng)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    latencies = []
+    for proposal in _random_proposals(rng, locations, PROBE_COUNT):
+        started = timer.perf_counter()
+        _event_overlapping_qs(**proposal).exists()
+        latencies.append(timer.perf_counter() - started)
+
+    series = _weekly_series_proposals(rng, locations, PROBE_COUNT)
+
+    started = timer.perf_counter()
+    per_row_conflicts = set()
+    for proposal in series:
+        per_row_conflicts.update(_event_overlapping_qs(**proposal).values_list('id', flat=True))
+    per_row_total = timer.perf_counter() - started
+
+    started = timer.perf_counter()
+    conflicts = event_schedule_conflicts(proposals=series)
+    batch_total = timer.perf_counter() - started
+
+    print()
+    print(format_summary(f'single overlap check ({EVENT_COUNT} events)', latencies))
+    print(
+        f'weekly series of {len(series)}: per-row queries={per_row_total * 1000:.1f}ms '
+        f'interval tree={batch_total * 1000:.1f}ms'
+    )
+
+    # 기존 이벤트와의 충돌은 두 방식이 같아야 한다
+    assert {other for _, kind, other in conflicts if kind == 'event'} == per_row_conflicts
@@ -0,0 +1,93 @@
+"""
+로그인 버스트 벤치마크 - 비밀번호 해시를 요청 스레드에서 계산 vs 프로세스 풀 + 동시 실행 제한
+
+BENCH_LOGINS 건의 로그인을 BENCH_CONCURRENCY 개 스레드로 동시에 보내면서, 다른 스레드에서
+가벼운 API(auth:check)를 계속 호출해
+  - 로그인 처리량과 지연(p50/p95), 503(PasswordHashBusy) 건수
+  - 버스트 동안 다른 API 의 지연 (해시 계산이 다른 요청을 얼마나 굶기는지)
+를 비교한다. 해시 방식은 settings.PASSWORD_HASHERS 그대로다 (argon2-cffi 가 없으면 PBKDF2).
+
+    python -m pytest benchmarks/bench_login_burst.py -s
+    BENCH_LOGINS=64 BENCH_HASH_WORKERS=4 python -m pytest benchmarks/bench_login_burst.py -s
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+
+from benchmarks.stats import latency_summary
+from users.hashing import password_make
+from users.tests.factories import UserFactory
+
+LOGINS = int(os.environ.get('BENCH_LOGINS', 32))
+CONCURRENCY = int(os.environ.get('BENCH_CONCURRENCY', 16))
+HASH_WORKERS = int(os.environ.get('BENCH_HASH_WORKERS', os.cpu_count() or 1))
+MAX_CONCURRENCY = int(os.environ.get('BENCH_HASH_MAX_CONCURRENCY', 2 * HASH_WORKERS))
+
+# (이름, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_CONCURRENCY)
+CONFIGS = [
+    ('in-thread', 0, CONCURRENCY),
+    ('pool', HASH_WORKERS, MAX_CONCURRENCY),
+]
+
+
+def _probe(url: str, client: Client, stop: threading.Event, samples: list):
+    try:
+        while not stop.is_set():
+            started = time.perf_counter()
+            assert client.get(url).status_code == 200
+            samples.append(time.perf_counter() - started)
+    finally:
+        connections.close_all()
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_login_burst(settings):
+    settings.PASSWORD_HASH_QUEUE_TIMEOUT = 30
+    users = UserFactory.create_batch(LOGINS)
+    login_url, probe_url = reverse('auth:login'), reverse('auth:check')
+    probe_client = Client()
+    probe_client.force_login(users[0])
+
+    def login(user):
+        started = time.perf_counter()
+        try:
+            response = Client().post(login_url, {'username': user.username, 'password': 'testpass123'})
+            return response.status_code, time.perf_counter() - started
+        finally:
+            connections.close_all()
+
+    print(f'\n{LOGINS} logins, {CONCURRENCY} threads, {os.cpu_count()} CPUs')
+    print(f"{'':<12}{'workers':>8}{'cap':>6}{'login/s':>10}{'p50_ms':>10}{'p95_ms':>10}{'503':>6}"
+          f"{'probe_n':>9}{'probe_p50':>11}{'probe_p95':>11}")
+    for label, workers, max_concurrency in CONFIGS:
+        settings.PASSWORD_HASH_WORKERS = workers
+        settings.PASSWORD_HASH_MAX_CONCURRENCY = max_concurrency
+        # 풀 프로세스를 미리 띄워 두고 잰다
+        password_make(password='warmup')
+
+        stop, probe_samples = threading.Event(), []
+        probe = threading.Thread(target=_probe, args=(probe_url, probe_client, stop, probe_samples))
+        probe.start()
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+            started = time.perf_counter()
+            results = list(pool.map(login, users))
+            elapsed = time.perf_counter() - started
+        stop.set()
+        probe.join()
+
+        statuses = [code for code, _ in results]
+        summary = latency_summary([latency for _, latency in results])
+        probe_summary = latency_summary(probe_samples)
+        print(
+            f'{label:<12}{workers:>8}{max_concurrency:>6}{LOGINS / elapsed:>10.1f}'
+            f"{summary['p50_ms']:>10.0f}{summary['p95_ms']:>10.0f}{statuses.count(503):>6}"
+            f"{probe_summary['count']:>9}{probe_summary['p50_ms']:>11.2f}{probe_summary['p95_ms']:>11.2f}"
+        )
+        assert set(statuses) <= {200, 503}
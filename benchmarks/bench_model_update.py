@@ -0,0 +1,61 @@
+"""
+model_update 검증 범위 벤치마크
+
+user_update(전화번호 변경)와 location_update(설명 변경)를
+  1) full_clean 전체 검증 (validate_changed_only=False) - 기존 동작
+  2) 바뀐 필드만 검증 (기본값)
+으로 실행해 호출당 쿼리 수와 지연을 비교한다.
+
+    python -m pytest benchmarks/bench_model_update.py -s
+"""
+import functools
+import os
+import time as timer
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from benchmarks.stats import format_summary
+from common.services import model_update
+from locations.services import location_update
+from locations.tests.factories import LocationFactory
+from users.services import user_update
+from users.tests.factories import UserFactory
+
+CALLS = int(os.environ.get('BENCH_CALLS', 500))
+
+
+def _measure(call):
+    samples = []
+    with CaptureQueriesContext(connection) as queries:
+        for n in range(CALLS):
+            started = timer.perf_counter()
+            call(n)
+            samples.append(timer.perf_counter() - started)
+    return samples, len(queries) / CALLS
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_model_update_validation(monkeypatch):
+    user = UserFactory()
+    location = LocationFactory()
+
+    cases = {
+        'user_update(phone)': lambda n: user_update(user=user, data={'phone': f'010-0000-{n:04d}'}),
+        'location_update(description)': lambda n: location_update(location=location, data={'description': f'설명 {n}'}),
+    }
+
+    print()
+    for name, call in cases.items():
+        for module in ('users.services', 'locations.services'):
+            monkeypatch.setattr(f'{module}.model_update', functools.partial(model_update, validate_changed_only=False))
+        before, before_queries = _measure(call)
+        monkeypatch.undo()
+
+        after, after_queries = _measure(call)
+
+        print(format_summary(f'{name} full_clean', before), f'queries/call={before_queries:.1f}')
+        print(format_summary(f'{name} changed only', after), f'queries/call={after_queries:.1f}')
+        assert after_queries < before_queries
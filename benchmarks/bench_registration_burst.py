@@ -0,0 +1,71 @@
+"""
+참석 신청 버스트 벤치마크
+
+인기 이벤트 오픈 직후처럼 1,000건의 참석 신청이 동시에 몰릴 때
+정원 초과 없이 처리되는지, 응답 지연 분포(p50/p95/p99)가 어떤지 측정한다.
+
+    python -m pytest benchmarks/bench_registration_burst.py -s
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connections
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from benchmarks.stats import format_summary
+from events.models import Event, EventRegistration
+from events.tests.factories import EventFactory
+from users.tests.factories import UserFactory
+
+BURST_SIZE = int(os.environ.get('BENCH_BURST_SIZE', 1000))
+CONCURRENCY = int(os.environ.get('BENCH_CONCURRENCY', 64))
+MAX_PARTICIPANTS = 100
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_registration_burst_never_oversells():
+    event = EventFactory(max_participants=MAX_PARTICIPANTS)
+    user = UserFactory()
+    url = reverse('eventregistration-list')
+
+    def register(n):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        started = time.perf_counter()
+        try:
+            response = client.post(url, {
+                'event': event.id,
+                'name': f'참석자{n}',
+                'email': f'burst{n}@example.com',
+                'phone': '010-0000-0000',
+                'company': '벤치마크',
+                'how_did_you_know': '버스트 테스트',
+            }, format='json')
+            return response.status_code, time.perf_counter() - started
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(register, range(BURST_SIZE)))
+        elapsed = time.perf_counter() - started
+
+    statuses = [code for code, _ in results]
+    latencies = [latency for _, latency in results]
+
+    event.refresh_from_db()
+    confirmed = EventRegistration.objects.filter(event=event, status=EventRegistration.Status.CONFIRMED).count()
+    waitlisted = EventRegistration.objects.filter(event=event, status=EventRegistration.Status.WAITLISTED).count()
+
+    print()
+    print(format_summary(f'registration burst x{BURST_SIZE} (c={CONCURRENCY})', latencies))
+    print(f'throughput={BURST_SIZE / elapsed:.1f} req/s confirmed={confirmed} waitlisted={waitlisted}')
+
+    assert statuses.count(201) == BURST_SIZE
+    assert confirmed == MAX_PARTICIPANTS
+    assert event.registration_count == MAX_PARTICIPANTS
+    assert waitlisted == BURST_SIZE - MAX_PARTICIPANTS
@@ -0,0 +1,74 @@
+"""
+세션 저장 비용 벤치마크 - 세션 캐시 백엔드별로 저장된 세션 수에 따라 저장 한 번이 얼마나 드는지
+
+세션 캐시(SESSION_CACHE_ALIAS)에 BENCH_SESSION_COUNTS 개의 세션을 넣어 둔 뒤, 그중 BENCH_SAVES 개를
+바꿔 저장(SessionStore.save - 캐시에 쓰고 write-behind 에 모은다)하는 지연을 잰다.
+  - filebased: FileBasedCache - set 마다 _cull 이 디렉터리 전체를 훑어 세션 수에 비례한다
+  - locmem:    쓰기가 O(1) 인 공유 캐시(Redis/Memcached)를 대신한다
+  - dummy:     캐시 계층 없음 (기본 설정)
+
+    python -m pytest benchmarks/bench_session_save.py -s
+    BENCH_SESSION_COUNTS=100,1000,5000 python -m pytest benchmarks/bench_session_save.py -s
+"""
+import os
+import tempfile
+import time
+from datetime import timedelta
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.utils import timezone
+
+from benchmarks.stats import format_summary
+from common.sessions import SessionStore, session_local_tiers_clear
+
+COUNTS = [int(count) for count in os.environ.get('BENCH_SESSION_COUNTS', '100,2000').split(',')]
+SAVES = int(os.environ.get('BENCH_SAVES', 200))
+
+BACKENDS = {
+    'filebased': lambda: {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': tempfile.mkdtemp(prefix='bench-sessions-'),
+        'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+    },
+    'locmem': lambda: {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench-sessions',
+        'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+    },
+    'dummy': lambda: {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+}
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_session_save_cost(settings, backend):
+    print(f'\n{backend}: {SAVES} saves')
+    data = SessionStore().encode({'n': 0})
+    expire_date = timezone.now() + timedelta(seconds=settings.SESSION_COOKIE_AGE)
+    for count in COUNTS:
+        settings.CACHES = {**settings.CACHES, 'sessions': BACKENDS[backend]()}
+        cache = caches['sessions']
+        cache.clear()
+        session_local_tiers_clear()
+
+        keys = [f'bench{count}x{n:08d}' for n in range(count)]
+        Session.objects.bulk_create(
+            [Session(session_key=key, session_data=data, expire_date=expire_date) for key in keys],
+            batch_size=1000,
+        )
+        for key in keys:
+            cache.set(SessionStore.cache_key_prefix + key, {'n': 0}, settings.SESSION_COOKIE_AGE)
+
+        samples = []
+        for key in keys[:SAVES]:
+            session = SessionStore(key)
+            session['n'] = 1
+            started = time.perf_counter()
+            session.save()
+            samples.append(time.perf_counter() - started)
+
+        print(format_summary(f'{count} sessions', samples))
+        session_local_tiers_clear()
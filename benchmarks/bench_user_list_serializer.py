@@ -0,0 +1,97 @@
+"""
+UserListApi 직렬화 벤치마크
+
+사용자 10,000명을 user_list() 로 읽어
+  1) DRF OutputSerializer(many=True)  - 기존 경로
+  2) compile_serializer(OutputSerializer).many() - 컴파일된 경로
+로 직렬화하는 시간과, 두 경로를 쓴 UserListApi 전체 요청 시간을 비교한다.
+
+    python -m pytest benchmarks/bench_user_list_serializer.py -s
+"""
+import os
+import time as timer
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from benchmarks.stats import format_summary
+from common.serializers import compile_serializer
+from users.apis import UserListApi
+from users.models import User
+from users.selectors import user_list
+
+USER_COUNT = int(os.environ.get('BENCH_USER_COUNT', 10_000))
+ROUNDS = int(os.environ.get('BENCH_ROUNDS', 10))
+
+
+def _seed_users():
+    # UserListApi 의 BooleanField 필터는 쿼리스트링에 없으면 False 로 적용되므로
+    # (newsletter_subscribed=False, has_referrer=False) 전체 사용자가 목록에 나오도록 맞춘다.
+    # 해시 계산이 시드 시간을 지배하지 않도록 같은 해시를 재사용한다
+    password = make_password('benchpass123')
+    User.objects.bulk_create(
+        (
+            User(
+                username=f'user{n}',
+                email=f'user{n}@example.com',
+                password=password,
+                company=f'회사{n % 50}',
+            )
+            for n in range(USER_COUNT - 1)
+        ),
+        batch_size=2000,
+    )
+    return User.objects.create_user(
+        username='benchadmin', email='benchadmin@example.com', password='benchpass123',
+        user_type=User.UserType.ADMIN,
+    )
+
+
+def _time_rounds(func):
+    samples = []
+    for _ in range(ROUNDS):
+        started = timer.perf_counter()
+        func()
+        samples.append(timer.perf_counter() - started)
+    return samples
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_user_list_serialization(monkeypatch):
+    admin = _seed_users()
+    users = list(user_list())
+    serializer_class = UserListApi.OutputSerializer
+    compiled = compile_serializer(serializer_class)
+
+    # 출력이 DRF 와 완전히 같아야 한다
+    assert compiled.many(users) == serializer_class(users, many=True).data
+
+    drf_samples = _time_rounds(lambda: serializer_class(users, many=True).data)
+    compiled_samples = _time_rounds(lambda: compiled.many(users))
+
+    client = APIClient()
+    client.force_authenticate(admin)
+    url = reverse('users:list')
+
+    def request():
+        response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.data) == len(users)
+
+    api_compiled_samples = _time_rounds(request)
+
+    # 기존 경로(DRF many=True)로 되돌린 UserListApi
+    monkeypatch.setattr(
+        'users.apis.compile_serializer',
+        lambda cls: type('DrfSerializer', (), {'many': lambda self, rows: cls(rows, many=True).data})(),
+    )
+    api_drf_samples = _time_rounds(request)
+
+    print()
+    print(format_summary(f'DRF many=True ({len(users)} users)', drf_samples))
+    print(format_summary(f'compiled ({len(users)} users)', compiled_samples))
+    print(format_summary('UserListApi before (DRF)', api_drf_samples))
+    print(format_summary('UserListApi after (compiled)', api_compiled_samples))
@@ -0,0 +1,35 @@
+"""
+벤치마크 공통 설정
+
+벤치마크 모듈은 bench_*.py 로 이름을 지어 기본 테스트 수집에서 제외한다.
+실행할 때는 파일을 직접 지정한다.
+
+    python -m pytest benchmarks/bench_registration_burst.py -s
+"""
+import tempfile
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    """
+    동시성 벤치마크를 위해 테스트 DB를 파일 기반 SQLite로 바꾼다.
+
+    인메모리 공유 캐시 DB는 busy timeout이 적용되지 않아 동시 쓰기에서
+    바로 'table is locked' 오류가 나므로, WAL + IMMEDIATE 트랜잭션으로
+    쓰기 요청이 락을 기다리며 직렬화되도록 한다.
+    """
+    db = settings.DATABASES['default']
+    if db['ENGINE'] != 'django.db.backends.sqlite3':
+        return
+
+    db_path = Path(tempfile.mkdtemp(prefix='bench-')) / 'bench.sqlite3'
+    db.setdefault('TEST', {})['NAME'] = str(db_path)
+    db.setdefault('OPTIONS', {}).update({
+        'timeout': 60,
+        'transaction_mode': 'IMMEDIATE',
+        'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+    })
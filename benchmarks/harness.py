@@ -0,0 +1,326 @@
+"""
+엔드포인트 부하/지연 벤치마크 하네스
+
+factory-boy 팩토리로 1x/10x/100x 규모의 데이터를 시드하고, 사용자 시나리오
+(이벤트 둘러보기, 참석 신청, 발표 업로드, 어드민 승인 등)를 WSGI 앱에 대해
+프로세스 안에서(django.test.Client) 반복 실행한다. 요청마다 URL 이름
+(resolver_match.view_name) 별로 지연과 쿼리 수(common.instrumentation)를 모아
+p50/p95/p99 로 보고한다.
+
+    BENCH_SCALE=10x python -m pytest benchmarks/bench_endpoints.py -s
+
+보고서를 JSON 으로 저장해 두고 다음 실행에서 기준선으로 비교할 수 있다.
+
+    BENCH_REPORT=baseline.json python -m pytest benchmarks/bench_endpoints.py -s
+    BENCH_BASELINE=baseline.json python -m pytest benchmarks/bench_endpoints.py -s
+"""
+import json
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, time as dtime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import factory
+import factory.random
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from benchmarks.stats import latency_summary
+
+SCALES = {'1x': 1, '10x': 10, '100x': 100}
+
+# 1x 기준 행 수 - 규모 배수만큼 곱한다
+BASE_COUNTS = {
+    'locations': 5,
+    'regular_members': 10,
+    'associate_members': 10,
+    'events': 10,
+    'registrations_per_event': 10,
+    'presentations_per_event': 2,
+    'comments_per_presentation': 2,
+}
+
+FIRST_EVENT_DAY = date(2030, 1, 1)
+
+
+@dataclass
+class Dataset:
+    """시나리오가 참조하는 시드 데이터 id"""
+
+    admin_id: int
+    regular_ids: List[int]
+    associate_ids: List[int]
+    event_ids: List[int]
+    location_ids: List[int]
+    presentation_ids: List[int]
+
+
+def scale_factor(scale: str) -> int:
+    if scale not in SCALES:
+        raise ValueError(f'알 수 없는 규모: {scale} (가능한 값: {", ".join(SCALES)})')
+    return SCALES[scale]
+
+
+def seed(*, scale: str = '1x', rng: Optional[random.Random] = None) -> Dataset:
+    """
+    팩토리로 시나리오용 데이터를 만든다.
+
+    비밀번호 해시가 시드 시간을 지배하지 않도록 시드하는 동안만 MD5 해셔를 쓴다
+    (시나리오는 force_login 으로 로그인하므로 비밀번호 검증을 하지 않는다).
+    """
+    from events.tests.factories import EventFactory, EventRegistrationFactory
+    from locations.tests.factories import LocationFactory
+    from presentations.tests.factories import MemberCommentFactory, PresentationFactory
+    from users.tests.factories import AdminUserFactory, AssociateMemberFactory, RegularMemberFactory
+
+    rng = rng or random.Random(42)
+    # Faker 값도 실행마다 같도록
+    factory.random.reseed_random(42)
+    factor = scale_factor(scale)
+    counts = {name: count * factor for name, count in BASE_COUNTS.items()}
+    # 이벤트당 개수는 규모와 무관하게 유지
+    for name in ('registrations_per_event', 'presentations_per_event', 'comments_per_presentation'):
+        counts[name] = BASE_COUNTS[name]
+
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        admin = AdminUserFactory(username='bench-admin')
+        regulars = RegularMemberFactory.create_batch(
+            counts['regular_members'], username=_sequence('bench-regular')
+        )
+        associates = AssociateMemberFactory.create_batch(
+            counts['associate_members'], username=_sequence('bench-associate'), referrer=admin
+        )
+
+    locations = LocationFactory.create_batch(counts['locations'])
+
+    events = []
+    for n in range(counts['events']):
+        # 같은 장소/시간대가 겹치지 않도록 장소마다 하루 한 건
+        events.append(EventFactory(
+            location=locations[n % len(locations)],
+            event_date=FIRST_EVENT_DAY + timedelta(days=n // len(locations)),
+            start_time=dtime(19, 0),
+            end_time=dtime(21, 0),
+            max_participants=rng.randint(counts['registrations_per_event'], 100),
+            created_by=admin,
+        ))
+
+    presentations = []
+    for event in events:
+        EventRegistrationFactory.create_batch(counts['registrations_per_event'], event=event)
+        for _ in range(counts['presentations_per_event']):
+            presentation = PresentationFactory(event=event, presenter=rng.choice(regulars))
+            MemberCommentFactory.create_batch(
+                counts['comments_per_presentation'], presentation=presentation, user=rng.choice(regulars)
+            )
+            presentations.append(presentation)
+
+    # 등록은 좌석 카운터를 거치지 않았으므로 실제 행 수와 맞춘다
+    call_command('reconcile_event_counters', stdout=_NullWriter())
+
+    return Dataset(
+        admin_id=admin.id,
+        regular_ids=[user.id for user in regulars],
+        associate_ids=[user.id for user in associates],
+        event_ids=[event.id for event in events],
+        location_ids=[location.id for location in locations],
+        presentation_ids=[presentation.id for presentation in presentations],
+    )
+
+
+def _sequence(prefix: str):
+    return factory.Sequence(lambda n: f'{prefix}-{n}')
+
+
+class _NullWriter:
+    def write(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+
+@dataclass
+class EndpointSamples:
+    latencies: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+    errors: int = 0
+
+
+class Recorder:
+    """Client 요청을 URL 이름별로 기록한다"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointSamples] = defaultdict(EndpointSamples)
+        self.scenario_time: Dict[str, float] = defaultdict(float)
+        self.scenario_requests: Dict[str, int] = defaultdict(int)
+
+    def request(self, scenario: str, client: Client, method: str, path: str, data=None, **kwargs):
+        started = time.perf_counter()
+        response = getattr(client, method)(path, data, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        request = response.wsgi_request
+        endpoint = request.resolver_match.view_name if request.resolver_match else path
+        samples = self.endpoints[f'{method.upper()} {endpoint}']
+        samples.latencies.append(elapsed)
+        samples.queries.append(request.metrics.queries if hasattr(request, 'metrics') else 0)
+        if response.status_code >= 400:
+            samples.errors += 1
+
+        self.scenario_time[scenario] += elapsed
+        self.scenario_requests[scenario] += 1
+        return response
+
+    def report(self) -> Dict[str, Dict]:
+        report = {}
+        for endpoint, samples in sorted(self.endpoints.items()):
+            summary = latency_summary(samples.latencies)
+            report[endpoint] = {
+                **{key: round(value, 3) for key, value in summary.items()},
+                'queries_avg': round(sum(samples.queries) / len(samples.queries), 1),
+                'errors': samples.errors,
+            }
+        return report
+
+    def throughput(self) -> Dict[str, float]:
+        """시나리오별 초당 요청 수 (요청 처리 시간 기준)"""
+        return {
+            scenario: round(self.scenario_requests[scenario] / elapsed, 1)
+            for scenario, elapsed in self.scenario_time.items()
+            if elapsed
+        }
+
+
+# 시나리오: (recorder, dataset, rng, iteration) -> None
+
+def browse_events(recorder: Recorder, dataset: Dataset, rng: random.Random, iteration: int) -> None:
+    """비로그인 방문자가 공개 페이지와 이벤트/발표 API 를 둘러본다"""
+    client = Client()
+    for path in (reverse('home'), reverse('events'), reverse('presentations')):
+        recorder.request('browse_events', client, 'get', path)
+    recorder.request('browse_events', client, 'get', reverse('event-list'))
+    recorder.request('browse_events', client, 'get', reverse('event-detail', args=[rng.choice(dataset.event_ids)]))
+    recorder.request('browse_events', client, 'get', reverse('presentation-list'))
+    recorder.request(
+        'browse_events', client, 'get', reverse('presentation-detail', args=[rng.choice(dataset.presentation_ids)])
+    )
+
+
+def member_dashboard(recorder: Recorder, dataset: Dataset, rng: random.Random, iteration: int) -> None:
+    """로그인한 회원이 내 정보, 장소, 대시보드를 본다"""
+    client = _logged_in_client(rng.choice(dataset.regular_ids))
+    recorder.request('member_dashboard', client, 'get', reverse('auth:me'))
+    recorder.request('member_dashboard', client, 'get', reverse('auth:check'))
+    recorder.request('member_dashboard', client, 'get', reverse('locations:list'))
+    recorder.request(
+        'member_dashboard', client, 'get', reverse('locations:suitable'), {'participant_count': rng.randint(10, 100)}
+    )
+    recorder.request('member_dashboard', client, 'get', reverse('event-dashboard'))
+
+
+def register_for_event(recorder: Recorder, dataset: Dataset, rng: random.Random, iteration: int) -> None:
+    """회원이 이벤트에 참석 신청한다"""
+    client = _logged_in_client(rng.choice(dataset.regular_ids))
+    recorder.request('register_for_event', client, 'post', reverse('eventregistration-list'), {
+        'event': rng.choice(dataset.event_ids),
+        'name': f'벤치마크 참석자 {iteration}',
+        'email': f'bench-registration-{iteration}@example.com',
+        'phone': '010-0000-0000',
+        'company': '벤치마크',
+        'how_did_you_know': '벤치마크',
+    }, content_type='application/json')
+
+
+def upload_presentation(recorder: Recorder, dataset: Dataset, rng: random.Random, iteration: int) -> None:
+    """정회원이 발표 자료를 업로드한다"""
+    client = _logged_in_client(rng.choice(dataset.regular_ids))
+    recorder.request('upload_presentation', client, 'post', reverse('presentation-list'), {
+        'title': f'벤치마크 발표 {iteration}',
+        'description': '벤치마크 발표 설명',
+        'event': rng.choice(dataset.event_ids),
+        'file_url': SimpleUploadedFile(f'bench-{iteration}.pdf', b'%PDF-1.4 ' * 4096, content_type='application/pdf'),
+    })
+
+
+def admin_approvals(recorder: Recorder, dataset: Dataset, rng: random.Random, iteration: int) -> None:
+    """어드민이 승인 대기 회원/발표를 보고 승인한다"""
+    client = _logged_in_client(dataset.admin_id)
+    recorder.request('admin_approvals', client, 'get', reverse('users:pending-approval'))
+    if dataset.associate_ids:
+        recorder.request('admin_approvals', client, 'post', reverse('users:approve', args=[dataset.associate_ids.pop()]))
+    recorder.request('admin_approvals', client, 'get', reverse('presentation-pending'))
+    recorder.request(
+        'admin_approvals', client, 'post', reverse('presentation-select', args=[rng.choice(dataset.presentation_ids)])
+    )
+    recorder.request('admin_approvals', client, 'get', reverse('users:list'))
+
+
+SCENARIOS: Dict[str, Callable[[Recorder, Dataset, random.Random, int], None]] = {
+    'browse_events': browse_events,
+    'member_dashboard': member_dashboard,
+    'register_for_event': register_for_event,
+    'upload_presentation': upload_presentation,
+    'admin_approvals': admin_approvals,
+}
+
+
+def _logged_in_client(user_id: int) -> Client:
+    from users.models import User
+
+    client = Client()
+    client.force_login(User.objects.get(pk=user_id))
+    return client
+
+
+def run(*, dataset: Dataset, iterations: int, scenarios=None, rng: Optional[random.Random] = None) -> Recorder:
+    """시나리오를 번갈아 iterations 번씩 실행한다"""
+    rng = rng or random.Random(42)
+    recorder = Recorder()
+    for iteration in range(iterations):
+        for name in scenarios or SCENARIOS:
+            SCENARIOS[name](recorder, dataset, rng, iteration)
+    return recorder
+
+
+def format_report(report: Dict[str, Dict]) -> str:
+    lines = [f"{'endpoint':<44} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'queries':>8} {'errors':>6}"]
+    for endpoint, row in report.items():
+        lines.append(
+            f"{endpoint:<44} {row['count']:>5} {row['p50_ms']:>7.2f}ms {row['p95_ms']:>7.2f}ms "
+            f"{row['p99_ms']:>7.2f}ms {row['queries_avg']:>8} {row['errors']:>6}"
+        )
+    return '\n'.join(lines)
+
+
+def regressions(*, report: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    기준선보다 p50 이 tolerance 배 넘게 느려졌거나 쿼리 수가 늘어난 엔드포인트
+
+    반복 수가 적으면 p95/p99 는 한두 개의 이상값(WAL 체크포인트, GC 등)에 좌우되므로
+    회귀 판정은 p50 과 쿼리 수로 한다.
+    """
+    found = []
+    for endpoint, row in report.items():
+        base = baseline.get(endpoint)
+        if base is None:
+            continue
+        if row['p50_ms'] > base['p50_ms'] * tolerance:
+            found.append(f"{endpoint}: p50 {base['p50_ms']:.2f}ms -> {row['p50_ms']:.2f}ms")
+        if row['queries_avg'] > base['queries_avg']:
+            found.append(f"{endpoint}: queries {base['queries_avg']} -> {row['queries_avg']}")
+    return found
+
+
+def report_save(path: str, *, scale: str, report: Dict[str, Dict]) -> None:
+    with open(path, 'w') as f:
+        json.dump({'scale': scale, 'endpoints': report}, f, ensure_ascii=False, indent=2)
+
+
+def report_load(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
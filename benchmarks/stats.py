@@ -0,0 +1,31 @@
+import math
+from typing import Dict, Sequence
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """nearest-rank 방식 백분위수 (q: 0~100)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples: Sequence[float]) -> Dict[str, float]:
+    """초 단위 샘플을 ms 단위 p50/p95/p99 요약으로 변환"""
+    return {
+        'count': len(samples),
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'max_ms': max(samples, default=0.0) * 1000,
+    }
+
+
+def format_summary(name: str, samples: Sequence[float]) -> str:
+    summary = latency_summary(samples)
+    return (
+        f"{name:<40} n={summary['count']:<6} "
+        f"p50={summary['p50_ms']:8.2f}ms p95={summary['p95_ms']:8.2f}ms "
+        f"p99={summary['p99_ms']:8.2f}ms max={summary['max_ms']:8.2f}ms"
+    )
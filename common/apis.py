@@ -0,0 +1,21 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common.instrumentation import request_metrics_snapshot
+from users.models import User
+
+
+class RequestMetricsApi(APIView):
+    """URL 이름별 쿼리 수/응답 시간 히스토그램 API (이 프로세스에서 처리한 요청 기준)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.user_type != User.UserType.ADMIN:
+            return Response(
+                {'error': '어드민 권한이 필요합니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(request_metrics_snapshot())
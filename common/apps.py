@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class CommonConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'common'
+    verbose_name = '공통'
+
+    def ready(self):
+        from common.instrumentation import instrument_render_paths
+        from common.signals import page_cache_signals_connect, search_signals_connect
+
+        search_signals_connect()
+        page_cache_signals_connect()
+        instrument_render_paths()
@@ -0,0 +1,105 @@
+"""
+ASGI 배포용 async 읽기 API
+
+DRF APIView 는 동기 전용이라 ASGI 에서도 요청 하나가 DB 를 기다리는 동안 스레드를
+붙잡는다. 자주 호출되는 읽기 API 는 django View 의 async 핸들러와 async ORM
+(aget, aaggregate, async for) 으로 다시 구현하고, config.asgi_urls 에서 같은 경로/
+URL 이름으로 동기 API 보다 먼저 매칭시킨다. WSGI(config.urls) 에서는 그대로 동기 API 를 쓴다.
+
+DRF 의 인증/권한/예외 처리는 동기 코드라서 필요한 만큼만 옮겨 둔다.
+  - 사용자: 세션에서 request.auser() 로 읽어 self.user 에 둔다 (aget_user 재정의로 바꿀 수 있다)
+  - 권한: login_required 면 비로그인 요청을 IsAuthenticated 와 같은 403 으로
+  - 예외: APIException 은 DRF 기본 예외 처리기와 같은 JSON 으로
+  - 조건부 GET: ConditionalGetMixin 과 같은 ETag
+응답은 항상 JSON 이다 (browsable API 없음). GET/HEAD 가 아닌 요청은 sync_view 로 넘기므로
+같은 URL 의 쓰기 API 와 OPTIONS 응답은 동기 API 와 같다.
+"""
+from typing import Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, PermissionDenied
+from rest_framework.renderers import JSONRenderer
+
+from common.mixins import ConditionalGetMixin, NotModified, etag_matches, validator_etag
+
+
+class AsyncApiView(View):
+    """
+    async 읽기 API 기반 클래스
+
+    For example:
+
+        class LocationListAsyncApi(AsyncApiView):
+            login_required = True
+            sync_view = LocationListApi.as_view()
+
+            async def get(self, request):
+                await self.acheck_not_modified(location_list(filters=filters))
+
+                locations = await alocation_list(filters=filters)
+                return self.render(compile_serializer(LocationListApi.OutputSerializer).many(locations))
+    """
+
+    login_required = False
+    # GET/HEAD 외 메서드를 처리할 동기 API (XxxApi.as_view())
+    sync_view = None
+    conditional_cache_control: Dict[str, bool] = ConditionalGetMixin.conditional_cache_control
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # CSRF 는 APIView 처럼 sync_view 쪽 SessionAuthentication 이 검사한다
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') and self.sync_view is not None:
+            # 클래스 속성의 뷰 함수는 인스턴스에서 읽으면 메서드로 묶이므로 클래스에서 읽는다
+            return await sync_to_async(type(self).sync_view)(request, *args, **kwargs)
+
+        self.user = await self.aget_user(request)
+        self._etag: Optional[str] = None
+        try:
+            if self.login_required and not self.user.is_authenticated:
+                # SessionAuthentication 은 WWW-Authenticate 헤더가 없으므로 DRF 도 401 대신 403 으로 응답한다
+                raise PermissionDenied(NotAuthenticated.default_detail, code=NotAuthenticated.default_code)
+            response = await super().dispatch(request, *args, **kwargs)
+        except NotModified:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            response = self.render(detail, status=exc.status_code)
+
+        if self._etag and response.status_code in (200, 304):
+            response['ETag'] = self._etag
+            patch_cache_control(response, **self.conditional_cache_control)
+
+        return response
+
+    async def aget_user(self, request):
+        return await request.auser()
+
+    def render(self, data, status: int = status.HTTP_200_OK) -> HttpResponse:
+        return HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
+
+    def get_validator_aggregates(self) -> Dict:
+        return {'last_updated': Max('updated_at'), 'count': Count('pk')}
+
+    def get_validator_parts(self) -> List[str]:
+        return [self.request.get_full_path(), f'user={self.user.pk}']
+
+    def _set_etag(self, values: Dict) -> None:
+        self._etag = validator_etag(self.get_validator_parts(), values)
+        if etag_matches(self.request, self._etag):
+            raise NotModified()
+
+    async def acheck_not_modified(self, queryset: QuerySet) -> None:
+        """ConditionalGetMixin.check_not_modified 의 async 버전"""
+        self._set_etag(await queryset.order_by().aaggregate(**self.get_validator_aggregates()))
+
+    def check_object_not_modified(self, obj: Model) -> None:
+        self._set_etag({'pk': obj.pk, 'last_updated': obj.updated_at})
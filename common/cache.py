@@ -0,0 +1,111 @@
+import hashlib
+import time
+from functools import wraps
+from typing import Sequence
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+# 공개 페이지 캐시 세대 - common.signals 에서 관련 모델 저장/삭제가 커밋되면 올린다
+PAGE_CACHE_GENERATIONS = {
+    'events.Event': ('events',),
+    'locations.Location': ('events',),
+    'presentations.Presentation': ('presentations',),
+    'users.User': ('users',),
+}
+# 페이지에 일부 필드만 보이는 모델 - update_fields 로 저장할 때 이 필드가 없으면 세대를 올리지 않는다
+# (로그인마다 last_login 을 저장하는 사용자 모델 등)
+PAGE_CACHE_FIELDS = {
+    'users.User': ('username',),
+}
+PAGE_CACHE_TIMEOUT = 600
+
+
+def _version_key(name: str) -> str:
+    return f'cache_version:{name}'
+
+
+def cache_version_get(*, name: str) -> int:
+    """
+    이름별 캐시 세대 번호
+
+    캐시 키에 세대 번호를 넣어 두면, 번호를 올리는 것만으로
+    해당 이름의 캐시 항목을 한 번에 무효화할 수 있다.
+    """
+    return cache.get_or_set(_version_key(name), 1, timeout=None)
+
+
+def cache_version_bump(*, name: str) -> None:
+    """세대 번호를 올려 이전 세대의 캐시 항목을 모두 무효화한다"""
+    key = _version_key(name)
+    if not cache.add(key, 2, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # get 과 incr 사이에 만료/삭제된 경우
+            cache.set(key, 2, timeout=None)
+
+
+def public_page_cache(*, generations: Sequence[str] = (), timeout: int = PAGE_CACHE_TIMEOUT):
+    """
+    비로그인 GET 요청용 페이지 캐시 (쿼리스트링을 읽지 않는 뷰 전용)
+
+    페이지 본문을 만들 때의 세대 번호와 함께 저장해 두고, 세대 번호가 그대로면
+    cache.get_many 한 번으로 응답한다. ETag/Last-Modified 를 붙이므로 브라우저의
+    재검증 요청에는 304 를 돌려준다. 로그인 사용자, CSRF 토큰을 쓴 페이지,
+    쿠키를 설정하는 응답은 캐시하지 않는다.
+
+    For example:
+
+        @public_page_cache(generations=['events'])
+        def events(request):
+            ...
+    """
+    version_keys = [_version_key(name) for name in generations]
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+
+            page_key = 'page:' + hashlib.md5(request.path.encode()).hexdigest()
+            cached = cache.get_many([page_key, *version_keys])
+            entry = cached.get(page_key)
+            versions = [cached.get(key) for key in version_keys]
+
+            if entry is None or None in versions or entry['versions'] != versions:
+                # 렌더링 도중 세대가 바뀌어도 다음 요청에서 다시 만들도록 렌더링 전에 읽는다
+                versions = [cache_version_get(name=name) for name in generations]
+                response = view(request, *args, **kwargs)
+                if (
+                    response.status_code != 200
+                    or response.cookies
+                    or request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+                ):
+                    return response
+
+                entry = {
+                    'versions': versions,
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'etag': quote_etag(hashlib.md5(response.content).hexdigest()),
+                    'last_modified': int(time.time()),
+                }
+                cache.set(page_key, entry, timeout)
+
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+            response['ETag'] = entry['etag']
+            response['Last-Modified'] = http_date(entry['last_modified'])
+            patch_cache_control(response, no_cache=True)
+            patch_vary_headers(response, ('Cookie',))
+
+            return get_conditional_response(
+                request, etag=entry['etag'], last_modified=entry['last_modified'], response=response
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,159 @@
+"""
+파일 다운로드 응답 - Range/If-Range, 내용 해시 ETag, 웹 서버 오프로드
+
+  - ETag 는 파일 내용의 SHA-256 (강한 검증자) 이라 If-None-Match 는 304, If-Range 가 같으면
+    Range 요청에 206 으로 이어 받기를 허용한다. If-Range 가 다르면(파일이 바뀌었으면) 전체를 보낸다.
+  - 크기/해시는 모델에 저장된 값을 받으므로 요청마다 stat 하지 않는다.
+  - FILE_DOWNLOAD_OFFLOAD 가 'x-sendfile'(Apache mod_xsendfile, lighttpd) 또는
+    'x-accel-redirect'(nginx) 면 본문 없이 헤더만 돌려주고 웹 서버가 파일과 Range 를 처리한다.
+    nginx 는 FILE_DOWNLOAD_ACCEL_PREFIX 를 MEDIA_ROOT 로 alias 한 internal location 이 필요하다.
+  - 오프로드가 없으면 FileResponse 로 보낸다. 범위만큼 읽히는 파일 객체를 넘기므로
+    wsgi.file_wrapper 가 있는 서버(gunicorn 등)는 os.sendfile 로 범위만 커널에서 바로 보낸다.
+    (WSGI 뷰는 소켓에 직접 접근할 수 없어 sendfile 은 서버의 file_wrapper 를 통해서만 쓴다.)
+
+Range 는 한 구간만 지원한다 (여러 구간 요청은 RFC 9110 에 따라 무시하고 전체를 보낸다).
+"""
+import hashlib
+import io
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.files import File
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import content_disposition_header
+
+from common.mixins import etag_matches
+
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def file_digest(file: File) -> Tuple[str, int]:
+    """(SHA-256 hex, 크기) - 파일을 한 번 읽는다"""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in file.chunks(DOWNLOAD_BLOCK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    'bytes=start-end' 를 (start, end) 로 (end 포함). 형식이 틀리거나 여러 구간이면 None (전체 응답).
+
+    만족할 수 없는 구간이면 ValueError.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == '':
+        return None
+    first, last = match.groups()
+    if first == '':
+        # bytes=-N : 마지막 N 바이트
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+class RangeFile:
+    """
+    start 부터 length 바이트만 읽히는 파일 객체
+
+    FileResponse 는 seek(0, SEEK_END) 로 Content-Length 를 구하므로 끝을 범위 끝으로 보이게 하고,
+    wsgi.file_wrapper 의 sendfile 은 fileno 의 현재 위치부터 Content-Length 만큼 보낸다.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        self.file = file
+        self.start = start
+        self.end = start + length
+        self.file.seek(start)
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self.end - self.file.tell()
+        if remaining <= 0:
+            return b''
+        return self.file.read(remaining if size < 0 else min(size, remaining))
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_END:
+            return self.file.seek(self.end + offset)
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _offload_response(field_file, *, filename: str) -> Optional[HttpResponse]:
+    offload = settings.FILE_DOWNLOAD_OFFLOAD
+    if not offload:
+        return None
+
+    response = HttpResponse()
+    if offload == 'x-sendfile':
+        response['X-Sendfile'] = field_file.path
+    elif offload == 'x-accel-redirect':
+        # 저장소 이름이 아니라 MEDIA_ROOT 기준 실제 경로 (내용 주소 저장소는 둘이 다르다)
+        path = Path(field_file.path).relative_to(field_file.storage.location)
+        response['X-Accel-Redirect'] = settings.FILE_DOWNLOAD_ACCEL_PREFIX + path.as_posix()
+    else:
+        raise ValueError(f'알 수 없는 FILE_DOWNLOAD_OFFLOAD: {offload}')
+    # Content-Type 은 웹 서버가 파일 확장자로 정한다
+    del response['Content-Type']
+    response['Content-Disposition'] = content_disposition_header(True, filename)
+    return response
+
+
+def file_download_response(request, field_file, *, filename: str, sha256: str, size: int) -> HttpResponse:
+    """
+    저장된 파일(FieldFile)의 다운로드 응답
+
+    sha256/size 는 모델에 저장해 둔 값 (file_digest 로 계산).
+    """
+    etag = f'"{sha256}"'
+
+    if etag_matches(request, etag):
+        response = HttpResponse(status=304)
+    elif (response := _offload_response(field_file, filename=filename)) is None:
+        byte_range = None
+        range_header = request.headers.get('Range')
+        if range_header and request.headers.get('If-Range', etag) == etag:
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        start, end = byte_range or (0, size - 1)
+        file = field_file.storage.open(field_file.name, 'rb')
+        response = FileResponse(
+            RangeFile(file, start, end - start + 1),
+            as_attachment=True,
+            filename=filename,
+            status=206 if byte_range else 200,
+        )
+        response.block_size = DOWNLOAD_BLOCK_SIZE
+        if byte_range:
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    response['ETag'] = etag
+    response['Accept-Ranges'] = 'bytes'
+    # 로그인 사용자만 받을 수 있으므로 공유 캐시에는 두지 않고, 쓸 때마다 ETag 로 재검증한다
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
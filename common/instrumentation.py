@@ -0,0 +1,284 @@
+"""
+요청별 성능 계측
+
+InstrumentationMiddleware 가 요청마다 RequestMetrics 를 만들어 두면
+  - SQL 쿼리 수/총 DB 시간: connection.execute_wrapper
+  - 직렬화 시간: DRF BaseSerializer.data, compile_serializer().many()
+  - 템플릿 렌더링 시간: django Template.render
+가 그 요청에 기록된다. 결과는 URL 이름(resolver_match.view_name, 예: 'locations:list') 별
+히스토그램에 누적하고, settings.SERVER_TIMING_HEADER 가 켜져 있으면(기본값은 DEBUG) Server-Timing
+헤더로도 내보낸다. 쿼리 수와 내부 처리 시간이 드러나므로 운영에서는 끈다.
+
+settings.QUERY_BUDGETS 에 URL 이름별 쿼리 수 상한을 적어 두면 초과한 요청을
+경고 로그로 남기고, 테스트에서는 query_budget 픽스처로 검사할 수 있다.
+"""
+import bisect
+import contextvars
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (마지막 버킷은 그 이상 전부)
+DURATION_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_current_metrics: contextvars.ContextVar[Optional['RequestMetrics']] = contextvars.ContextVar(
+    'request_metrics', default=None
+)
+
+
+@dataclass
+class RequestMetrics:
+    """요청 하나의 계측값 (시간은 초 단위)"""
+
+    queries: int = 0
+    db_time: float = 0.0
+    serializer_time: float = 0.0
+    template_time: float = 0.0
+    total_time: float = 0.0
+    # 직렬화/렌더링이 중첩 호출될 때 바깥 호출만 재기 위한 깊이
+    _depth: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def server_timing(self) -> str:
+        return ', '.join([
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+            f'serializer;dur={self.serializer_time * 1000:.2f}',
+            f'template;dur={self.template_time * 1000:.2f}',
+            f'total;dur={self.total_time * 1000:.2f}',
+        ])
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current_metrics.get()
+
+
+@contextmanager
+def measure(kind: str) -> Iterator[None]:
+    """
+    현재 요청의 '<kind>_time' 에 걸린 시간을 더한다. 계측 중이 아니면 아무것도 하지 않는다.
+
+    For example:
+
+        with measure('serializer'):
+            data = compile_serializer(self.OutputSerializer).many(users)
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    depth = metrics._depth.get(kind, 0)
+    metrics._depth[kind] = depth + 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._depth[kind] = depth
+        if depth == 0:
+            attr = f'{kind}_time'
+            setattr(metrics, attr, getattr(metrics, attr) + time.perf_counter() - started)
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+@contextmanager
+def collect_metrics() -> Iterator[RequestMetrics]:
+    """블록 안에서 실행된 쿼리/직렬화/렌더링을 새 RequestMetrics 에 기록한다"""
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    started = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.total_time = time.perf_counter() - started
+        _current_metrics.reset(token)
+
+
+def _install_query_wrapper(sender, connection, **kwargs):
+    # execute_wrapper() 컨텍스트는 끝에서 pop 하므로 맨 앞에 넣어 그 순서를 깨지 않는다
+    if _query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _query_wrapper)
+
+
+def _timed(kind: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with measure(kind):
+            return func(*args, **kwargs)
+
+    wrapper.__wrapped_for_metrics__ = True
+    return wrapper
+
+
+def instrument_render_paths() -> None:
+    """
+    SQL 실행, DRF 직렬화, Django 템플릿 렌더링에 계측을 건다 (CommonConfig.ready 에서 한 번 호출)
+
+    쿼리 계측은 연결이 열릴 때 붙여 두고 계측 중인 요청이 있을 때만 기록한다.
+    async ORM 은 요청 컨텍스트와 다른 연결 객체를 쓸 수 있어 요청 시작 시점에
+    연결을 골라 붙일 수 없다.
+    """
+    from django.db.backends.signals import connection_created
+    from django.template.base import Template
+    from rest_framework.serializers import BaseSerializer
+
+    connection_created.connect(_install_query_wrapper, dispatch_uid='common.instrumentation.query_wrapper')
+
+    if not getattr(Template.render, '__wrapped_for_metrics__', False):
+        Template.render = _timed('template', Template.render)
+
+    data = BaseSerializer.data
+    if not getattr(data.fget, '__wrapped_for_metrics__', False):
+        BaseSerializer.data = property(_timed('serializer', data.fget))
+
+
+class Histogram:
+    """고정 버킷 히스토그램 - 합계/개수와 버킷별 개수만 유지한다"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> Dict:
+        labels = [f'le_{bucket}' for bucket in self.buckets] + ['inf']
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """URL 이름별 히스토그램 (프로세스 메모리)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Histogram]] = {}
+
+    def record(self, *, endpoint: str, metrics: RequestMetrics) -> None:
+        with self._lock:
+            histograms = self._endpoints.get(endpoint)
+            if histograms is None:
+                histograms = self._endpoints[endpoint] = {
+                    'queries': Histogram(QUERY_COUNT_BUCKETS),
+                    'db_ms': Histogram(DURATION_BUCKETS_MS),
+                    'serializer_ms': Histogram(DURATION_BUCKETS_MS),
+                    'template_ms': Histogram(DURATION_BUCKETS_MS),
+                    'total_ms': Histogram(DURATION_BUCKETS_MS),
+                }
+            histograms['queries'].observe(metrics.queries)
+            histograms['db_ms'].observe(metrics.db_time * 1000)
+            histograms['serializer_ms'].observe(metrics.serializer_time * 1000)
+            histograms['template_ms'].observe(metrics.template_time * 1000)
+            histograms['total_ms'].observe(metrics.total_time * 1000)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict]]:
+        with self._lock:
+            return {
+                endpoint: {name: histogram.as_dict() for name, histogram in histograms.items()}
+                for endpoint, histograms in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+registry = MetricsRegistry()
+
+
+def query_budget_get(endpoint: str) -> Optional[int]:
+    return getattr(settings, 'QUERY_BUDGETS', {}).get(endpoint)
+
+
+def request_endpoint(request) -> Optional[str]:
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else None
+
+
+class InstrumentationMiddleware:
+    """
+    요청마다 쿼리 수, DB/직렬화/템플릿/전체 시간을 재서 URL 이름별 히스토그램에 기록하고
+    SERVER_TIMING_HEADER 가 켜져 있으면 Server-Timing 헤더로 내보낸다. 계측값은 request.metrics 로도
+    볼 수 있다.
+
+    ASGI 에서 async 뷰가 스레드 없이 처리되도록 async 체인도 지원한다. async ORM 쿼리는
+    sync_to_async 스레드에서 실행되지만 contextvar 가 복사되므로 같은 요청에 기록된다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with collect_metrics() as metrics:
+            request.metrics = metrics
+            # TemplateResponse/DRF Response 는 핸들러 안에서 렌더링되므로 계측 범위 안에 들어온다
+            response = self.get_response(request)
+
+        return self._record(request, response, metrics)
+
+    async def __acall__(self, request):
+        with collect_metrics() as metrics:
+            request.metrics = metrics
+            response = await self.get_response(request)
+
+        return self._record(request, response, metrics)
+
+    def _record(self, request, response, metrics: RequestMetrics):
+        if getattr(settings, 'SERVER_TIMING_HEADER', settings.DEBUG):
+            response['Server-Timing'] = metrics.server_timing()
+
+        endpoint = request_endpoint(request)
+        if endpoint is not None:
+            registry.record(endpoint=endpoint, metrics=metrics)
+
+            budget = query_budget_get(endpoint)
+            if budget is not None and metrics.queries > budget:
+                logger.warning(
+                    'Query budget exceeded for %s: %d queries (budget %d)', endpoint, metrics.queries, budget
+                )
+
+        return response
+
+
+def request_metrics_snapshot() -> List[Dict]:
+    """히스토그램 엔드포인트 응답 - 예산과 함께 URL 이름별로"""
+    return [
+        {'endpoint': endpoint, 'query_budget': query_budget_get(endpoint), **histograms}
+        for endpoint, histograms in registry.snapshot().items()
+    ]
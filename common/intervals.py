@@ -0,0 +1,67 @@
+from typing import Any, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class IntervalTree(Generic[T]):
+    """
+    정적 구간 트리
+
+    반열린 구간 [start, end) 목록으로 한 번 만들고, 주어진 구간과 겹치는 항목을
+    O(log n + k) 에 찾는다. 시작값으로 정렬한 배열을 암묵적 이진 트리로 보고
+    각 서브트리의 최대 end 를 저장해, 겹칠 수 없는 서브트리는 건너뛴다.
+
+    start/end 는 서로 비교 가능하기만 하면 된다 (int, time, datetime 등).
+
+    For example:
+
+        tree = IntervalTree([(time(9), time(11), 'a'), (time(13), time(15), 'b')])
+        tree.overlaps(time(10), time(14))  # ['a', 'b']
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, T]]):
+        self._items = sorted(intervals, key=lambda item: item[0])
+        self._max_end: List[Any] = [None] * len(self._items)
+        self._build(0, len(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, lo: int, hi: int) -> Optional[Any]:
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        max_end = self._items[mid][1]
+        for child_max in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child_max is not None and child_max > max_end:
+                max_end = child_max
+
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlaps(self, start: Any, end: Any) -> List[T]:
+        """[start, end) 와 겹치는 항목의 payload 목록 (시작값 순서 보장 없음)"""
+        result = []
+        stack = [(0, len(self._items))]
+
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+
+            mid = (lo + hi) // 2
+            # 이 서브트리에서 가장 늦게 끝나는 구간도 start 이전에 끝나면 볼 필요 없음
+            if self._max_end[mid] <= start:
+                continue
+
+            stack.append((lo, mid))
+
+            item_start, item_end, payload = self._items[mid]
+            # 오른쪽 서브트리는 시작값이 더 크므로 mid 가 end 이후에 시작하면 모두 제외
+            if item_start < end:
+                if item_end > start:
+                    result.append(payload)
+                stack.append((mid + 1, hi))
+
+        return result
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from common.sessions import session_purge_expired
+
+
+class Command(BaseCommand):
+    help = '만료된 세션 행을 배치로 지웁니다. cron 등으로 주기적으로 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 지울 행 수 (기본 1000)')
+
+    def handle(self, *args, batch_size, **options):
+        deleted = session_purge_expired(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f'만료된 세션 {deleted}개를 지웠습니다.'))
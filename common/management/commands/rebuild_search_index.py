@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from common.search import SEARCH_FIELDS, search_backend
+
+
+class Command(BaseCommand):
+    help = '전문 검색 인덱스를 원본 테이블 기준으로 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', dest='labels', action='append',
+            help=f'특정 모델만 다시 색인 (여러 번 지정 가능, 예: {next(iter(SEARCH_FIELDS))})'
+        )
+
+    def handle(self, *args, labels=None, **options):
+        labels = labels or list(SEARCH_FIELDS)
+        unknown = set(labels) - set(SEARCH_FIELDS)
+        if unknown:
+            raise CommandError(f"검색 대상이 아닌 모델입니다: {', '.join(sorted(unknown))}")
+
+        backend = search_backend()
+        for label in labels:
+            backend.rebuild(model=apps.get_model(label))
+            self.stdout.write(f'{label} 색인 완료')
+
+        self.stdout.write(self.style.SUCCESS(f'{len(labels)}개 모델의 검색 인덱스를 다시 만들었습니다.'))
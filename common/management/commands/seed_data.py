@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.seeding import seed_data
+
+
+class Command(BaseCommand):
+    help = '대용량 합성 데이터를 bulk_create 로 만듭니다 (scale=1 기준 등록 1만 건).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale', type=float, default=1,
+            help='기준 행 수에 곱할 배수 (예: 100 이면 등록 100만 건)'
+        )
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드 (같은 값이면 같은 데이터)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 한 번에 넣을 행 수')
+
+    def handle(self, *args, scale, seed, batch_size, **options):
+        if scale <= 0 or batch_size <= 0:
+            raise CommandError('--scale 과 --batch-size 는 0보다 커야 합니다.')
+
+        started = time.perf_counter()
+        result = seed_data(
+            scale=scale, seed=seed, batch_size=batch_size,
+            log=lambda message: self.stdout.write(f'{message} ({time.perf_counter() - started:.1f}s)'),
+        )
+
+        summary = ', '.join(f'{name} {count}' for name, count in result.counts.items())
+        self.stdout.write(self.style.SUCCESS(f'시드 완료: {summary} ({time.perf_counter() - started:.1f}s)'))
@@ -0,0 +1,136 @@
+"""
+마크다운 → 정제된 HTML
+
+python-markdown 과 nh3 가 있으면(pip install .[markdown]) 마크다운을 HTML 로 바꾼 뒤 허용한 태그/속성만
+남긴다. 없으면 마크다운 문법 없이 이스케이프한 문단(linebreaks)으로 보여 준다.
+
+렌더링 결과는 모델에 내용 해시, 렌더러 버전과 함께 저장해 두고(Presentation.content_html), 여기서는
+프로세스마다 (렌더러 버전, 내용 해시) → HTML 을 MARKDOWN_LRU_SIZE 개까지 기억한다.
+렌더러 버전(markdown_renderer_version)은 RENDERER_REVISION 과 라이브러리 버전으로 정해지므로,
+허용 태그나 확장을 바꿀 때는 RENDERER_REVISION 을 올린다. 버전이 바뀌면 저장된 HTML 은 읽을 때
+다시 렌더링되고, rerender_markdown 명령으로 한 번에 바꿀 수도 있다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cache
+from importlib.metadata import version
+from typing import Optional
+
+from django.conf import settings
+from django.utils.html import linebreaks
+
+# 허용 태그/속성이나 마크다운 확장을 바꾸면 올린다
+RENDERER_REVISION = 1
+
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists']
+ALLOWED_TAGS = {
+    'p', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'strong', 'em', 'del', 'code', 'pre', 'blockquote',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',
+    'a', 'img', 'abbr', 'sup',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'abbr': {'title'},
+    'code': {'class'},
+    'th': {'align'},
+    'td': {'align'},
+}
+URL_SCHEMES = {'http', 'https', 'mailto'}
+
+DEFAULTS = {
+    'MARKDOWN_LRU_SIZE': 512,
+}
+
+
+def _setting(name: str):
+    return getattr(settings, name, DEFAULTS[name])
+
+
+def _libraries():
+    try:
+        import markdown
+        import nh3
+    except ImportError:
+        return None
+    return markdown, nh3
+
+
+@cache
+def markdown_renderer_version() -> str:
+    """저장된 HTML 이 지금 렌더러로 만든 것인지 비교하는 값"""
+    if _libraries() is None:
+        return f'{RENDERER_REVISION}:plain'
+    return f"{RENDERER_REVISION}:markdown-{version('markdown')}:nh3-{version('nh3')}"
+
+
+def markdown_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def markdown_render(text: str) -> str:
+    """마크다운을 정제된 HTML 로 (캐시 없이)"""
+    libraries = _libraries()
+    if libraries is None:
+        return linebreaks(text, autoescape=True)
+    markdown, nh3 = libraries
+    html = markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=URL_SCHEMES,
+        link_rel='noopener noreferrer nofollow',
+    )
+
+
+class MarkdownLRU:
+    """(렌더러 버전, 내용 해시) → 정제된 HTML"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def set(self, key: str, html: str) -> None:
+        size = _setting('MARKDOWN_LRU_SIZE')
+        if size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+markdown_lru = MarkdownLRU()
+
+
+def markdown_html(text: str, digest: Optional[str] = None) -> str:
+    """
+    마크다운을 정제된 HTML 로 - 같은 내용은 프로세스마다 한 번만 렌더링한다.
+
+    digest 는 markdown_digest(text) (이미 구해 두었으면 넘긴다).
+    """
+    key = f'{markdown_renderer_version()}:{digest or markdown_digest(text)}'
+    html = markdown_lru.get(key)
+    if html is None:
+        html = markdown_render(text)
+        markdown_lru.set(key, html)
+    return html
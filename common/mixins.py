@@ -0,0 +1,97 @@
+import hashlib
+from typing import Dict, List, Optional
+
+from django.db.models import Count, Max, Model, QuerySet
+from django.utils.cache import patch_cache_control
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = ''
+
+
+def validator_etag(parts: List[str], values: Dict) -> str:
+    """검증값(경로/사용자 등)과 집계값으로 강한 ETag 를 만든다"""
+    parts = [*parts, *(f'{key}={values[key]}' for key in sorted(values))]
+    return '"{}"'.format(hashlib.md5('|'.join(parts).encode()).hexdigest())
+
+
+def etag_matches(request, etag: str) -> bool:
+    if_none_match = request.headers.get('If-None-Match', '')
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag in candidates or '*' in candidates
+
+
+class ConditionalGetMixin:
+    """
+    GET 응답에 ETag 를 붙이고, If-None-Match 가 같으면 직렬화 없이 304 로 끝낸다.
+
+    목록은 응답에 쓰일 queryset 의 max(updated_at) 과 행 수를 집계 쿼리 한 번으로 구해
+    검증값을 만든다. 행 추가/삭제는 행 수로, 수정은 updated_at 으로 드러난다.
+    상세는 이미 읽은 객체의 updated_at 을 그대로 쓴다. 검증값에는 경로/쿼리스트링과
+    요청 사용자가 섞이므로 사용자마다 다른 응답도 안전하다.
+
+    For example:
+
+        class LocationListApi(ConditionalGetMixin, APIView):
+            def get(self, request):
+                locations = location_list(filters=...)
+                self.check_not_modified(locations)
+
+                data = self.OutputSerializer(locations, many=True).data
+                return Response(data)
+    """
+
+    conditional_cache_control: Dict[str, bool] = {'private': True, 'no_cache': True}
+
+    def get_validator_aggregates(self) -> Dict:
+        """목록 검증값 집계식 - 관계 테이블 값이 응답에 보이면 재정의해 추가한다"""
+        return {'last_updated': Max('updated_at'), 'count': Count('pk')}
+
+    def get_validator_parts(self) -> List[str]:
+        return [self.request.get_full_path(), f'user={self.request.user.pk}']
+
+    def _set_etag(self, values: Dict) -> None:
+        self._etag: Optional[str] = validator_etag(self.get_validator_parts(), values)
+        if etag_matches(self.request, self._etag):
+            raise NotModified()
+
+    def check_not_modified(self, queryset: QuerySet) -> None:
+        """목록 - 클라이언트가 가진 ETag 가 최신이면 NotModified 를 발생시킨다"""
+        # 정렬은 집계 결과와 무관하므로 빼서 쿼리를 가볍게 한다
+        self._set_etag(queryset.order_by().aggregate(**self.get_validator_aggregates()))
+
+    def check_object_not_modified(self, obj: Model) -> None:
+        """상세 - 읽어 둔 객체의 updated_at 으로 검증 (추가 쿼리 없음)"""
+        self._set_etag({'pk': obj.pk, 'last_updated': obj.updated_at})
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        etag = getattr(self, '_etag', None)
+        if etag and request.method in ('GET', 'HEAD') and response.status_code in (200, 304):
+            response['ETag'] = etag
+            patch_cache_control(response, **self.conditional_cache_control)
+
+        return response
+
+
+class ConditionalListRetrieveMixin(ConditionalGetMixin):
+    """ModelViewSet 의 list/retrieve 에 ConditionalGetMixin 을 적용한다"""
+
+    def list(self, request, *args, **kwargs):
+        self.check_not_modified(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.check_object_not_modified(instance)
+        return Response(self.get_serializer(instance).data)
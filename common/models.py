@@ -11,3 +11,14 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class SessionTombstone(models.Model):
+    """
+    로그아웃으로 지운 세션 키 (common.sessions)
+
+    모아 둔 세션 변경은 워커 프로세스마다 따로라, 다른 워커의 flush 가 지운 세션을 되살리지 않도록
+    모든 워커가 같이 보는 DB 에 남긴다. 만료된 행은 purge_sessions 가 지운다.
+    """
+    session_key = models.CharField(max_length=40, primary_key=True)
+    expire_date = models.DateTimeField(db_index=True)
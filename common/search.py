@@ -0,0 +1,250 @@
+"""
+전문 검색 백엔드
+
+검색 대상 모델과 필드는 SEARCH_FIELDS 에 등록한다. 백엔드는 DB 종류에 따라 고른다.
+
+    - SQLite: FTS5 trigram 토크나이저 가상 테이블 (<db_table>_fts, rowid = pk)
+    - PostgreSQL: tsvector + pg_trgm GIN 인덱스
+    - 그 외: icontains OR 검색
+
+settings.SEARCH_BACKEND 에 클래스 경로를 지정하면 자동 선택 대신 그 백엔드를 쓴다.
+모든 백엔드의 filter() 는 클수록 관련도가 높은 search_rank 를 붙여 돌려주므로
+셀렉터는 백엔드와 무관하게 order_by('-search_rank', ...) 로 정렬하면 된다.
+"""
+from functools import reduce
+from operator import or_
+from typing import Dict, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db.models import FloatField, Model, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+SEARCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'locations.Location': ('name', 'address', 'description'),
+    'users.User': ('username', 'email', 'company'),
+    'presentations.Presentation': ('title', 'description'),
+}
+
+# trigram 인덱스는 3글자 이상부터 쓸 수 있다. 더 짧은 검색어는 icontains 로 처리
+MIN_TRIGRAM_LENGTH = 3
+
+
+def search_fields(model: Type[Model]) -> Tuple[str, ...]:
+    return SEARCH_FIELDS[model._meta.label]
+
+
+class SearchBackend:
+    """icontains OR 검색 - 기본 구현이자 짧은 검색어의 대체 경로"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def create_index(self, *, schema_editor, model: Type[Model]) -> None:
+        pass
+
+    def drop_index(self, *, schema_editor, model: Type[Model]) -> None:
+        pass
+
+    def rebuild(self, *, model: Type[Model]) -> None:
+        pass
+
+    def index_object(self, *, instance: Model) -> None:
+        pass
+
+    def remove_object(self, *, instance: Model) -> None:
+        pass
+
+    def filter(self, queryset: QuerySet, term: str) -> QuerySet:
+        condition = reduce(or_, [Q(**{f'{field}__icontains': term}) for field in search_fields(queryset.model)])
+        return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SqliteFtsSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 (trigram) 백엔드
+
+    trigram 토크나이저는 부분 문자열 검색을 지원하므로 icontains 와 같은 결과를
+    인덱스로 찾는다. 인덱스는 모델 저장/삭제 시그널로 행 단위 갱신한다.
+    """
+
+    def _table(self, model: Type[Model]) -> str:
+        return f'{model._meta.db_table}_fts'
+
+    def _columns(self, model: Type[Model]) -> str:
+        quote = self.connection.ops.quote_name
+        return ', '.join(quote(model._meta.get_field(field).column) for field in search_fields(model))
+
+    def create_index(self, *, schema_editor, model: Type[Model]) -> None:
+        table = self.connection.ops.quote_name(self._table(model))
+        schema_editor.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({self._columns(model)}, tokenize='trigram')")
+        self._copy_rows(model=model, execute=schema_editor.execute)
+
+    def drop_index(self, *, schema_editor, model: Type[Model]) -> None:
+        schema_editor.execute(f'DROP TABLE IF EXISTS {self.connection.ops.quote_name(self._table(model))}')
+
+    def _copy_rows(self, *, model: Type[Model], execute) -> None:
+        quote = self.connection.ops.quote_name
+        columns = self._columns(model)
+        execute(
+            f'INSERT INTO {quote(self._table(model))}(rowid, {columns}) '
+            f'SELECT {quote(model._meta.pk.column)}, {columns} FROM {quote(model._meta.db_table)}'
+        )
+
+    def rebuild(self, *, model: Type[Model]) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.connection.ops.quote_name(self._table(model))}')
+            self._copy_rows(model=model, execute=cursor.execute)
+
+    def index_object(self, *, instance: Model) -> None:
+        model = type(instance)
+        table = self.connection.ops.quote_name(self._table(model))
+        fields = search_fields(model)
+        values = [getattr(instance, field) or '' for field in fields]
+        placeholders = ', '.join(['%s'] * len(fields))
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [instance.pk])
+            cursor.execute(
+                f'INSERT INTO {table}(rowid, {self._columns(model)}) VALUES (%s, {placeholders})',
+                [instance.pk, *values]
+            )
+
+    def remove_object(self, *, instance: Model) -> None:
+        table = self.connection.ops.quote_name(self._table(type(instance)))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [instance.pk])
+
+    def filter(self, queryset: QuerySet, term: str) -> QuerySet:
+        if len(term) < MIN_TRIGRAM_LENGTH:
+            return super().filter(queryset, term)
+
+        model = queryset.model
+        quote = self.connection.ops.quote_name
+        table = quote(self._table(model))
+        # 큰따옴표로 감싼 문자열은 trigram 모드에서 부분 문자열 일치로 해석된다
+        match = '"{}"'.format(term.replace('"', '""'))
+
+        # 조인 대신 서브쿼리로 - 걸러진 queryset 이 order_by/values/페이지네이션과 그대로 조합된다.
+        # bm25() 는 MATCH 가 있는 쿼리 안에서만 부를 수 있으므로 행마다 rowid 로 찾는다.
+        rank = RawSQL(
+            f'SELECT -bm25({table}) FROM {table} WHERE {table} MATCH %s '
+            f'AND {table}.rowid = {quote(model._meta.db_table)}.{quote(model._meta.pk.column)}',
+            [match],
+            output_field=FloatField(),
+        )
+        return (
+            queryset
+            .filter(pk__in=RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', [match]))
+            .annotate(search_rank=rank)
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    PostgreSQL 백엔드
+
+    부분 문자열 검색은 pg_trgm GIN 인덱스가 icontains(UPPER ... LIKE) 를 받쳐 주고,
+    단어 검색은 'simple' 설정의 tsvector GIN 인덱스를 쓴다. 인덱스는 DB 가 관리하므로
+    행 단위 갱신이 필요 없다.
+    """
+
+    def _vector_sql(self, model: Type[Model]) -> str:
+        quote = self.connection.ops.quote_name
+        parts = " || ' ' || ".join(
+            f"COALESCE({quote(model._meta.get_field(field).column)}, '')" for field in search_fields(model)
+        )
+        return f"to_tsvector('simple'::regconfig, {parts})"
+
+    def create_index(self, *, schema_editor, model: Type[Model]) -> None:
+        quote = self.connection.ops.quote_name
+        table = model._meta.db_table
+
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for field in search_fields(model):
+            column = model._meta.get_field(field).column
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {quote(f"{table}_{column}_trgm")} '
+                f'ON {quote(table)} USING gin (UPPER({quote(column)}) gin_trgm_ops)'
+            )
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote(f"{table}_search_tsv")} '
+            f'ON {quote(table)} USING gin (({self._vector_sql(model)}))'
+        )
+
+    def drop_index(self, *, schema_editor, model: Type[Model]) -> None:
+        quote = self.connection.ops.quote_name
+        table = model._meta.db_table
+
+        for field in search_fields(model):
+            column = model._meta.get_field(field).column
+            schema_editor.execute(f'DROP INDEX IF EXISTS {quote(f"{table}_{column}_trgm")}')
+        schema_editor.execute(f'DROP INDEX IF EXISTS {quote(f"{table}_search_tsv")}')
+
+    def filter(self, queryset: QuerySet, term: str) -> QuerySet:
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+        from django.db.models.functions import Greatest
+
+        fields = search_fields(queryset.model)
+        vector = SearchVector(*fields, config='simple')
+        query = SearchQuery(term, config='simple')
+        similarity = (
+            Greatest(*[TrigramWordSimilarity(term, field) for field in fields])
+            if len(fields) > 1 else TrigramWordSimilarity(term, fields[0])
+        )
+
+        condition = reduce(or_, [Q(**{f'{field}__icontains': term}) for field in fields])
+        return (
+            queryset
+            .annotate(search_vector=vector)
+            .filter(condition | Q(search_vector=query))
+            .annotate(search_rank=SearchRank(vector, query) + similarity)
+        )
+
+
+def search_backend(connection=None) -> SearchBackend:
+    """설정 또는 DB 종류에 맞는 검색 백엔드"""
+    connection = connection or default_connection
+
+    backend_path: Optional[str] = getattr(settings, 'SEARCH_BACKEND', None)
+    if backend_path:
+        return import_string(backend_path)(connection)
+
+    if connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 34, 0):
+        return SqliteFtsSearchBackend(connection)
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend(connection)
+    return SearchBackend(connection)
+
+
+def search_filter(queryset: QuerySet, term: str) -> QuerySet:
+    """
+    queryset 을 검색어로 거르고 search_rank 를 붙인다.
+
+    For example:
+
+        qs = search_filter(Location.objects.all(), '마루180').order_by('-search_rank', 'name')
+    """
+    return search_backend().filter(queryset, term)
+
+
+def search_index_migration(app_label: str, model_name: str):
+    """
+    검색 인덱스 생성/삭제 마이그레이션 작업
+
+    For example:
+
+        operations = [search_index_migration('locations', 'Location')]
+    """
+    from django.db import migrations
+
+    def forwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        search_backend(schema_editor.connection).create_index(schema_editor=schema_editor, model=model)
+
+    def backwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        search_backend(schema_editor.connection).drop_index(schema_editor=schema_editor, model=model)
+
+    return migrations.RunPython(forwards, backwards)
@@ -0,0 +1,272 @@
+"""
+대용량 합성 데이터 시드 (seed_data 명령)
+
+모델 객체를 메모리에서 만들어 bulk_create 로 batch_size 개씩 넣는다. FK 는 앞 단계에서
+넣은 행의 id 풀에서 고른다. 값은 아래 단어 목록에서 고정 시드 난수로 고르므로 같은 인자로
+실행하면 같은 데이터가 만들어진다.
+
+bulk_create 는 save()/post_save 를 거치지 않으므로 마지막에
+  - 이벤트 대시보드 카운터를 실제 행 수와 맞추고
+  - 검색 인덱스를 다시 만들고
+  - 공개 페이지/장소 검색 캐시 세대를 올린다.
+
+운영 환경에서도 실행하므로 테스트 팩토리(factory-boy, dev 의존성)는 쓰지 않는다.
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from typing import Callable, Dict, Iterator, List, Sequence, Type
+
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.db import models, transaction
+from django.db.models import Max
+
+from common.cache import PAGE_CACHE_GENERATIONS, cache_version_bump
+from common.search import SEARCH_FIELDS, search_backend
+from events.models import Event, EventRegistration
+from events.services import event_counters_reconcile
+from locations.models import Location
+from locations.services import location_schedule_cache_invalidate
+from presentations.models import Presentation, PresentationComment
+from users.models import User
+
+# scale=1 기준 행 수 (이벤트당 등록 50건 - scale=100 이면 등록 100만 건)
+BASE_COUNTS = {
+    User: 1_000,
+    Location: 50,
+    Event: 200,
+    EventRegistration: 10_000,
+    Presentation: 400,
+    PresentationComment: 1_000,
+}
+
+# 사용자 유형 비율 - 정회원은 발표자/추천인 풀이 된다
+USER_TYPE_WEIGHTS = {
+    User.UserType.NON_MEMBER: 50,
+    User.UserType.ASSOCIATE: 20,
+    User.UserType.REGULAR: 30,
+}
+
+SEED_PASSWORD = 'seedpass123'
+FIRST_EVENT_DAY = date(2030, 1, 1)
+EVENT_SLOTS = ((time(10, 0), time(12, 0)), (time(14, 0), time(16, 0)), (time(19, 0), time(21, 0)))
+
+# 합성 값 재료
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_NAMES = ('민준', '서연', '도윤', '하은', '지호', '수아', '예준', '지우', '시우', '서윤', '현우', '지민')
+COMPANIES = ('파이썬랩', '데이터웍스', '클라우드나인', '코드팩토리', '오픈소스컴퍼니', '스타트업허브', '테크스퀘어')
+CHANNELS = ('친구 추천', '링크드인', '웹사이트', '뉴스레터', '밋업 페이지', '트위터')
+ADDRESSES = ('서울시 강남구 테헤란로', '서울시 마포구 양화로', '성남시 분당구 판교역로', '서울시 성동구 왕십리로')
+WORDS = (
+    '파이썬', '장고', '비동기', '타입 힌트', '테스트', '성능', '데이터', '배포', '캐시', '검색',
+    '패키지', '커뮤니티', '웹 프레임워크', '프로파일링', '자동화', '머신러닝', '데이터베이스', '리팩터링',
+)
+
+
+@dataclass
+class SeedResult:
+    counts: Dict[str, int]
+
+
+def _chunks(total: int, batch_size: int) -> Iterator[range]:
+    for start in range(0, total, batch_size):
+        yield range(start, min(start + batch_size, total))
+
+
+def _max_id(model: Type[models.Model]) -> int:
+    return model.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+
+
+def _bulk_insert(
+    *,
+    model: Type[models.Model],
+    total: int,
+    batch_size: int,
+    build: Callable[[int], models.Model],
+) -> List[int]:
+    """build(n) 으로 만든 객체를 batch_size 개씩 넣고, 새로 넣은 행의 id 를 돌려준다"""
+    before = _max_id(model)
+    for chunk in _chunks(total, batch_size):
+        model.objects.bulk_create([build(n) for n in chunk], batch_size=batch_size)
+    return list(model.objects.filter(id__gt=before).order_by('id').values_list('id', flat=True))
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+
+
+def _phone(rng: random.Random) -> str:
+    return f'010-{rng.randrange(10_000):04d}-{rng.randrange(10_000):04d}'
+
+
+def _sentence(rng: random.Random, words: int = 8) -> str:
+    return ' '.join(rng.choices(WORDS, k=words)) + '.'
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return ' '.join(_sentence(rng) for _ in range(sentences))
+
+
+def seed_data(*, scale: float = 1, seed: int = 42, batch_size: int = 5000, log=None) -> SeedResult:
+    """
+    BASE_COUNTS x scale 만큼 사용자/장소/이벤트/등록/발표/댓글을 만든다.
+
+    For example:
+
+        seed_data(scale=100)  # 등록 100만 건
+    """
+    log = log or (lambda message: None)
+    rng = random.Random(seed)
+    counts = {model: max(1, int(count * scale)) for model, count in BASE_COUNTS.items()}
+    # 같은 DB 에 여러 번 시드해도 unique 값(이메일/사용자명/장소명)이 겹치지 않도록
+    run = _max_id(User)
+
+    password = make_password(SEED_PASSWORD)
+    user_types = rng.choices(list(USER_TYPE_WEIGHTS), weights=list(USER_TYPE_WEIGHTS.values()), k=counts[User])
+    # 작은 scale 에서도 발표자/추천인으로 쓸 정회원이 한 명은 있어야 한다
+    user_types[0] = User.UserType.REGULAR
+
+    def build_user(n: int) -> User:
+        return User(
+            username=f'seed{run}-user{n}',
+            email=f'seed{run}-user{n}@example.com',
+            user_type=user_types[n],
+            password=password,
+        )
+
+    with transaction.atomic():
+        user_ids = _bulk_insert(model=User, total=counts[User], batch_size=batch_size, build=build_user)
+    regular_ids = [user_id for user_id, user_type in zip(user_ids, user_types) if user_type == User.UserType.REGULAR]
+    # 준회원은 정회원 추천으로 가입한 것으로 본다
+    with transaction.atomic():
+        associates = User.objects.filter(id__in=user_ids, user_type=User.UserType.ASSOCIATE).only('id')
+        associates = list(associates)
+        for user in associates:
+            user.referrer_id = rng.choice(regular_ids)
+        User.objects.bulk_update(associates, ['referrer'], batch_size=batch_size)
+    log(f'User {len(user_ids)}')
+
+    with transaction.atomic():
+        location_ids = _bulk_insert(
+            model=Location, total=counts[Location], batch_size=batch_size,
+            build=lambda n: Location(
+                name=f'시드{run}-장소{n}',
+                address=f'{rng.choice(ADDRESSES)} {rng.randint(1, 500)}',
+                description=_paragraph(rng, 2),
+                max_capacity=rng.randint(10, 300),
+            ),
+        )
+    log(f'Location {len(location_ids)}')
+
+    # 장소마다 하루 3개 시간대를 차례로 채워 중복 예약이 생기지 않게 한다
+    slots_per_day = len(location_ids) * len(EVENT_SLOTS)
+
+    def build_event(n: int) -> Event:
+        day, slot = divmod(n, slots_per_day)
+        location_index, slot_index = divmod(slot, len(EVENT_SLOTS))
+        start_time, end_time = EVENT_SLOTS[slot_index]
+        return Event(
+            title=f'{rng.choice(WORDS)} 밋업 {n}',
+            description=_paragraph(rng, 4),
+            event_date=FIRST_EVENT_DAY + timedelta(days=day),
+            start_time=start_time,
+            end_time=end_time,
+            location_id=location_ids[location_index],
+            max_participants=rng.randint(10, 100),
+            created_by_id=rng.choice(user_ids),
+        )
+
+    with transaction.atomic():
+        event_ids = _bulk_insert(model=Event, total=counts[Event], batch_size=batch_size, build=build_event)
+    log(f'Event {len(event_ids)}')
+
+    # 정원까지는 확정, 넘으면 대기자
+    capacity = dict(Event.objects.filter(id__in=event_ids).values_list('id', 'max_participants'))
+    claimed: Dict[int, int] = dict.fromkeys(event_ids, 0)
+
+    def build_registration(n: int) -> EventRegistration:
+        event_id = event_ids[n % len(event_ids)]
+        claimed[event_id] += 1
+        return EventRegistration(
+            event_id=event_id,
+            name=_name(rng),
+            email=f'seed{run}-guest{n}@example.com',
+            phone=_phone(rng),
+            company=rng.choice(COMPANIES),
+            how_did_you_know=rng.choice(CHANNELS),
+            status=(
+                EventRegistration.Status.CONFIRMED if claimed[event_id] <= capacity[event_id]
+                else EventRegistration.Status.WAITLISTED
+            ),
+            # 약 30% 는 회원 등록
+            user_id=rng.choice(user_ids) if rng.random() < 0.3 else None,
+        )
+
+    with transaction.atomic():
+        registration_ids = _bulk_insert(
+            model=EventRegistration, total=counts[EventRegistration], batch_size=batch_size, build=build_registration,
+        )
+    log(f'EventRegistration {len(registration_ids)}')
+
+    presentation_statuses = list(Presentation.Status)
+
+    def build_presentation(n: int) -> Presentation:
+        presentation = Presentation(
+            title=f'{rng.choice(WORDS)} 실전: {rng.choice(WORDS)}',
+            description=_paragraph(rng, 3),
+            content_md='\n\n'.join(
+                [f'## {rng.choice(WORDS)}', _paragraph(rng, 5), f'- {_sentence(rng, 4)}\n- {_sentence(rng, 4)}']
+            ),
+            status=rng.choice(presentation_statuses),
+            presenter_id=rng.choice(regular_ids),
+            event_id=rng.choice(event_ids),
+        )
+        # bulk_create 는 save() 를 거치지 않으므로 렌더링한 HTML 을 직접 채운다
+        presentation.content_html_set()
+        return presentation
+
+    with transaction.atomic():
+        presentation_ids = _bulk_insert(
+            model=Presentation, total=counts[Presentation], batch_size=batch_size, build=build_presentation,
+        )
+    log(f'Presentation {len(presentation_ids)}')
+
+    def build_comment(n: int) -> PresentationComment:
+        if rng.random() < 0.5:
+            author = {'user_id': rng.choice(user_ids), 'guest_name': ''}
+        else:
+            author = {'guest_name': f'손님{n}'}
+        return PresentationComment(
+            presentation_id=rng.choice(presentation_ids), content=_paragraph(rng, 2), **author
+        )
+
+    with transaction.atomic():
+        comment_ids = _bulk_insert(
+            model=PresentationComment, total=counts[PresentationComment], batch_size=batch_size, build=build_comment,
+        )
+    log(f'PresentationComment {len(comment_ids)}')
+
+    _after_bulk_insert(event_ids=event_ids)
+
+    return SeedResult(counts={
+        'users': len(user_ids),
+        'locations': len(location_ids),
+        'events': len(event_ids),
+        'registrations': len(registration_ids),
+        'presentations': len(presentation_ids),
+        'comments': len(comment_ids),
+    })
+
+
+def _after_bulk_insert(*, event_ids: Sequence[int]) -> None:
+    """post_save 에 걸린 비정규화 값/색인/캐시를 한 번에 맞춘다"""
+    event_counters_reconcile(event_ids=event_ids)
+
+    backend = search_backend()
+    for label in SEARCH_FIELDS:
+        backend.rebuild(model=apps.get_model(label))
+
+    location_schedule_cache_invalidate()
+    for name in {name for names in PAGE_CACHE_GENERATIONS.values() for name in names}:
+        cache_version_bump(name=name)
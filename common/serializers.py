@@ -0,0 +1,182 @@
+"""
+컴파일된 출력 시리얼라이저
+
+Styleguide 의 OutputSerializer 는 필드 선언만 있는 plain Serializer 라서, 필드마다
+get_attribute/to_representation 을 거치는 DRF 의 일반 경로 대신 행 하나를 dict 로
+바꾸는 전용 함수를 만들어 쓸 수 있다. 출력 형식(None 처리, 날짜/시간 ISO 8601,
+UTC 의 'Z' 표기 등)은 DRF 와 같다.
+
+    data = compile_serializer(self.OutputSerializer).many(users)
+
+지원하지 않는 필드(중첩 시리얼라이저, 사용자 정의 필드 등)는 해당 필드만
+DRF 필드의 get_attribute/to_representation 으로 처리한다. SerializerMethodField 는
+context 없이 만든 시리얼라이저 인스턴스의 메서드를 호출하므로 context 를 쓰는
+시리얼라이저에는 적합하지 않다.
+"""
+import functools
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import SkipField
+from rest_framework.settings import api_settings
+
+from common.instrumentation import measure
+
+# DRF 의 is_simple_callable 처럼 인자 없는 메서드/함수는 호출한 값을 쓴다
+_CALLABLE_TYPES = (types.MethodType, types.FunctionType, functools.partial)
+
+
+def _current_timezone():
+    """DateTimeField.default_timezone 과 같은 값 - 요청마다 activate 될 수 있어 호출 시점에 구한다"""
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def _datetime_converter(field: serializers.DateTimeField) -> Optional[Callable[[Any, Any], Any]]:
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+
+    def convert(value, current_timezone):
+        field_timezone = field.timezone if hasattr(field, 'timezone') else current_timezone
+        if value.__class__ is str or not value or field_timezone is None or timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return convert
+
+
+def _isoformat_converter(field: serializers.Field, setting: str) -> Callable[[Any], Any]:
+    output_format = getattr(field, 'format', getattr(api_settings, setting))
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    def convert(value):
+        if value.__class__ is str or not value:
+            return field.to_representation(value)
+        return value.isoformat()
+
+    return convert
+
+
+def _boolean_converter(field: serializers.BooleanField) -> Callable[[Any], Any]:
+    def convert(value):
+        return value if value.__class__ is bool else field.to_representation(value)
+
+    return convert
+
+
+def _converter(field: serializers.Field) -> Callable[[Any], Any]:
+    """필드 클래스별 to_representation 과 같은 결과를 내는 변환 함수"""
+    field_type = type(field)
+    if field_type in (serializers.CharField, serializers.EmailField):
+        return str
+    if field_type is serializers.IntegerField:
+        return int
+    if field_type is serializers.FloatField:
+        return float
+    if field_type is serializers.BooleanField:
+        return _boolean_converter(field)
+    if field_type is serializers.DateField:
+        return _isoformat_converter(field, 'DATE_FORMAT')
+    if field_type is serializers.TimeField:
+        return _isoformat_converter(field, 'TIME_FORMAT')
+    if field_type is serializers.ReadOnlyField:
+        return None
+    return field.to_representation
+
+
+class CompiledSerializer:
+    """행 하나를 dict 로 바꾸는 생성 함수를 감싼 객체"""
+
+    def __init__(self, serializer_class: Type[serializers.Serializer]):
+        self.serializer_class = serializer_class
+        self.serializer = serializer_class()
+        self._to_representation = self._compile()
+
+    def _compile(self) -> Callable[[Any, Any], Dict[str, Any]]:
+        namespace: Dict[str, Any] = {'_CALLABLE_TYPES': _CALLABLE_TYPES, '_SkipField': SkipField}
+        lines = ['def to_representation(obj, current_timezone):', '    out = {}']
+
+        for index, (name, field) in enumerate(self.serializer.fields.items()):
+            if field.write_only:
+                continue
+
+            key = repr(name)
+
+            if isinstance(field, serializers.SerializerMethodField):
+                namespace[f'_method{index}'] = getattr(self.serializer, field.method_name)
+                lines.append(f'    out[{key}] = _method{index}(obj)')
+                continue
+
+            simple = (
+                field.source != '*'
+                and not isinstance(field, serializers.BaseSerializer)
+                and all(attr.isidentifier() for attr in field.source_attrs)
+                and (len(field.source_attrs) == 1 or field.allow_null)
+            )
+            if not simple:
+                # 일반 경로 - DRF 필드의 get_attribute/to_representation 그대로
+                namespace[f'_field{index}'] = field
+                lines += [
+                    '    try:',
+                    f'        value = _field{index}.get_attribute(obj)',
+                    '    except _SkipField:',
+                    '        pass',
+                    '    else:',
+                    f'        out[{key}] = None if value is None else _field{index}.to_representation(value)',
+                ]
+                continue
+
+            *parents, last = field.source_attrs
+            lines.append('    value = obj')
+            for attr in parents:
+                # 중간 객체가 None 이면 DRF 처럼 (allow_null) None
+                lines.append(f'    value = None if value is None else value.{attr}')
+            if parents:
+                lines.append(f'    value = None if value is None else value.{last}')
+            else:
+                lines.append(f'    value = value.{last}')
+            lines.append('    if value.__class__ in _CALLABLE_TYPES:')
+            lines.append('        value = value()')
+
+            datetime_converter = _datetime_converter(field) if type(field) is serializers.DateTimeField else None
+            converter = _converter(field)
+            if datetime_converter is not None:
+                namespace[f'_convert{index}'] = datetime_converter
+                lines.append(f'    out[{key}] = None if value is None else _convert{index}(value, current_timezone)')
+            elif converter is None:
+                lines.append(f'    out[{key}] = value')
+            else:
+                namespace[f'_convert{index}'] = converter
+                lines.append(f'    out[{key}] = None if value is None else _convert{index}(value)')
+
+        lines.append('    return out')
+        exec('\n'.join(lines), namespace)
+        return namespace['to_representation']
+
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        return self._to_representation(instance, _current_timezone())
+
+    def many(self, instances: Iterable[Any]) -> List[Dict[str, Any]]:
+        # 현재 타임존 조회(asgiref Local)가 행마다 반복되지 않도록 한 번만 구한다
+        to_representation, current_timezone = self._to_representation, _current_timezone()
+        with measure('serializer'):
+            return [to_representation(instance, current_timezone) for instance in instances]
+
+
+@functools.cache
+def compile_serializer(serializer_class: Type[serializers.Serializer]) -> CompiledSerializer:
+    """
+    OutputSerializer 를 컴파일한다. 클래스마다 한 번만 만들고 재사용한다.
+
+    For example:
+
+        data = compile_serializer(self.OutputSerializer).many(locations)
+    """
+    return CompiledSerializer(serializer_class)
@@ -1,13 +1,87 @@
-from typing import Any, Dict, List, Tuple
+import functools
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Type
 
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 from common.types import DjangoModelType
 
 
+@dataclass(frozen=True)
+class ModelMetadata:
+    """모델 클래스별로 한 번만 계산해 두는 필드 정보"""
+
+    fields_by_name: Dict[str, Any]
+    concrete_field_names: FrozenSet[str]
+    has_updated_at: bool
+    # 함께 검증해야 하는 필드 묶음 (unique_together, 여러 필드에 걸친 제약 조건)
+    field_groups: Tuple[FrozenSet[str], ...]
+
+    def validation_exclude(self, changed: Iterable[str]) -> Set[str]:
+        """
+        바뀐 필드만 검증하도록 full_clean 에 넘길 exclude.
+
+        바뀐 필드와 같은 unique_together/제약 조건에 묶인 필드는 남겨야
+        Django 가 해당 검사를 건너뛰지 않는다.
+        """
+        included = set(changed)
+        for group in self.field_groups:
+            if group & included:
+                included |= group
+        return set(self.concrete_field_names - included)
+
+
+@functools.cache
+def model_metadata(model: Type[models.Model]) -> ModelMetadata:
+    """
+    모델 메타데이터 레지스트리 - get_fields() 는 호출마다 목록을 새로 만들므로
+    클래스마다 한 번만 계산한다.
+    """
+    opts = model._meta
+    fields_by_name = {field.name: field for field in opts.get_fields()}
+
+    field_groups = [frozenset(group) for group in opts.unique_together]
+    for constraint in opts.constraints:
+        names = set(getattr(constraint, 'fields', ()))
+        condition = getattr(constraint, 'condition', None)
+        if condition is not None:
+            names |= _q_field_names(condition)
+        if len(names) > 1:
+            field_groups.append(frozenset(names))
+
+    return ModelMetadata(
+        fields_by_name=fields_by_name,
+        concrete_field_names=frozenset(field.name for field in opts.concrete_fields),
+        has_updated_at='updated_at' in fields_by_name,
+        field_groups=tuple(field_groups),
+    )
+
+
+def _q_field_names(q: models.Q) -> Set[str]:
+    """Q 조건이 참조하는 필드 이름 (F() 로 참조한 필드 포함)"""
+    names = set()
+    for child in q.children:
+        if isinstance(child, models.Q):
+            names |= _q_field_names(child)
+        elif isinstance(child, tuple):
+            lookup, value = child
+            names.add(lookup.split('__')[0])
+            if isinstance(value, models.F):
+                names.add(value.name.split('__')[0])
+    return names
+
+
 def model_update(
-    *, instance: DjangoModelType, fields: List[str], data: Dict[str, Any], auto_updated_at=True
+    *,
+    instance: DjangoModelType,
+    fields: List[str],
+    data: Dict[str, Any],
+    auto_updated_at=True,
+    validate_changed_only=True,
 ) -> Tuple[DjangoModelType, bool]:
     """
     Generic update service meant to be reused in local update services.
@@ -33,12 +107,15 @@ def model_update(
         - There's a strict assertion that all values in `fields` are actual fields in `instance`.
         - `fields` can support m2m fields, which are handled after the update on `instance`.
         - If `auto_updated_at` is True, we'll try bumping `updated_at` with the current timestmap.
+        - If `validate_changed_only` is True, `full_clean` only validates the changed fields
+          (plus fields sharing a unique_together/constraint with them), so unchanged unique
+          fields and foreign keys don't cost a query each. Model `clean()` always runs.
     """
     has_updated = False
     m2m_data = {}
     update_fields = []
 
-    model_fields = {field.name: field for field in instance._meta.get_fields()}
+    metadata = model_metadata(type(instance))
 
     for field in fields:
         # Skip if a field is not present in the actual data
@@ -46,7 +123,7 @@ def model_update(
             continue
 
         # If field is not an actual model field, raise an error
-        model_field = model_fields.get(field)
+        model_field = metadata.fields_by_name.get(field)
 
         assert model_field is not None, f"{field} is not part of {instance.__class__.__name__} fields."
 
@@ -66,11 +143,14 @@ def model_update(
             # We want to take care of the `updated_at` field,
             # Only if the models has that field
             # And if no value for updated_at has been provided
-            if "updated_at" in model_fields and "updated_at" not in update_fields:
+            if metadata.has_updated_at and "updated_at" not in update_fields:
                 update_fields.append("updated_at")
                 instance.updated_at = timezone.now()  # type: ignore
 
-        instance.full_clean()
+        if validate_changed_only:
+            instance.full_clean(exclude=metadata.validation_exclude(update_fields))
+        else:
+            instance.full_clean()
         # Update only the fields that are meant to be updated.
         # Django docs reference:
         # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
@@ -84,4 +164,166 @@ def model_update(
         # What if we only update m2m relations & nothing on the model? Is this still considered as updated?
         has_updated = True
 
-    return instance, has_updated
\ No newline at end of file
+    return instance, has_updated
+
+
+def _bulk_validate(*, model: Type[models.Model], changes: Dict[Any, Tuple[models.Model, List[str]]]) -> None:
+    """
+    바뀐 필드만 검증한다. 행마다 쿼리가 나가는 검사(unique, FK 존재 여부)는
+    필드마다 쿼리 한 번으로 모아서 한다.
+    """
+    metadata = model_metadata(model)
+    fields_by_name = metadata.fields_by_name
+    errors: Dict[Any, List[str]] = defaultdict(list)
+
+    batched_fields = {
+        name
+        for _, changed in changes.values()
+        for name in changed
+        if fields_by_name[name].unique or fields_by_name[name].is_relation
+    }
+
+    for pk, (instance, changed) in changes.items():
+        # FK 의 존재 여부 검사는 아래에서 한 번에 한다 (값이 없을 때의 null/blank 검사만 clean_fields 로)
+        exclude = [
+            name for name in metadata.concrete_field_names
+            if name not in changed
+            or (fields_by_name[name].is_relation and getattr(instance, fields_by_name[name].attname) is not None)
+        ]
+        try:
+            instance.clean_fields(exclude=exclude)
+            instance.clean()
+        except ValidationError as error:
+            errors[pk].extend(error.messages)
+
+    for name in sorted(batched_fields):
+        field = fields_by_name[name]
+        values = {
+            pk: getattr(instance, field.attname)
+            for pk, (instance, changed) in changes.items()
+            if name in changed and getattr(instance, field.attname) is not None
+        }
+        if not values:
+            continue
+
+        if field.is_relation:
+            existing = set(
+                field.remote_field.model._base_manager
+                .filter(**{f'{field.target_field.attname}__in': set(values.values())})
+                .values_list(field.target_field.attname, flat=True)
+            )
+            for pk, value in values.items():
+                if value not in existing:
+                    errors[pk].append(field.error_messages['invalid'] % {
+                        'model': field.remote_field.model._meta.verbose_name,
+                        'pk': value,
+                        'field': field.target_field.name,
+                        'value': value,
+                    })
+
+        if field.unique:
+            # 배치 밖의 행과의 중복은 쿼리 한 번, 배치 안의 중복은 메모리에서 찾는다
+            taken = set(
+                model._default_manager
+                .filter(**{f'{field.attname}__in': set(values.values())})
+                .exclude(pk__in=changes.keys())
+                .values_list(field.attname, flat=True)
+            )
+            taken.update(
+                getattr(instance, field.attname)
+                for pk, (instance, changed) in changes.items()
+                if name not in changed
+            )
+            seen = set()
+            for pk, value in values.items():
+                if value in taken or value in seen:
+                    errors[pk].append(field.error_messages['unique'] % {
+                        'model_name': model._meta.verbose_name,
+                        'field_label': field.verbose_name,
+                    })
+                seen.add(value)
+
+    if errors:
+        raise ValidationError({str(pk): messages for pk, messages in errors.items()})
+
+
+def model_bulk_update(
+    *,
+    instances: Sequence[DjangoModelType],
+    fields: List[str],
+    data_by_pk: Dict[Any, Dict[str, Any]],
+    auto_updated_at=True,
+    batch_size: int = 500,
+) -> Dict[Any, List[str]]:
+    """
+    model_update 의 여러 행 버전.
+
+    For example:
+
+    def user_bulk_set_type(*, users: QuerySet[User], user_type: str) -> Dict[int, List[str]]:
+        users = list(users)
+        data_by_pk = {user.pk: {'user_type': user_type} for user in users}
+        return model_bulk_update(instances=users, fields=['user_type'], data_by_pk=data_by_pk)
+
+    Return value: {pk: 실제로 바뀐 필드 목록} - 바뀐 행만 들어 있다.
+
+    Some important notes:
+
+        - `data_by_pk` 에 없는 행과, 값이 같은 필드는 건너뛴다 (인스턴스 값과 비교).
+        - 바뀐 필드만 clean_fields 로 검증하고 clean() 을 호출한다. unique 필드와 FK 존재 여부는
+          필드마다 쿼리 한 번으로 검사한다. 하나라도 실패하면 아무것도 쓰지 않고
+          {pk: [메시지]} 형태의 ValidationError 를 발생시킨다.
+        - 바뀐 필드 조합별로 bulk_update 를 batch_size 단위로 실행한다.
+        - bulk_update 는 post_save 를 보내지 않으므로, 검색 색인/페이지 캐시가 어긋나지 않도록
+          바뀐 행마다 update_fields 와 함께 post_save 를 직접 보낸다.
+        - m2m 필드는 지원하지 않는다.
+    """
+    if not instances:
+        return {}
+
+    model = type(instances[0])
+    metadata = model_metadata(model)
+
+    for field in fields:
+        model_field = metadata.fields_by_name.get(field)
+        assert model_field is not None, f"{field} is not part of {model.__name__} fields."
+        assert not model_field.many_to_many, f"{field} is a m2m field - not supported by model_bulk_update."
+
+    changes: Dict[Any, Tuple[DjangoModelType, List[str]]] = {}
+    for instance in instances:
+        data = data_by_pk.get(instance.pk)
+        if not data:
+            continue
+
+        changed = []
+        for field in fields:
+            if field in data and getattr(instance, field) != data[field]:
+                changed.append(field)
+                setattr(instance, field, data[field])
+
+        if changed:
+            changes[instance.pk] = (instance, changed)
+
+    if not changes:
+        return {}
+
+    _bulk_validate(model=model, changes=changes)
+
+    now = timezone.now()
+    groups: Dict[Tuple[str, ...], List[DjangoModelType]] = defaultdict(list)
+    for instance, changed in changes.values():
+        if auto_updated_at and metadata.has_updated_at and "updated_at" not in changed:
+            changed.append("updated_at")
+            instance.updated_at = now  # type: ignore
+        groups[tuple(changed)].append(instance)
+
+    for update_fields, group in groups.items():
+        model._default_manager.bulk_update(group, fields=update_fields, batch_size=batch_size)
+
+    for instance, changed in changes.values():
+        post_save.send(
+            sender=model, instance=instance, created=False, update_fields=frozenset(changed),
+            raw=False, using=instance._state.db,
+        )
+
+    return {pk: changed for pk, (_, changed) in changes.items()}
@@ -0,0 +1,360 @@
+"""
+3단 세션 저장소 (SESSION_ENGINE = 'common.sessions')
+
+  1) 프로세스 메모리 LRU - SESSION_LRU_SIZE 개, 항목당 SESSION_LRU_TTL 초
+  2) 공유 캐시 (SESSION_CACHE_ALIAS) - cached_db 와 같은 키/만료
+  3) DB (django_session) - 변경은 모아 두었다가 한 번에 upsert (write-behind)
+
+읽기는 LRU → 캐시 → 아직 DB 에 쓰지 않은 변경 → DB 순서로 찾는다. 내용이 바뀌지 않은
+세션은 저장하지 않는다. 새 세션 생성(키 중복 검사)과 삭제(로그아웃)는 DB 에 바로 반영한다.
+
+캐시는 워커 프로세스끼리 공유하고 쓰기가 O(1) 인 백엔드(Redis/Memcached)여야 한다. FileBasedCache 는
+쓸 때마다 디렉터리 전체를 훑어 세션 수에 비례하는 비용이 들고, 프로세스마다 따로인 LocMemCache 는
+다른 워커의 변경을 못 본다. 공유 캐시가 없으면 DummyCache 로 두어 캐시 계층을 건너뛴다 - 그때는
+다른 워커가 아직 DB 에 쓰지 않은 변경이 최대 SESSION_WRITE_BEHIND_DELAY 초 늦게 보인다.
+
+모아 둔 변경은 요청이 끝날 때 가장 오래된 변경이 SESSION_WRITE_BEHIND_DELAY 초를 넘었거나
+SESSION_WRITE_BEHIND_BATCH 건이 쌓였으면 내보낸다 (프로세스 종료 시에도). 그 사이 프로세스가
+죽으면 캐시에 남은 값으로 읽히고, 캐시까지 비면 마지막 변경을 잃는다.
+
+모아 둔 변경은 워커 프로세스마다 따로라, 다른 워커가 로그아웃으로 지운 세션을 flush 가 되살릴 수
+있다. 그래서 삭제는 DB 에 삭제 표시(SessionTombstone)를 남기고, flush 는 표시가 있는 세션을 쓰지
+않으며(캐시에서도 지운다) 쓴 뒤에도 다시 확인해 그 사이 지워진 세션을 지운다.
+
+LRU 는 워커 프로세스마다 따로라 다른 워커에서 로그아웃한 세션이 최대 SESSION_LRU_TTL 초
+동안 유효하게 보일 수 있으므로 TTL 은 짧게 둔다.
+
+만료된 행(삭제 표시 포함)은 purge_sessions 명령(또는 clearsessions)으로 배치 삭제한다.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, List, Optional, Set
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.signals import request_finished
+from django.utils import timezone
+
+from common.models import SessionTombstone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'SESSION_LRU_SIZE': 10_000,
+    'SESSION_LRU_TTL': 5,
+    'SESSION_WRITE_BEHIND_DELAY': 5,
+    'SESSION_WRITE_BEHIND_BATCH': 500,
+}
+
+
+def _setting(name: str):
+    return getattr(settings, name, DEFAULTS[name])
+
+
+class SessionLRU:
+    """세션 키 → 세션 데이터 (복사본을 넣고 꺼낸다)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    def get(self, session_key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(session_key)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[session_key]
+                return None
+            self._entries.move_to_end(session_key)
+            return dict(data)
+
+    def set(self, session_key: str, data: Dict) -> None:
+        size = _setting('SESSION_LRU_SIZE')
+        if size <= 0:
+            return
+        with self._lock:
+            self._entries[session_key] = (dict(data), time.monotonic() + _setting('SESSION_LRU_TTL'))
+            self._entries.move_to_end(session_key)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_key: str) -> None:
+        with self._lock:
+            self._entries.pop(session_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SessionWriteBehind:
+    """
+    DB 에 아직 쓰지 않은 세션 변경 - 같은 세션의 여러 번 저장은 마지막 것 하나로 합쳐진다.
+
+    같은 프로세스 안에서는 flush 와 delete 가 같은 락 안에서 실행된다. 다른 프로세스의 delete 는
+    DB 의 삭제 표시(mark_deleted)로 알 수 있으므로, flush 는 표시된 세션을 쓰지 않고
+    쓴 뒤 다시 확인해 그 사이 표시된 세션을 지운다. 삭제하는 쪽은 표시를 먼저 남기고 행을 지우므로
+    어느 순서로 겹쳐도 지운 세션이 DB 에 남지 않는다.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._pending: Dict[str, Session] = {}
+        self._oldest: Optional[float] = None
+
+    @property
+    def _cache(self):
+        return caches[settings.SESSION_CACHE_ALIAS]
+
+    def mark_deleted(self, session_key: str) -> None:
+        """지운 세션을 다른 프로세스의 flush 가 되살리지 않도록 표시한다 (행을 지우기 전에 부른다)"""
+        self.discard(session_key)
+        # 세션은 SESSION_COOKIE_AGE 보다 오래 살지 않으므로 표시도 그만큼만 남긴다
+        SessionTombstone.objects.bulk_create(
+            [SessionTombstone(
+                session_key=session_key,
+                expire_date=timezone.now() + timedelta(seconds=settings.SESSION_COOKIE_AGE),
+            )],
+            update_conflicts=True,
+            unique_fields=['session_key'],
+            update_fields=['expire_date'],
+        )
+
+    @staticmethod
+    def _deleted(session_keys: List[str]) -> Set[str]:
+        return set(
+            SessionTombstone.objects.filter(session_key__in=session_keys).values_list('session_key', flat=True)
+        )
+
+    def put(self, session: Session) -> None:
+        with self.lock:
+            self._pending[session.session_key] = session
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def get(self, session_key: str) -> Optional[Session]:
+        with self.lock:
+            return self._pending.get(session_key)
+
+    def discard(self, session_key: str) -> None:
+        with self.lock:
+            self._pending.pop(session_key, None)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def due(self) -> bool:
+        with self.lock:
+            if not self._pending:
+                return False
+            return (
+                len(self._pending) >= _setting('SESSION_WRITE_BEHIND_BATCH')
+                or time.monotonic() - self._oldest >= _setting('SESSION_WRITE_BEHIND_DELAY')
+            )
+
+    def flush(self) -> int:
+        """
+        모아 둔 변경을 upsert 한 번으로 쓴다. 쓴 세션 수를 돌려준다.
+
+        다른 프로세스에서 지운(삭제 표시가 있는) 세션은 쓰지 않고 캐시에서도 지운다.
+        """
+        with self.lock:
+            if not self._pending:
+                return 0
+            deleted = self._deleted(list(self._pending))
+            resurrected: Set[str] = set()
+            sessions: List[Session] = [
+                session for key, session in self._pending.items() if key not in deleted
+            ]
+            if sessions:
+                Session.objects.bulk_create(
+                    sessions,
+                    update_conflicts=True,
+                    unique_fields=['session_key'],
+                    update_fields=['session_data', 'expire_date'],
+                )
+                # 표시를 확인한 뒤 upsert 전에 지워진 세션 - 되살린 행을 다시 지운다
+                resurrected = self._deleted([session.session_key for session in sessions])
+                if resurrected:
+                    Session.objects.filter(session_key__in=resurrected).delete()
+            if deleted | resurrected:
+                # 표시 뒤에 이 프로세스의 save 가 캐시에 다시 쓴 값
+                try:
+                    self._cache.delete_many([CachedDBStore.cache_key_prefix + key for key in deleted | resurrected])
+                except Exception:
+                    logger.exception('Error deleting from cache (%s)', self._cache)
+            self._pending.clear()
+            self._oldest = None
+            return len(sessions) - len(resurrected)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._pending.clear()
+            self._oldest = None
+
+
+session_lru = SessionLRU()
+session_write_behind = SessionWriteBehind()
+
+
+def session_write_behind_flush() -> int:
+    return session_write_behind.flush()
+
+
+def session_local_tiers_clear() -> None:
+    """프로세스 메모리 계층(LRU, 쓰지 않은 변경)을 비운다 - 테스트용"""
+    session_lru.clear()
+    session_write_behind.clear()
+
+
+def _purge_expired(model, *, now, batch_size: int) -> int:
+    deleted = 0
+    while True:
+        keys = list(model.objects.filter(expire_date__lt=now).values_list('session_key', flat=True)[:batch_size])
+        if not keys:
+            return deleted
+        count, _ = model.objects.filter(session_key__in=keys, expire_date__lt=now).delete()
+        deleted += count
+
+
+def session_purge_expired(*, batch_size: int = 1000) -> int:
+    """
+    만료된 세션 행과 삭제 표시를 batch_size 개씩 지운다 (배치마다 커밋되어 테이블 락을 오래 잡지 않는다).
+
+    지운 세션 행 수를 돌려준다.
+    """
+    now = timezone.now()
+    _purge_expired(SessionTombstone, now=now, batch_size=batch_size)
+    return _purge_expired(Session, now=now, batch_size=batch_size)
+
+
+def _flush_if_due(sender, **kwargs):
+    if not session_write_behind.due():
+        return
+    try:
+        session_write_behind.flush()
+    except Exception:
+        # 남은 변경은 다음 요청에서 다시 시도한다
+        logger.exception('Session write-behind flush failed (%d pending)', len(session_write_behind))
+
+
+def _flush_at_exit():
+    try:
+        session_write_behind.flush()
+    except Exception:
+        logger.exception('Session write-behind flush at exit failed')
+
+
+request_finished.connect(_flush_if_due, dispatch_uid='common.sessions.flush_if_due')
+atexit.register(_flush_at_exit)
+
+
+class SessionStore(CachedDBStore):
+    """LRU → 캐시 → write-behind DB 세션 저장소"""
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # 읽어 온(또는 마지막으로 저장한) 데이터 - 같으면 저장하지 않는다
+        self._stored: Optional[Dict] = None
+
+    def load(self):
+        data = session_lru.get(self._session_key) if self._session_key else None
+        if data is None:
+            data = super().load()
+            if data:
+                session_lru.set(self.session_key, data)
+        self._stored = dict(data)
+        return data
+
+    async def aload(self):
+        data = session_lru.get(self._session_key) if self._session_key else None
+        if data is None:
+            data = await super().aload()
+            if data:
+                session_lru.set(self.session_key, data)
+        self._stored = dict(data)
+        return data
+
+    def _pending_session(self) -> Optional[Session]:
+        session = session_write_behind.get(self.session_key) if self.session_key else None
+        if session is not None and session.expire_date > timezone.now():
+            return session
+        return None
+
+    def _get_session_from_db(self):
+        return self._pending_session() or super()._get_session_from_db()
+
+    async def _aget_session_from_db(self):
+        return self._pending_session() or await super()._aget_session_from_db()
+
+    def exists(self, session_key):
+        return bool(session_key) and session_write_behind.get(session_key) is not None or super().exists(session_key)
+
+    async def aexists(self, session_key):
+        return (
+            bool(session_key) and session_write_behind.get(session_key) is not None
+            or await super().aexists(session_key)
+        )
+
+    def _unchanged(self) -> bool:
+        return self._stored is not None and self._get_session() == self._stored
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        if must_create:
+            super().save(must_create=True)
+        elif self._unchanged():
+            return
+        else:
+            data = self._get_session()
+            session_write_behind.put(self.create_model_instance(data))
+            try:
+                self._cache.set(self.cache_key, data, self.get_expiry_age())
+            except Exception:
+                logger.exception('Error saving to cache (%s)', self._cache)
+        session_lru.set(self.session_key, self._session)
+        self._stored = dict(self._session)
+
+    async def asave(self, must_create=False):
+        if self.session_key is None:
+            return await self.acreate()
+        if must_create:
+            await super().asave(must_create=True)
+        elif self._unchanged():
+            return
+        else:
+            data = self._get_session()
+            session_write_behind.put(self.create_model_instance(data))
+            try:
+                await self._cache.aset(await self.acache_key(), data, await self.aget_expiry_age())
+            except Exception:
+                logger.exception('Error saving to cache (%s)', self._cache)
+        session_lru.set(self.session_key, self._session)
+        self._stored = dict(self._session)
+
+    def delete(self, session_key=None):
+        session_key = session_key or self.session_key
+        if session_key is None:
+            return
+        with session_write_behind.lock:
+            session_write_behind.mark_deleted(session_key)
+            session_lru.discard(session_key)
+            super().delete(session_key)
+
+    async def adelete(self, session_key=None):
+        # flush 와 같은 스레드 락을 써야 하므로 동기 delete 를 스레드에서 실행한다
+        await sync_to_async(self.delete)(session_key)
+
+    @classmethod
+    def clear_expired(cls):
+        session_purge_expired()
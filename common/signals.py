@@ -0,0 +1,43 @@
+from functools import partial
+
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_save
+
+from common.cache import PAGE_CACHE_FIELDS, PAGE_CACHE_GENERATIONS, cache_version_bump
+from common.search import SEARCH_FIELDS, search_backend, search_fields
+
+
+def search_index_save(sender, instance, using, update_fields=None, raw=False, **kwargs):
+    """검색 대상 필드가 바뀌었을 수 있으면 해당 행만 다시 색인"""
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields) & set(search_fields(sender)):
+        return
+    search_backend(connections[using]).index_object(instance=instance)
+
+
+def search_index_delete(sender, instance, using, **kwargs):
+    search_backend(connections[using]).remove_object(instance=instance)
+
+
+def search_signals_connect() -> None:
+    for label in SEARCH_FIELDS:
+        post_save.connect(search_index_save, sender=label, dispatch_uid=f'search_index_save:{label}')
+        post_delete.connect(search_index_delete, sender=label, dispatch_uid=f'search_index_delete:{label}')
+
+
+def page_cache_invalidate(sender, using, raw=False, update_fields=None, **kwargs):
+    """공개 페이지에 보이는 모델이 바뀌면 커밋 후 해당 페이지 캐시 세대를 올린다"""
+    if raw:
+        return
+    fields = PAGE_CACHE_FIELDS.get(sender._meta.label)
+    if fields and update_fields is not None and not set(update_fields) & set(fields):
+        return
+    for name in PAGE_CACHE_GENERATIONS[sender._meta.label]:
+        transaction.on_commit(partial(cache_version_bump, name=name), using=using)
+
+
+def page_cache_signals_connect() -> None:
+    for label in PAGE_CACHE_GENERATIONS:
+        post_save.connect(page_cache_invalidate, sender=label, dispatch_uid=f'page_cache_save:{label}')
+        post_delete.connect(page_cache_invalidate, sender=label, dispatch_uid=f'page_cache_delete:{label}')
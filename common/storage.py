@@ -0,0 +1,133 @@
+"""
+내용 주소 파일 저장소 (STORAGES['presentations'])
+
+파일은 내용의 SHA-256 으로 정한 경로에 한 번만 저장한다.
+
+    이름(FileField 에 저장되는 값)  cas/ab/cd/<sha256>/<원래 파일명>
+    실제 파일(blob)               MEDIA_ROOT/cas/ab/cd/<sha256>
+
+같은 내용을 다시 올리면 blob 을 새로 쓰지 않고 이름만 돌려주므로 디스크를 더 쓰지 않는다.
+원래 파일명은 이름의 마지막 부분에 남아 다운로드 파일명으로 쓰이고, 해시는 이름에서 바로 읽을
+수 있어 다운로드 ETag 로 쓴다 (content_digest). upload_to 가 만든 디렉터리는 쓰지 않는다.
+
+blob 에서 만든 파생 파일(미리보기 등)은 blob 옆에 cas/ab/cd/<sha256>.<확장자> 로 둔다 (derivative_name).
+내용마다 한 번만 만들고, blob 이 지워질 때 함께 지운다.
+
+blob 은 여러 행이 함께 쓸 수 있으므로 delete() 는 아무것도 하지 않는다. 어떤 행도 가리키지 않는
+blob 은 gc_presentation_files 명령(presentations.services.presentation_file_gc)이 지운다.
+'cas/' 로 시작하지 않는 이름(이 저장소 이전에 올린 파일)은 FileSystemStorage 와 같이 다룬다.
+"""
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+CAS_PREFIX = 'cas'
+CAS_NAME_RE = re.compile(rf'^{CAS_PREFIX}/[0-9a-f]{{2}}/[0-9a-f]{{2}}/(?P<digest>[0-9a-f]{{64}})/[^/]+$')
+DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+HASH_BLOCK_SIZE = 64 * 1024
+
+
+def content_digest(name: str) -> Optional[str]:
+    """내용 주소 이름이면 SHA-256 hex, 아니면 None"""
+    match = CAS_NAME_RE.match(name or '')
+    return match.group('digest') if match else None
+
+
+def _blob_name(digest: str) -> str:
+    return f'{CAS_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}'
+
+
+def derivative_name(digest: str, suffix: str) -> str:
+    """blob 옆에 두는 파생 파일 이름 - cas/ab/cd/<sha256>.<suffix>"""
+    return f'{_blob_name(digest)}.{suffix}'
+
+
+@deconstructible(path='common.storage.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+    """SHA-256 경로에 한 번만 저장하는 FileSystemStorage"""
+
+    def blob_name(self, name: str) -> str:
+        digest = content_digest(name)
+        return _blob_name(digest) if digest else name
+
+    def path(self, name: str) -> str:
+        return super().path(self.blob_name(name))
+
+    def url(self, name: str) -> str:
+        return super().url(self.blob_name(name))
+
+    def get_available_name(self, name, max_length=None):
+        # 같은 이름이면 같은 내용이므로 이름을 바꿀 필요가 없다
+        return name
+
+    def _save(self, name, content):
+        filename = os.path.basename(name)
+        tmp_dir = self.temp_dir()
+
+        digest = hashlib.sha256()
+        if hasattr(content, 'temporary_file_path'):
+            # 디스크에 있는 업로드(임시 파일, 조각 업로드 파일)는 해시만 구하고 옮긴다
+            source = content.temporary_file_path()
+            with open(source, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                    digest.update(chunk)
+        else:
+            # 메모리 업로드는 임시 파일에 쓰면서 해시를 구한다 (한 번만 읽는다)
+            with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as f:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    f.write(chunk)
+                source = f.name
+
+        blob_name = _blob_name(digest.hexdigest())
+        blob = Path(super().path(blob_name))
+        if blob.exists():
+            # 이미 있는 내용 - 새로 쓰지 않는다. GC 유예 시간을 다시 세도록 시각만 갱신한다
+            os.utime(blob)
+            if not hasattr(content, 'temporary_file_path'):
+                os.unlink(source)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            file_move_safe(source, str(blob), allow_overwrite=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(blob, self.file_permissions_mode)
+        return f'{blob_name}/{filename}'
+
+    def delete(self, name):
+        # 다른 행이 같은 blob 을 가리킬 수 있다 - 지우는 것은 GC 가 한다
+        if not content_digest(name):
+            super().delete(name)
+
+    def temp_dir(self) -> Path:
+        """저장 중인 파일을 쓰는 곳 - blob 과 같은 파일 시스템이라 rename 으로 옮길 수 있다"""
+        tmp_dir = Path(super().path(f'{CAS_PREFIX}/tmp'))
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir
+
+    def _files(self) -> Iterator[Tuple[str, Path]]:
+        root = Path(super().path(CAS_PREFIX))
+        if not root.exists():
+            return
+        for path in root.glob('[0-9a-f][0-9a-f]/[0-9a-f][0-9a-f]/*'):
+            digest = path.name.split('.', 1)[0]
+            if DIGEST_RE.match(digest) and path.is_file():
+                yield digest, path
+
+    def blobs(self) -> Iterator[Tuple[str, Path]]:
+        """저장된 (SHA-256 hex, blob 경로) 전부"""
+        return ((digest, path) for digest, path in self._files() if path.name == digest)
+
+    def derivatives(self) -> Iterator[Tuple[str, Path]]:
+        """파생 파일의 (원본 SHA-256 hex, 경로) 전부"""
+        return ((digest, path) for digest, path in self._files() if path.name != digest)
+
+    def temp_files(self) -> Iterator[Path]:
+        """중간에 실패한 저장이 남긴 임시 파일"""
+        yield from (path for path in self.temp_dir().iterdir() if path.is_file())
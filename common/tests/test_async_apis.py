@@ -0,0 +1,152 @@
+"""
+async 읽기 API 테스트 (ASGI 배포 URL 설정 config.asgi_urls)
+
+같은 요청을 동기 API(config.urls)와 async API 에 보내 응답이 같은지 확인한다.
+테스트 함수는 동기로 두고 AsyncClient 호출만 async_to_sync 로 감싸 같은 DB 연결/트랜잭션을 쓴다.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import resolve, reverse
+
+from common.async_apis import AsyncApiView
+from events.tests.factories import EventFactory
+from locations.tests.factories import LocationFactory
+from users.tests.factories import AdminUserFactory, UserFactory
+
+ASYNC_URL_NAMES = ['auth:me', 'auth:check', 'locations:list', 'event-list']
+
+pytestmark = [pytest.mark.django_db, pytest.mark.urls('config.asgi_urls')]
+
+
+@pytest.fixture
+def user():
+    return AdminUserFactory()
+
+
+@pytest.fixture
+def async_client(client, user):
+    """client 로 로그인한 세션 쿠키를 쓰는 AsyncClient"""
+    client.force_login(user)
+    async_client = AsyncClient()
+    async_client.cookies = client.cookies
+    return async_client
+
+
+def async_get(async_client, path, **kwargs):
+    return async_to_sync(async_client.get)(path, **kwargs)
+
+
+@pytest.fixture
+def data():
+    LocationFactory.create_batch(3)
+    EventFactory.create_batch(3)
+
+
+@pytest.mark.parametrize('url_name', ASYNC_URL_NAMES)
+def test_async_view_routed(url_name):
+    """ASGI URL 설정에서는 같은 경로/이름이 async 뷰로 매칭된다"""
+    match = resolve(reverse(url_name))
+
+    assert match.view_name == url_name
+    assert issubclass(match.func.view_class, AsyncApiView)
+
+
+@pytest.mark.parametrize('url_name', ASYNC_URL_NAMES)
+def test_same_response_as_sync(client, async_client, data, settings, url_name):
+    """동기 API 와 같은 상태 코드/본문/ETag"""
+    response = async_get(async_client, reverse(url_name))
+
+    settings.ROOT_URLCONF = 'config.urls'
+    sync_response = client.get(reverse(url_name))
+
+    assert response.status_code == sync_response.status_code == 200
+    assert response.json() == sync_response.json()
+    assert response.get('ETag') == sync_response.get('ETag')
+
+
+@pytest.mark.parametrize('url_name', ['auth:me', 'locations:list', 'event-list'])
+def test_not_modified(async_client, data, url_name):
+    """If-None-Match 가 같으면 304"""
+    etag = async_get(async_client, reverse(url_name))['ETag']
+
+    response = async_get(async_client, reverse(url_name), headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+
+@pytest.mark.parametrize('url_name', ASYNC_URL_NAMES)
+def test_within_query_budget(async_client, data, query_budget, settings, url_name):
+    """async ORM 쿼리도 요청 계측에 기록되고 예산 안이다"""
+    settings.SERVER_TIMING_HEADER = True
+    response = async_get(async_client, reverse(url_name))
+
+    assert 'queries' in response['Server-Timing']
+    assert query_budget(response).queries > 0
+
+
+@pytest.mark.parametrize('url_name', ['auth:me', 'auth:check'])
+def test_auth_status_zero_queries_when_cached(async_client, url_name):
+    """인증 확인 API 는 캐시된 세션/Principal 로 SQL 없이 응답한다"""
+    async_get(async_client, reverse(url_name))
+
+    response = async_get(async_client, reverse(url_name))
+
+    assert response.status_code == 200
+    assert response.asgi_request.metrics.queries == 0
+
+
+def test_anonymous():
+    """비로그인 - 동기 API 와 같은 상태 코드"""
+    async_client = AsyncClient()
+
+    assert async_get(async_client, reverse('auth:me')).status_code == 401
+    assert async_get(async_client, reverse('auth:check')).json() == {'authenticated': False, 'user': None}
+    assert async_get(async_client, reverse('locations:list')).status_code == 403
+    assert async_get(async_client, reverse('event-list')).status_code == 200
+
+
+def test_location_filter_validation(async_client):
+    """필터 검증 실패는 DRF 와 같은 400 응답"""
+    response = async_get(async_client, reverse('locations:list'), query_params={'min_capacity': 0})
+
+    assert response.status_code == 400
+    assert 'min_capacity' in response.json()
+
+
+def test_event_cursor_pagination(async_client):
+    """커서 페이지네이션 - 다음 페이지 링크를 따라가면 나머지가 온다"""
+    EventFactory.create_batch(3)
+
+    first = async_get(async_client, reverse('event-list'), query_params={'page_size': 2}).json()
+    second = async_get(async_client, first['next']).json()
+
+    assert len(first['results']) == 2
+    assert len(second['results']) == 1
+    assert second['next'] is None
+
+
+def test_write_delegated_to_sync_view(client, user):
+    """같은 URL 의 쓰기 요청은 동기 API 가 처리한다 (CSRF 검사 포함)"""
+    async_client = AsyncClient(enforce_csrf_checks=True)
+    client.force_login(user)
+    async_client.cookies = client.cookies
+
+    response = async_to_sync(async_client.post)(reverse('event-list'), {})
+
+    assert response.status_code == 403
+    assert 'CSRF' in response.json()['detail']
+
+
+def test_non_member_me(client):
+    """다른 사용자 유형도 같은 직렬화"""
+    member = UserFactory()
+    client.force_login(member)
+    async_client = AsyncClient()
+    async_client.cookies = client.cookies
+
+    response = async_get(async_client, reverse('auth:me'))
+
+    assert response.json()['id'] == member.id
+    assert response.json()['user_type'] == member.user_type
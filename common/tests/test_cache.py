@@ -0,0 +1,92 @@
+"""
+공개 페이지 캐시 테스트
+"""
+import pytest
+from django.urls import reverse
+
+from events.tests.factories import EventFactory
+from presentations.tests.factories import PresentationFactory
+from users.tests.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestPublicPageCache:
+    """public_page_cache 데코레이터 테스트"""
+
+    def test_repeat_anonymous_view_served_from_cache(self, client, django_assert_num_queries):
+        """두 번째 비로그인 요청은 DB 조회 없이 캐시에서 응답"""
+        EventFactory(title='캐시 이벤트')
+        url = reverse('events')
+
+        first = client.get(url)
+        with django_assert_num_queries(0):
+            second = client.get(url)
+
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert second['ETag'] == first['ETag']
+        assert 'Last-Modified' in second
+        assert '캐시 이벤트' in second.content.decode()
+
+    def test_conditional_request_returns_not_modified(self, client):
+        """ETag 가 같으면 304"""
+        url = reverse('events')
+        etag = client.get(url)['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+    def test_event_change_invalidates_page(self, client, django_capture_on_commit_callbacks):
+        """이벤트 수정이 커밋되면 세대가 올라가 새로 렌더링"""
+        event = EventFactory(title='이전 제목')
+        url = reverse('events')
+        etag = client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            event.title = '바뀐 제목'
+            event.save()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert '바뀐 제목' in response.content.decode()
+        assert response['ETag'] != etag
+
+    def test_presentation_detail_follows_event_and_presenter(self, client, django_capture_on_commit_callbacks):
+        """발표 상세는 이벤트 수정과 발표자 이름 변경에도 새로 렌더링하고, 로그인 기록 저장에는 그대로"""
+        presentation = PresentationFactory(event__title='이전 이벤트', presenter__username='before')
+        url = reverse('presentation_detail', args=[presentation.pk])
+        etag = client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            presentation.presenter.save(update_fields=['last_login'])
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        with django_capture_on_commit_callbacks(execute=True):
+            presentation.event.title = '바뀐 이벤트'
+            presentation.event.save()
+            presentation.presenter.username = 'after'
+            presentation.presenter.save(update_fields=['username'])
+        content = client.get(url).content.decode()
+
+        assert '바뀐 이벤트' in content
+        assert 'after' in content
+
+    def test_authenticated_user_not_cached(self, client):
+        """로그인 사용자는 캐시를 거치지 않음"""
+        client.force_login(UserFactory())
+
+        response = client.get(reverse('presentations'))
+
+        assert response.status_code == 200
+        assert 'ETag' not in response
+        assert 'csrfmiddlewaretoken' in response.content.decode()
+
+    def test_anonymous_presentations_page_is_cacheable(self, client):
+        """비로그인 발표 페이지에는 CSRF 토큰이 없어 캐시됨"""
+        response = client.get(reverse('presentations'))
+
+        assert 'ETag' in response
+        assert 'csrfmiddlewaretoken' not in response.content.decode()
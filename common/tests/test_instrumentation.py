@@ -0,0 +1,116 @@
+"""
+요청 계측 미들웨어 테스트
+"""
+import logging
+
+import pytest
+from django.urls import reverse
+
+from common.instrumentation import registry
+from events.tests.factories import EventFactory, EventRegistrationFactory
+from locations.tests.factories import LocationFactory
+from presentations.tests.factories import MemberCommentFactory, PresentationFactory
+from users.tests.factories import AdminUserFactory, UserFactory
+
+
+@pytest.fixture
+def admin_client(client):
+    client.force_login(AdminUserFactory())
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    registry.reset()
+
+
+@pytest.mark.django_db
+class TestInstrumentationMiddleware:
+    """InstrumentationMiddleware 테스트"""
+
+    def test_server_timing_header(self, admin_client, settings):
+        """쿼리 수와 DB/직렬화/템플릿 시간을 Server-Timing 으로 내보낸다"""
+        settings.SERVER_TIMING_HEADER = True
+        LocationFactory.create_batch(2)
+
+        response = admin_client.get(reverse('locations:list'))
+
+        timing = response['Server-Timing']
+        assert f'desc="{response.wsgi_request.metrics.queries} queries"' in timing
+        for name in ('db;dur=', 'serializer;dur=', 'template;dur=', 'total;dur='):
+            assert name in timing
+        assert response.wsgi_request.metrics.serializer_time > 0
+
+    def test_server_timing_header_off(self, client, settings):
+        """SERVER_TIMING_HEADER 가 꺼져 있으면 헤더 없이 계측만 한다"""
+        settings.SERVER_TIMING_HEADER = False
+
+        response = client.get(reverse('about'))
+
+        assert 'Server-Timing' not in response
+        assert response.wsgi_request.metrics.template_time > 0
+        assert registry.snapshot()['about']['total_ms']['count'] == 1
+
+    def test_template_time_recorded(self, client):
+        """템플릿 페이지는 렌더링 시간이 기록된다"""
+        response = client.get(reverse('about'))
+
+        assert response.wsgi_request.metrics.template_time > 0
+
+    def test_metrics_endpoint(self, admin_client):
+        """URL 이름별 히스토그램을 어드민에게 보여준다"""
+        admin_client.get(reverse('locations:list'))
+        admin_client.get(reverse('locations:list'))
+
+        response = admin_client.get(reverse('request-metrics'))
+
+        assert response.status_code == 200
+        endpoints = {row['endpoint']: row for row in response.json()}
+        assert endpoints['locations:list']['query_budget'] == 4
+        assert endpoints['locations:list']['queries']['count'] == 2
+        assert endpoints['locations:list']['total_ms']['count'] == 2
+
+    def test_metrics_endpoint_requires_admin(self, client):
+        """어드민이 아니면 403"""
+        client.force_login(UserFactory())
+
+        response = client.get(reverse('request-metrics'))
+
+        assert response.status_code == 403
+
+    def test_budget_exceeded_logged(self, admin_client, settings, caplog):
+        """예산을 넘으면 경고 로그"""
+        settings.QUERY_BUDGETS = {'locations:list': 1}
+
+        with caplog.at_level(logging.WARNING, logger='common.instrumentation'):
+            admin_client.get(reverse('locations:list'))
+
+        assert 'Query budget exceeded for locations:list' in caplog.text
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """목록 API 쿼리 수가 행 수와 무관하게 예산 안인지 검사 (N+1 방지)"""
+
+    @pytest.mark.parametrize('url_name', [
+        'locations:list',
+        'users:list',
+        'users:pending-approval',
+        'auth:me',
+        'event-list',
+        'event-dashboard',
+        'presentation-list',
+        'presentation-comments-list',
+    ])
+    def test_list_endpoints_within_budget(self, admin_client, query_budget, url_name):
+        referrer = UserFactory(username='추천인')
+        UserFactory.create_batch(2, referrer=referrer)
+        for event in EventFactory.create_batch(2):
+            EventRegistrationFactory.create_batch(2, event=event)
+        for presentation in PresentationFactory.create_batch(2, presenter=referrer):
+            MemberCommentFactory.create_batch(2, presentation=presentation, user=referrer)
+
+        response = admin_client.get(reverse(url_name))
+
+        assert response.status_code == 200
+        query_budget(response)
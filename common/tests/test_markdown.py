@@ -0,0 +1,25 @@
+"""
+마크다운 렌더링(common.markdown) 테스트
+"""
+from common.markdown import markdown_digest, markdown_html, markdown_lru, markdown_render, markdown_renderer_version
+
+
+class TestMarkdownRender:
+    def test_output_is_sanitized(self):
+        html = markdown_render('# 제목\n\n<script>alert(1)</script>\n\n[링크](javascript:alert(1))')
+
+        assert '<script>' not in html
+        assert 'href="javascript:' not in html
+        assert '제목' in html
+
+    def test_memoized_per_content_and_version(self, settings):
+        settings.MARKDOWN_LRU_SIZE = 2
+        markdown_lru.clear()
+
+        first = markdown_html('첫 번째')
+        assert markdown_html('첫 번째', markdown_digest('첫 번째')) is first
+        markdown_html('두 번째')
+        markdown_html('세 번째')
+
+        assert len(markdown_lru) == 2
+        assert markdown_lru.get(f"{markdown_renderer_version()}:{markdown_digest('첫 번째')}") is None
@@ -0,0 +1,65 @@
+"""
+seed_data 명령 테스트
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q
+
+from common.search import search_filter
+from events.models import Event, EventRegistration
+from common.markdown import markdown_renderer_version
+from locations.models import Location
+from presentations.models import Presentation
+from users.models import User
+
+
+def _seed(**options):
+    call_command('seed_data', scale=0.01, batch_size=30, stdout=StringIO(), **options)
+
+
+@pytest.mark.django_db
+class TestSeedDataCommand:
+    """seed_data 명령 테스트"""
+
+    def test_seeds_scaled_counts(self):
+        """기준 행 수 x scale 만큼 만든다"""
+        _seed()
+
+        assert User.objects.count() == 10
+        assert Location.objects.count() == 1
+        assert Event.objects.count() == 2
+        assert EventRegistration.objects.count() == 100
+
+    def test_counters_and_search_index_consistent(self):
+        """bulk_create 후 대시보드 카운터와 검색 인덱스를 맞춘다"""
+        _seed()
+
+        events = Event.objects.annotate(
+            confirmed=Count('registrations', filter=Q(registrations__status=EventRegistration.Status.CONFIRMED)),
+            waitlisted=Count('registrations', filter=Q(registrations__status=EventRegistration.Status.WAITLISTED)),
+        )
+        for event in events:
+            assert event.registration_count == event.confirmed <= event.max_participants
+            assert event.waitlist_count == event.waitlisted
+
+        location = Location.objects.get()
+        assert list(search_filter(Location.objects.all(), location.name)) == [location]
+
+    def test_presentation_html_rendered(self):
+        """save() 를 거치지 않아도 발표 내용 HTML 이 채워져 있다"""
+        _seed()
+
+        assert Presentation.objects.exists()
+        assert not Presentation.objects.exclude(content_html_version=markdown_renderer_version()).exists()
+
+    def test_deterministic(self):
+        """같은 시드면 같은 값 - 두 번째 실행은 unique 값만 다르다"""
+        _seed()
+        first = list(EventRegistration.objects.order_by('id').values_list('name', 'phone'))
+
+        _seed()
+        second = list(EventRegistration.objects.order_by('id').values_list('name', 'phone'))[len(first):]
+
+        assert first == second
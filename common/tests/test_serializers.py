@@ -0,0 +1,106 @@
+"""
+컴파일된 출력 시리얼라이저 테스트
+"""
+import zoneinfo
+from datetime import date, datetime, time
+from types import SimpleNamespace
+
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+
+from common.serializers import compile_serializer
+from locations.apis import LocationListApi
+from locations.tests.factories import LocationFactory
+from users.apis import UserListApi, UserPendingApprovalListApi
+from users.models import User
+from users.tests.factories import UserFactory
+
+
+class SampleSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    active = serializers.BooleanField()
+    score = serializers.FloatField()
+    created_at = serializers.DateTimeField()
+    event_date = serializers.DateField()
+    start_time = serializers.TimeField()
+    label = serializers.CharField(source='get_label')
+    owner_name = serializers.CharField(source='owner.name', allow_null=True)
+    tags = serializers.ListField(child=serializers.CharField())
+    secret = serializers.CharField(write_only=True)
+    doubled = serializers.SerializerMethodField()
+
+    def get_doubled(self, obj):
+        return obj.id * 2
+
+
+def _sample(**overrides):
+    values = {
+        'id': 1,
+        'name': '이름',
+        'active': 1,
+        'score': 3,
+        'created_at': datetime(2024, 5, 1, 9, 30, tzinfo=zoneinfo.ZoneInfo('UTC')),
+        'event_date': date(2024, 5, 1),
+        'start_time': time(9, 30),
+        'get_label': lambda: '라벨',
+        'owner': SimpleNamespace(name='주인'),
+        'tags': ['a', 'b'],
+        'secret': '비밀',
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestCompileSerializer:
+    """compile_serializer 단위 테스트"""
+
+    def test_matches_drf_output(self):
+        """필드 종류별 출력이 DRF 와 같다"""
+        instances = [
+            _sample(),
+            _sample(id=2, owner=None, active='false', created_at=None, event_date=None),
+            _sample(id=3, created_at=datetime(2024, 5, 1, 18, 0, tzinfo=zoneinfo.ZoneInfo('Asia/Seoul'))),
+        ]
+
+        compiled = compile_serializer(SampleSerializer).many(instances)
+
+        assert compiled == SampleSerializer(instances, many=True).data
+        assert 'secret' not in compiled[0]
+        assert compiled[0]['created_at'] == '2024-05-01T09:30:00Z'
+        assert compiled[1]['owner_name'] is None
+
+    def test_respects_active_timezone(self):
+        """현재 활성 타임존으로 변환"""
+        instance = _sample()
+
+        with timezone.override(zoneinfo.ZoneInfo('Asia/Seoul')):
+            compiled = compile_serializer(SampleSerializer).to_representation(instance)
+            expected = SampleSerializer(instance).data
+
+        assert compiled['created_at'] == expected['created_at'] == '2024-05-01T18:30:00+09:00'
+
+    def test_compiled_once_per_class(self):
+        """같은 클래스는 한 번만 컴파일"""
+        assert compile_serializer(SampleSerializer) is compile_serializer(SampleSerializer)
+
+
+@pytest.mark.django_db
+class TestCompiledApiSerializers:
+    """API OutputSerializer 를 실제 모델에 적용했을 때 DRF 와 같은 출력"""
+
+    def test_user_output_serializers(self):
+        referrer = UserFactory(username='추천인')
+        UserFactory(referrer=referrer, user_type=User.UserType.ASSOCIATE)
+        UserFactory(referrer=None)
+        users = list(User.objects.select_related('referrer').order_by('id'))
+
+        for serializer_class in (UserListApi.OutputSerializer, UserPendingApprovalListApi.OutputSerializer):
+            assert compile_serializer(serializer_class).many(users) == serializer_class(users, many=True).data
+
+    def test_location_output_serializer(self):
+        locations = LocationFactory.create_batch(3)
+
+        serializer_class = LocationListApi.OutputSerializer
+        assert compile_serializer(serializer_class).many(locations) == serializer_class(locations, many=True).data
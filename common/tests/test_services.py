@@ -0,0 +1,115 @@
+"""
+공통 서비스 테스트
+"""
+import pytest
+from django.core.exceptions import ValidationError
+
+from events.models import EventRegistration
+from locations.models import Location
+from locations.tests.factories import LocationFactory
+from common.services import model_bulk_update, model_metadata, model_update
+from users.models import User
+from users.tests.factories import UserFactory, UserWithReferrerFactory
+
+
+@pytest.mark.django_db
+class TestModelUpdate:
+    """model_update 서비스 테스트"""
+
+    def test_validates_only_changed_fields(self, django_assert_num_queries):
+        """바뀌지 않은 unique 필드(username, email)는 중복 검사 쿼리를 내지 않는다"""
+        user = UserFactory()
+
+        with django_assert_num_queries(1):
+            model_update(instance=user, fields=['phone'], data={'phone': '010-1234-5678'})
+
+        with django_assert_num_queries(3):
+            model_update(instance=user, fields=['phone'], data={'phone': '010-0000-0000'}, validate_changed_only=False)
+
+    def test_changed_unique_field_still_checked(self):
+        """바뀐 unique 필드는 여전히 검사"""
+        other = LocationFactory()
+        location = LocationFactory()
+
+        with pytest.raises(ValidationError, match='name'):
+            model_update(instance=location, fields=['name'], data={'name': other.name})
+
+    def test_constraint_groups(self):
+        """unique_together 에 묶인 필드는 함께 검증 대상으로 남긴다"""
+        metadata = model_metadata(EventRegistration)
+
+        assert model_metadata(EventRegistration) is metadata
+        assert 'event' not in metadata.validation_exclude(['email'])
+        assert 'name' in metadata.validation_exclude(['email'])
+
+
+@pytest.mark.django_db
+class TestModelBulkUpdate:
+    """model_bulk_update 서비스 테스트"""
+
+    def test_reports_changed_rows_and_fields(self):
+        """바뀐 행과 필드만 보고하고 updated_at 을 갱신"""
+        first, second, third = LocationFactory.create_batch(3, max_capacity=100)
+        before = first.updated_at
+
+        updated = model_bulk_update(
+            instances=[first, second, third],
+            fields=['name', 'max_capacity'],
+            data_by_pk={
+                first.pk: {'name': '새 이름', 'max_capacity': 100},
+                second.pk: {'max_capacity': 100},
+            },
+        )
+
+        assert updated == {first.pk: ['name', 'updated_at']}
+        first.refresh_from_db()
+        assert first.name == '새 이름'
+        assert first.updated_at > before
+
+    def test_unique_fields_checked_in_one_query(self, django_assert_num_queries):
+        """unique 필드는 배치 밖/안의 중복을 쿼리 한 번으로 검사하고, 실패하면 아무것도 쓰지 않는다"""
+        taken = UserFactory(email='taken@example.com')
+        users = UserFactory.create_batch(3)
+        data_by_pk = {
+            users[0].pk: {'email': taken.email},
+            users[1].pk: {'email': 'same@example.com'},
+            users[2].pk: {'email': 'same@example.com'},
+        }
+
+        with django_assert_num_queries(1):
+            with pytest.raises(ValidationError) as exc_info:
+                model_bulk_update(instances=users, fields=['email'], data_by_pk=data_by_pk)
+
+        assert set(exc_info.value.message_dict) == {str(users[0].pk), str(users[2].pk)}
+        assert not User.objects.filter(email='same@example.com').exists()
+
+    def test_changed_fields_validated(self):
+        """바뀐 필드는 clean_fields/clean 으로 검증"""
+        location = LocationFactory()
+
+        with pytest.raises(ValidationError):
+            model_bulk_update(instances=[location], fields=['max_capacity'], data_by_pk={location.pk: {'max_capacity': 0}})
+
+        assert Location.objects.get(pk=location.pk).max_capacity != 0
+
+    def test_clean_does_not_load_relations(self, django_assert_num_queries):
+        """User.clean 이 추천인/승인자를 읽지 않으므로 행 수와 관계없이 UPDATE 한 번"""
+        approver = UserFactory(user_type=User.UserType.ADMIN)
+        users = UserWithReferrerFactory.create_batch(20, approved_by=approver)
+        users = list(User.objects.filter(pk__in=[user.pk for user in users]))
+
+        with django_assert_num_queries(1):
+            updated = model_bulk_update(
+                instances=users,
+                fields=['user_type'],
+                data_by_pk={user.pk: {'user_type': User.UserType.REGULAR} for user in users},
+            )
+
+        assert len(updated) == 20
+
+    def test_missing_foreign_key_rejected(self):
+        """존재하지 않는 FK 값은 거부"""
+        user = UserFactory()
+
+        with pytest.raises(ValidationError, match='is not a valid choice'):
+            model_bulk_update(instances=[user], fields=['referrer'], data_by_pk={user.pk: {'referrer': User(pk=999999)}})
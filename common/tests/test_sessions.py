@@ -0,0 +1,184 @@
+"""
+3단 세션 저장소(common.sessions)와 purge_sessions 명령 테스트
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from common.models import SessionTombstone
+from common.sessions import (
+    SessionStore,
+    SessionWriteBehind,
+    session_lru,
+    session_write_behind,
+    session_write_behind_flush,
+)
+from users.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def shared_session_cache(settings):
+    """운영의 Redis/Memcached 대신 - 한 프로세스 안에서는 LocMemCache 도 공유 캐시와 같다"""
+    settings.CACHES = {
+        **settings.CACHES,
+        'sessions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sessions'},
+    }
+    caches['sessions'].clear()
+
+
+@pytest.fixture
+def stored_session():
+    """DB 에 만들어진 세션 (생성은 바로 DB 에 쓴다)"""
+    session = SessionStore()
+    session['cart'] = 1
+    session.create()
+    return session
+
+
+@pytest.mark.django_db
+class TestSessionStore:
+    """SessionStore 테스트"""
+
+    def test_create_writes_db_immediately(self, stored_session):
+        """새 세션은 키 중복 검사를 위해 바로 DB 에 쓴다"""
+        assert Session.objects.filter(session_key=stored_session.session_key).exists()
+
+    def test_load_from_lru_without_queries(self, stored_session, django_assert_num_queries):
+        """LRU 에 있으면 캐시/DB 를 읽지 않는다"""
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+
+        with django_assert_num_queries(0):
+            session = SessionStore(stored_session.session_key)
+            assert session['cart'] == 1
+
+    def test_unmodified_save_skipped(self, stored_session):
+        """읽은 내용 그대로면 저장하지 않는다"""
+        session = SessionStore(stored_session.session_key)
+        session['cart'] = 1
+        session.save()
+
+        assert len(session_write_behind) == 0
+
+    def test_writes_coalesced(self, stored_session, django_assert_num_queries):
+        """같은 세션을 여러 번 바꾸면 DB 에는 마지막 값 한 번만 쓴다"""
+        for count in (2, 3, 4):
+            session = SessionStore(stored_session.session_key)
+            session['cart'] = count
+            session.save()
+
+        assert len(session_write_behind) == 1
+        # 삭제 표시 확인 → upsert → 다시 확인
+        with django_assert_num_queries(3):
+            assert session_write_behind_flush() == 1
+
+        row = Session.objects.get(session_key=stored_session.session_key)
+        assert row.get_decoded()['cart'] == 4
+
+    def test_pending_write_read_before_db(self, stored_session):
+        """LRU/캐시가 비어도 아직 DB 에 쓰지 않은 변경을 읽는다"""
+        session = SessionStore(stored_session.session_key)
+        session['cart'] = 5
+        session.save()
+        session_lru.clear()
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+
+        assert SessionStore(stored_session.session_key)['cart'] == 5
+
+    def test_delete_not_resurrected_by_flush(self, stored_session):
+        """로그아웃으로 지운 세션은 모아 둔 변경을 써도 되살아나지 않는다"""
+        session = SessionStore(stored_session.session_key)
+        session['cart'] = 6
+        session.save()
+
+        session.flush()
+        session_write_behind_flush()
+
+        assert not Session.objects.filter(session_key=stored_session.session_key).exists()
+        assert SessionStore(stored_session.session_key).load() == {}
+
+    def test_delete_in_other_process_not_resurrected(self, stored_session):
+        """다른 워커가 로그아웃한 세션을 이 워커의 모아 둔 변경이 되살리지 않는다"""
+        # 워커마다 따로인 write-behind - 캐시와 DB 만 같이 쓴다
+        worker_a, worker_b = SessionWriteBehind(), SessionWriteBehind()
+        session = SessionStore(stored_session.session_key)
+        session['cart'] = 7
+        worker_a.put(session.create_model_instance(session._get_session()))
+
+        worker_b.mark_deleted(stored_session.session_key)
+        Session.objects.filter(session_key=stored_session.session_key).delete()
+
+        assert SessionTombstone.objects.filter(session_key=stored_session.session_key).exists()
+        assert worker_a.flush() == 0
+        assert not Session.objects.filter(session_key=stored_session.session_key).exists()
+        assert len(worker_a) == 0
+
+    def test_save_after_delete_elsewhere_dropped_at_flush(self, stored_session):
+        """다른 워커에서 지운 세션을 이 워커에서 바꿔도 flush 가 DB 에 쓰지 않고 캐시에서도 지운다"""
+        session = SessionStore(stored_session.session_key)
+        session.load()
+        SessionWriteBehind().mark_deleted(stored_session.session_key)
+        Session.objects.filter(session_key=stored_session.session_key).delete()
+        caches[settings.SESSION_CACHE_ALIAS].delete(session.cache_key)
+
+        session['cart'] = 8
+        session.save()
+
+        assert session_write_behind_flush() == 0
+        assert caches[settings.SESSION_CACHE_ALIAS].get(session.cache_key) is None
+        session_lru.clear()
+        assert SessionStore(stored_session.session_key).load() == {}
+
+    def test_save_cost_independent_of_session_count(self, django_assert_num_queries):
+        """세션이 많아도 저장은 DB 를 건드리지 않고 캐시와 모아 둔 변경에만 쓴다"""
+        sessions = []
+        for n in range(300):
+            session = SessionStore()
+            session['cart'] = n
+            session.create()
+            sessions.append(session)
+
+        with django_assert_num_queries(0):
+            for session in sessions:
+                session['cart'] += 1
+                session.save()
+
+        assert len(session_write_behind) == len(sessions)
+        assert caches[settings.SESSION_CACHE_ALIAS].get(sessions[0].cache_key) == {'cart': 1}
+
+    def test_flushed_when_request_finishes(self, client, settings):
+        """요청이 끝날 때 지연 시간이 지났으면 DB 에 쓴다"""
+        settings.SESSION_WRITE_BEHIND_DELAY = 0
+        client.force_login(UserFactory())
+
+        client.get(reverse('auth:check'))
+
+        assert len(session_write_behind) == 0
+        assert Session.objects.get(session_key=client.session.session_key).get_decoded()['_auth_user_id']
+
+
+@pytest.mark.django_db
+class TestPurgeSessionsCommand:
+    """purge_sessions 명령 테스트"""
+
+    def test_purges_expired_in_batches(self):
+        """만료된 행(삭제 표시 포함)만 배치로 지운다"""
+        now = timezone.now()
+        for n in range(5):
+            Session.objects.create(session_key=f'expired{n}', session_data='', expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key='alive', session_data='', expire_date=now + timedelta(days=1))
+        SessionTombstone.objects.create(session_key='gone', expire_date=now - timedelta(days=1))
+        SessionTombstone.objects.create(session_key='recent', expire_date=now + timedelta(days=1))
+        out = StringIO()
+
+        call_command('purge_sessions', batch_size=2, stdout=out)
+
+        assert list(Session.objects.values_list('session_key', flat=True)) == ['alive']
+        assert list(SessionTombstone.objects.values_list('session_key', flat=True)) == ['recent']
+        assert '5개' in out.getvalue()
@@ -1,11 +1,17 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import get_object_or_404, render, redirect
 from presentations.models import Presentation
 from events.models import Event
 from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+
+from common.cache import public_page_cache
+from users.hashing import PasswordHashBusy
+from users.services import user_create
 
 User = get_user_model()
 
+@public_page_cache()
 def home(request):
     return render(request, 'home.html')
 
@@ -16,6 +22,7 @@ def posts(request):
     posts = Presentation.objects.select_related('presenter', 'event').order_by('-created_at')[:10]
     return render(request, 'posts.html', {'posts': posts})
 
+@public_page_cache(generations=['events'])
 def events(request):
     events = Event.objects.select_related('location').order_by('event_date', 'start_time')
     return render(request, 'events.html', {'events': events})
@@ -23,17 +30,27 @@ def events(request):
 def people(request):
     return render(request, 'people.html')
 
+# 발표자 이름도 보이므로 users 세대도 본다
+@public_page_cache(generations=['presentations', 'events', 'users'])
 def presentations(request):
     presentations = Presentation.objects.select_related('presenter', 'event').order_by('-created_at')[:10]
     events = Event.objects.order_by('-event_date')
     return render(request, 'presentations.html', {'presentations': presentations, 'events': events})
 
+@public_page_cache(generations=['presentations', 'events', 'users'])
+def presentation_detail(request, pk):
+    presentation = get_object_or_404(Presentation.objects.select_related('presenter', 'event'), pk=pk)
+    return render(request, 'presentation_detail.html', {'presentation': presentation})
+
 def login_view(request):
     error_message = None
     if request.method == 'POST':
         username = request.POST.get('username')
         password = request.POST.get('password')
-        user = authenticate(request, username=username, password=password)
+        try:
+            user = authenticate(request, username=username, password=password)
+        except PasswordHashBusy as exc:
+            return render(request, 'login.html', {'error_message': exc.detail, 'login_tab': True}, status=503)
         if user is not None:
             login(request, user)
             return redirect('home')
@@ -60,11 +77,18 @@ def signup_view(request):
         elif User.objects.filter(email=email).exists():
             error_message = '이미 사용 중인 이메일입니다.'
         else:
-            User.objects.create_user(username=username, email=email, password=password1)
-            return render(request, 'login.html', {
-                'login_tab': True,
-                'success_message': '회원가입이 완료되었습니다. 로그인 해주세요.'
-            })
+            try:
+                # 비밀번호 해시는 users.hashing 프로세스 풀에서 계산한다
+                user_create(username=username, email=email, password=password1)
+            except PasswordHashBusy as exc:
+                return render(request, 'login.html', {'error_message': exc.detail, 'login_tab': False}, status=503)
+            except ValidationError as exc:
+                error_message = exc.messages[0]
+            else:
+                return render(request, 'login.html', {
+                    'login_tab': True,
+                    'success_message': '회원가입이 완료되었습니다. 로그인 해주세요.'
+                })
     return render(request, 'login.html', {'login_tab': False, 'error_message': error_message})
 
 def mypage(request):
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# 자주 호출되는 읽기 API 를 async 뷰로 처리하는 URL 설정 (config/asgi_urls.py)
+os.environ.setdefault("DJANGO_ROOT_URLCONF", "config.asgi_urls")
 
 application = get_asgi_application()
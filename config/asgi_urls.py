@@ -0,0 +1,20 @@
+"""
+ASGI 배포용 URL 설정 (config/asgi.py 가 ROOT_URLCONF 로 지정)
+
+config.urls 와 경로/URL 이름이 같고, 자주 호출되는 읽기 API 만 async 뷰로 바뀐다
+(common.async_apis 참고). 앱별 asgi_urlpatterns 를 config.urls 보다 먼저 두므로
+해당 경로는 async 뷰가 먼저 매칭되고, 같은 이름공간은 앱별 asgi_urlpatterns 쪽으로 reverse 된다.
+"""
+from django.urls import include, path
+
+from config.urls import urlpatterns as wsgi_urlpatterns
+from events.urls import asgi_urlpatterns as event_patterns
+from locations.urls import asgi_urlpatterns as location_patterns
+from users.urls import asgi_urlpatterns as user_patterns
+
+urlpatterns = [
+    path('api/users/', include(user_patterns)),
+    path('api/locations/', include(location_patterns)),
+    path('api/', include(event_patterns)),
+    *wsgi_urlpatterns,
+]
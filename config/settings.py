@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -52,6 +54,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'common.instrumentation.InstrumentationMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -62,7 +65,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "config.urls"
+# ASGI(config/asgi.py)는 async 읽기 API 가 들어간 config.asgi_urls 를 쓴다
+ROOT_URLCONF = os.environ.get("DJANGO_ROOT_URLCONF", "config.urls")
 
 TEMPLATES = [
     {
@@ -93,6 +97,65 @@ DATABASES = {
 }
 
 
+# Cache
+# 공개 페이지/장소 검색 캐시용. 여러 프로세스로 운영할 때는 Redis/Memcached 로 바꿔야
+# 세대 번호 무효화가 모든 프로세스에 반영된다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "pseudocon",
+    },
+    # 세션 2단 캐시 (common.sessions) - 워커 프로세스끼리 공유하고 쓰기가 O(1) 인 캐시여야 한다.
+    # 운영에서는 Redis/Memcached 로 바꾼다 (예: django.core.cache.backends.redis.RedisCache).
+    # FileBasedCache 는 쓸 때마다 디렉터리 전체를 훑으므로 쓰지 않는다. DummyCache 면 캐시 계층을 건너뛴다.
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+}
+
+
+# 요청 계측 (common.instrumentation)
+# 응답에 Server-Timing 헤더(쿼리 수, DB/직렬화/템플릿 시간)를 붙일지 - 내부 정보라 개발환경에서만
+SERVER_TIMING_HEADER = DEBUG
+# URL 이름별 요청당 쿼리 수 상한 - 넘으면 경고 로그, 테스트에서는 query_budget 픽스처로 검사
+QUERY_BUDGETS = {
+    # 세션 인증 2개(세션 + 사용자) 포함
+    'locations:list': 4,
+    'locations:detail': 3,
+    'locations:suitable': 3,
+    'users:list': 4,
+    'users:detail': 3,
+    'users:pending-approval': 4,
+    'auth:me': 2,
+    'auth:check': 2,
+    'event-list': 4,
+    'event-dashboard': 4,
+    'presentation-list': 4,
+    'presentation-comments-list': 3,
+}
+
+
+# 비밀번호 해시 (users.hashing)
+# argon2-cffi 가 설치돼 있으면(pip install .[argon2]) Argon2 로 해시하고, 다른 방식으로 저장된
+# 해시는 로그인할 때 다시 해시한다. 검증용으로 Django 기본 해시 방식도 남겨 둔다.
+PASSWORD_HASHERS = [
+    *(["users.hashing.TunedArgon2PasswordHasher"] if find_spec("argon2") else []),
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+# ModelBackend 는 이전에 로그인한 세션(저장된 백엔드 경로)이 유지되도록 남겨 둔다.
+# 비밀번호 확인은 PooledModelBackend 에서 끝난다 (실패해도 ModelBackend 로 넘어가지 않는다)
+AUTHENTICATION_BACKENDS = [
+    "users.authentication.PooledModelBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+PASSWORD_HASH_WORKERS = 2  # 해시 전용 프로세스 수, 0 이면 요청 스레드에서 계산
+PASSWORD_HASH_MAX_CONCURRENCY = 4  # 웹 워커 프로세스당 동시에 계산/대기하는 해시 수
+PASSWORD_HASH_QUEUE_TIMEOUT = 5  # 초 - 자리가 나지 않으면 503
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -131,6 +194,41 @@ STATIC_URL = "static/"
 STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
+
+
+# 발표 자료는 내용 주소 저장소(common.storage)에 한 번만 저장한다
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "presentations": {"BACKEND": "common.storage.ContentAddressedStorage"},
+}
+PRESENTATION_FILE_GC_GRACE = 60 * 60  # 초 - 어떤 행도 가리키지 않은 지 이만큼 지난 파일만 지운다
+
+# 마크다운 렌더링 (common.markdown)
+# python-markdown 과 nh3 가 있으면(pip install .[markdown]) 마크다운으로, 없으면 이스케이프한 문단으로 보여 준다
+MARKDOWN_LRU_SIZE = 512  # 프로세스마다 기억하는 렌더링 결과 수
+
+# 발표 자료 미리보기 (presentations.services.presentation_preview_*)
+# run_preview_jobs 명령을 cron 등으로 주기적으로 실행하거나 --poll 로 띄워 둔다.
+# PDF 첫 페이지 이미지와 텍스트는 PyMuPDF 가 있어야 만든다 (pip install .[previews])
+PRESENTATION_PREVIEW_WORKERS = 2  # 렌더링 프로세스 수
+PRESENTATION_PREVIEW_WIDTH = 480  # 첫 페이지 PNG 폭 (픽셀)
+PRESENTATION_PREVIEW_EXCERPT_LENGTH = 300  # 발표 행에 적는 본문 앞부분 길이
+PRESENTATION_PREVIEW_MAX_ATTEMPTS = 5
+PRESENTATION_PREVIEW_RETRY_DELAY = 60  # 초 - 실패할 때마다 두 배로 늘린다
+PRESENTATION_PREVIEW_TIMEOUT = 5 * 60  # 초 - 이 안에 끝나지 않은 작업은 워커가 죽은 것으로 보고 다시 꺼낸다
+
+# 발표 자료 조각 업로드 (presentations.services)
+PRESENTATION_UPLOAD_DIR = BASE_DIR / "var" / "uploads"  # 받는 중인 조각을 이어 쓰는 곳
+PRESENTATION_UPLOAD_CHUNK_MAX_SIZE = 8 * 1024 * 1024  # 요청 하나로 받는 조각 최대 크기
+PRESENTATION_UPLOAD_EXPIRY = 24 * 60 * 60  # 초 - 지나면 purge_uploads 가 지운다
+
+# 파일 다운로드 (common.downloads)
+# None 이면 Django 가 보낸다. 앞단 웹 서버에 맡기려면 'x-sendfile' 또는 'x-accel-redirect'
+FILE_DOWNLOAD_OFFLOAD = None
+FILE_DOWNLOAD_ACCEL_PREFIX = "/protected-media/"  # nginx: internal location, alias 는 MEDIA_ROOT
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -160,7 +258,21 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:3000",
 ]
 
+# 세션 사용자 요약(users.selectors.Principal) 캐시
+# 프로세스마다 따로인 캐시에서는 다른 워커의 비밀번호 변경/비활성화가 TTL 만큼 늦게 보이므로 짧게 둔다.
+# Redis/Memcached 같은 공유 캐시 별칭으로 바꾸면 TTL 을 늘려도 된다.
+PRINCIPAL_CACHE_ALIAS = 'default'
+PRINCIPAL_CACHE_TIMEOUT = 5  # 초
+
 # 세션 설정
+# 세션: 프로세스 LRU → 공유 캐시 → DB(write-behind) 3단 저장소 (common/sessions.py)
+# 만료 행은 purge_sessions 명령을 주기적으로(cron 등) 실행해 지운다
+SESSION_ENGINE = 'common.sessions'
+SESSION_CACHE_ALIAS = 'sessions'
+SESSION_LRU_SIZE = 10_000
+SESSION_LRU_TTL = 5  # 초 - 다른 워커의 로그아웃이 늦게 보일 수 있는 최대 시간
+SESSION_WRITE_BEHIND_DELAY = 5  # 초
+SESSION_WRITE_BEHIND_BATCH = 500
 SESSION_COOKIE_AGE = 86400  # 24시간
 SESSION_COOKIE_SECURE = False  # 개발환경용, 프로덕션에서는 True
 SESSION_COOKIE_HTTPONLY = True  # XSS 보호
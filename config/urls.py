@@ -18,6 +18,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from common import views as common_views
+from common.apis import RequestMetricsApi
 from presentations.viewsets import PresentationCreateView
 
 urlpatterns = [
@@ -25,6 +26,7 @@ urlpatterns = [
     path('', common_views.home, name='home'),
     path('about/', common_views.about, name='about'),
     path('presentations/', common_views.presentations, name='presentations'),
+    path('presentations/<int:pk>/', common_views.presentation_detail, name='presentation_detail'),
     path('events/', common_views.events, name='events'),
     path('people/', common_views.people, name='people'),
     path('login/', common_views.login_view, name='login'),
@@ -34,6 +36,7 @@ urlpatterns = [
     path('api/users/', include('users.urls')),  # users URL 추가
     path('api/locations/', include('locations.urls')),  # locations URL 추가
     path('api/presentations/', include('presentations.urls')),
+    path('api/metrics/', RequestMetricsApi.as_view(), name='request-metrics'),
     path('api/', include('events.urls')),  # events URL 추가
     path('presentations/create/', PresentationCreateView.as_view(), name='presentation_create'),
 ]
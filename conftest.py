@@ -15,3 +15,43 @@ def api_client():
     """API 클라이언트"""
     from rest_framework.test import APIClient
     return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """테스트 간 캐시(세션 계층 포함)가 공유되지 않도록 매 테스트 전에 비운다"""
+    from django.core.cache import cache, caches
+    from common.sessions import session_local_tiers_clear
+
+    cache.clear()
+    caches[settings.SESSION_CACHE_ALIAS].clear()
+    session_local_tiers_clear()
+    yield
+    # 쓰지 않은 세션 변경이 남으면 테스트 DB 가 지워진 뒤 종료 시 flush 가 실패한다
+    session_local_tiers_clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    응답 한 건의 쿼리 수가 예산 안인지 검사한다 (common.instrumentation 미들웨어 계측값)
+
+        response = api_client.get(reverse('locations:list'))
+        query_budget(response)             # settings.QUERY_BUDGETS['locations:list']
+        query_budget(response, budget=2)   # 직접 지정
+    """
+    from common.instrumentation import query_budget_get, request_endpoint
+
+    def check(response, budget=None):
+        # AsyncClient 응답은 asgi_request
+        request = getattr(response, 'wsgi_request', None) or response.asgi_request
+        endpoint = request_endpoint(request)
+        if budget is None:
+            budget = query_budget_get(endpoint)
+        assert budget is not None, f'QUERY_BUDGETS 에 {endpoint} 예산이 없습니다.'
+        assert request.metrics.queries <= budget, (
+            f'{endpoint}: 쿼리 {request.metrics.queries}개 (예산 {budget}개)'
+        )
+        return request.metrics
+
+    return check
@@ -4,7 +4,7 @@ from events.models import Event, EventRegistration
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ('title', 'event_date', 'start_time', 'end_time', 'location', 'status', 'created_by')
+    list_display = ('title', 'event_date', 'start_time', 'end_time', 'location', 'status', 'registration_count', 'waitlist_count', 'created_by')
     list_filter = ('status', 'event_date', 'location')
     search_fields = ('title', 'description')
     date_hierarchy = 'event_date'
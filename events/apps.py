@@ -5,3 +5,6 @@ class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
     verbose_name = '이벤트'
+
+    def ready(self):
+        import events.signals  # noqa: F401
@@ -0,0 +1,47 @@
+"""
+참석자 명단 CSV 스트리밍
+
+StreamingHttpResponse 에 넘길 수 있도록 한 행씩 CSV 문자열을 만든다.
+"""
+import csv
+from typing import Iterator
+
+from django.utils import timezone
+
+from events.models import EventRegistration
+from events.selectors import event_registration_export_rows
+
+# (EventRegistration 필드명, CSV 헤더)
+EXPORT_COLUMNS = (
+    ('name', '이름'),
+    ('email', '이메일'),
+    ('phone', '전화번호'),
+    ('company', '회사'),
+    ('how_did_you_know', '유입 경로'),
+    ('status', '상태'),
+    ('registered_at', '등록일'),
+)
+
+
+class _Echo:
+    """csv.writer 가 쓴 문자열을 그대로 돌려주는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def registration_csv_iter(*, event_id: int) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    status_labels = dict(EventRegistration.Status.choices)
+    fields = [field for field, _ in EXPORT_COLUMNS]
+    status_index = fields.index('status')
+    registered_at_index = fields.index('registered_at')
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM 을 붙인다
+    yield '\ufeff' + writer.writerow([header for _, header in EXPORT_COLUMNS])
+
+    for row in event_registration_export_rows(event_id=event_id, fields=fields):
+        row = list(row)
+        row[status_index] = status_labels.get(row[status_index], row[status_index])
+        row[registered_at_index] = timezone.localtime(row[registered_at_index]).strftime('%Y-%m-%d %H:%M:%S')
+        yield writer.writerow(row)
@@ -0,0 +1,100 @@
+"""
+참석자 명단 파일 파서
+
+구글폼/스프레드시트에서 내려받은 CSV, XLSX 파일을 한 행씩 읽어
+EventRegistration 필드명 기준 dict 로 돌려준다. 파일 전체를 메모리에 올리지 않는다.
+"""
+import csv
+import io
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from django.core.exceptions import ValidationError
+
+# 구글폼 질문 제목/스프레드시트 헤더 -> EventRegistration 필드명
+HEADER_ALIASES = {
+    'name': 'name',
+    '이름': 'name',
+    '성함': 'name',
+    'email': 'email',
+    'email address': 'email',
+    '이메일': 'email',
+    '이메일 주소': 'email',
+    'phone': 'phone',
+    '전화번호': 'phone',
+    '연락처': 'phone',
+    'company': 'company',
+    '회사': 'company',
+    '소속': 'company',
+    'how_did_you_know': 'how_did_you_know',
+    'how did you know': 'how_did_you_know',
+    '이벤트를 어떻게 알게 되었는지': 'how_did_you_know',
+    '유입 경로': 'how_did_you_know',
+}
+
+SUPPORTED_FORMATS = ('csv', 'xlsx')
+
+
+def _normalize_header(header) -> Optional[str]:
+    if header is None:
+        return None
+    return HEADER_ALIASES.get(str(header).strip().lower())
+
+
+def _rows_from_table(rows: Iterable[Iterable]) -> Iterator[Dict[str, str]]:
+    """첫 행을 헤더로 보고 나머지 행을 필드명 dict 로 변환 (알 수 없는 열은 무시)"""
+    rows = iter(rows)
+    try:
+        header = next(rows)
+    except StopIteration:
+        return
+
+    columns = [_normalize_header(cell) for cell in header]
+    if 'email' not in columns or 'name' not in columns:
+        raise ValidationError('이름, 이메일 열이 있어야 합니다.')
+
+    for values in rows:
+        row = {}
+        for column, value in zip(columns, values):
+            if column and column not in row:
+                row[column] = '' if value is None else str(value).strip()
+        if any(row.values()):
+            yield row
+
+
+def _iter_csv(file) -> Iterator[Dict[str, str]]:
+    # BOM 이 붙은 엑셀 CSV 도 처리하기 위해 utf-8-sig 사용
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        yield from _rows_from_table(csv.reader(text))
+    except UnicodeDecodeError:
+        raise ValidationError('CSV 파일은 UTF-8 인코딩이어야 합니다.')
+    finally:
+        # 업로드 파일 자체는 호출한 쪽에서 닫는다
+        text.detach()
+
+
+def _iter_xlsx(file) -> Iterator[Dict[str, str]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError('XLSX 파일을 가져오려면 openpyxl 패키지가 필요합니다.')
+
+    # read_only 모드는 시트를 스트리밍으로 읽는다
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from _rows_from_table(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def registration_rows_iter(*, file, file_format: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """업로드 파일에서 등록 행을 순서대로 읽는다 (형식은 확장자로 판단)"""
+    file_format = (file_format or Path(getattr(file, 'name', '')).suffix.lstrip('.')).lower()
+
+    if file_format == 'csv':
+        return _iter_csv(file)
+    if file_format == 'xlsx':
+        return _iter_xlsx(file)
+
+    raise ValidationError(f"지원하지 않는 파일 형식입니다. ({', '.join(SUPPORTED_FORMATS)})")
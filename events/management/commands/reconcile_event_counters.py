@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from events.services import event_counters_reconcile
+
+
+class Command(BaseCommand):
+    help = '이벤트 대시보드 카운터(참석자/대기자/발표 상태별 수)를 실제 행 수와 맞춥니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--event', dest='event_ids', type=int, action='append',
+            help='특정 이벤트만 확인 (여러 번 지정 가능)'
+        )
+
+    def handle(self, *args, event_ids=None, **options):
+        repaired = event_counters_reconcile(event_ids=event_ids)
+        self.stdout.write(self.style.SUCCESS(f'{repaired}개 이벤트의 카운터를 복구했습니다.'))
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_alter_event_created_at_alter_event_updated_at'),
+        ('locations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date', 'start_time', 'id'], name='event_date_start_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['registered_at', 'id'], name='registration_registered_id_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:00
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_registration_count(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventRegistration = apps.get_model('events', 'EventRegistration')
+
+    counts = (
+        EventRegistration.objects
+        .filter(event=OuterRef('pk'))
+        .order_by()
+        .values('event')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    Event.objects.update(registration_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_cursor_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='registration_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='확정 참석자 수'),
+        ),
+        migrations.AddField(
+            model_name='eventregistration',
+            name='status',
+            field=models.CharField(choices=[('CONFIRMED', '확정'), ('WAITLISTED', '대기')], default='CONFIRMED', max_length=20, verbose_name='상태'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'status', 'id'], name='registration_waitlist_idx'),
+        ),
+        migrations.RunPython(backfill_registration_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_dashboard_counters(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventRegistration = apps.get_model('events', 'EventRegistration')
+    Presentation = apps.get_model('presentations', 'Presentation')
+
+    def count_of(queryset):
+        counts = (
+            queryset
+            .filter(event=OuterRef('pk'))
+            .order_by()
+            .values('event')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    Event.objects.update(
+        registration_count=count_of(EventRegistration.objects.filter(status='CONFIRMED')),
+        waitlist_count=count_of(EventRegistration.objects.filter(status='WAITLISTED')),
+        presentation_submitted_count=count_of(Presentation.objects.filter(status='submitted')),
+        presentation_selected_count=count_of(Presentation.objects.filter(status='selected')),
+        presentation_completed_count=count_of(Presentation.objects.filter(status='completed')),
+        presentation_rejected_count=count_of(Presentation.objects.filter(status='rejected')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_registration_capacity'),
+        ('presentations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='presentation_completed_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='완료된 발표 수'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='presentation_rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='거절된 발표 수'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='presentation_selected_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='선정된 발표 수'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='presentation_submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='신청된 발표 수'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='waitlist_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='대기자 수'),
+        ),
+        migrations.RunPython(backfill_dashboard_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_dashboard_counters'),
+        ('locations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location', 'event_date', 'start_time'], name='event_location_slot_idx'),
+        ),
+    ]
@@ -23,6 +23,17 @@ class Event(BaseModel):
         related_name='events'
     )
     max_participants = models.PositiveIntegerField(_('최대 참석자 수'))
+
+    # 대시보드용 비정규화 카운터 - events.services 에서만 갱신하고 어긋나면
+    # reconcile_event_counters 명령으로 복구한다. 확정 참석자 수는 좌석 선점을 위해
+    # 조건부 UPDATE로만 증감한다. 카운터를 바꿀 때 updated_at 도 함께 갱신해
+    # 조건부 GET(ETag) 검증값에 반영되도록 한다.
+    registration_count = models.PositiveIntegerField(_('확정 참석자 수'), default=0, editable=False)
+    waitlist_count = models.PositiveIntegerField(_('대기자 수'), default=0, editable=False)
+    presentation_submitted_count = models.PositiveIntegerField(_('신청된 발표 수'), default=0, editable=False)
+    presentation_selected_count = models.PositiveIntegerField(_('선정된 발표 수'), default=0, editable=False)
+    presentation_completed_count = models.PositiveIntegerField(_('완료된 발표 수'), default=0, editable=False)
+    presentation_rejected_count = models.PositiveIntegerField(_('거절된 발표 수'), default=0, editable=False)
     status = models.CharField(
         _('상태'),
         max_length=20,
@@ -40,12 +51,27 @@ class Event(BaseModel):
         verbose_name = _('이벤트')
         verbose_name_plural = _('이벤트')
         ordering = ['-event_date', '-start_time']
+        indexes = [
+            # 커서 페이지네이션 정렬 키
+            models.Index(fields=['event_date', 'start_time', 'id'], name='event_date_start_id_idx'),
+            # 장소 중복 예약 검사 (같은 장소/날짜의 시간대 범위 조회)
+            models.Index(fields=['location', 'event_date', 'start_time'], name='event_location_slot_idx'),
+        ]
+
+    @property
+    def seats_remaining(self) -> int:
+        """남은 좌석 수"""
+        return max(self.max_participants - self.registration_count, 0)
 
     def __str__(self):
         return f"{self.title} ({self.event_date})"
 
 
 class EventRegistration(models.Model):
+    class Status(models.TextChoices):
+        CONFIRMED = 'CONFIRMED', _('확정')
+        WAITLISTED = 'WAITLISTED', _('대기')
+
     event = models.ForeignKey(
         Event,
         on_delete=models.CASCADE,
@@ -57,6 +83,12 @@ class EventRegistration(models.Model):
     phone = models.CharField(_('전화번호'), max_length=20)
     company = models.CharField(_('회사'), max_length=100)
     how_did_you_know = models.TextField(_('이벤트를 어떻게 알게 되었는지'))
+    status = models.CharField(
+        _('상태'),
+        max_length=20,
+        choices=Status.choices,
+        default=Status.CONFIRMED
+    )
     registered_at = models.DateTimeField(_('등록일'), auto_now_add=True)
     user = models.ForeignKey(
         User,
@@ -72,6 +104,12 @@ class EventRegistration(models.Model):
         verbose_name_plural = _('이벤트 등록')
         ordering = ['-registered_at']
         unique_together = ['event', 'email']
+        indexes = [
+            # 커서 페이지네이션 정렬 키
+            models.Index(fields=['registered_at', 'id'], name='registration_registered_id_idx'),
+            # 대기 순번 계산
+            models.Index(fields=['event', 'status', 'id'], name='registration_waitlist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.event.title}"
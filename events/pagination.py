@@ -0,0 +1,26 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    이벤트 목록 커서 페이지네이션
+
+    (event_date, start_time, id) 복합 인덱스를 타도록 정렬 키를 맞춘다.
+    OFFSET 스캔이 없으므로 페이지 깊이와 무관하게 조회 비용이 일정하다.
+    """
+    ordering = ('-event_date', '-start_time', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class EventRegistrationCursorPagination(CursorPagination):
+    """
+    이벤트 등록 목록 커서 페이지네이션
+
+    (registered_at, id) 복합 인덱스 기준 최신순
+    """
+    ordering = ('-registered_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,47 @@
+from typing import Iterator, Optional, Sequence
+
+from django.db.models import QuerySet
+
+from events.models import Event, EventRegistration
+
+
+def event_registration_waitlist_position(*, registration: EventRegistration) -> Optional[int]:
+    """
+    대기 순번 (1부터 시작)
+
+    확정된 등록이면 None
+    """
+    if registration.status != EventRegistration.Status.WAITLISTED:
+        return None
+
+    return EventRegistration.objects.filter(
+        event_id=registration.event_id,
+        status=EventRegistration.Status.WAITLISTED,
+        id__lte=registration.id,
+    ).count()
+
+
+def event_registration_export_rows(*, event_id: int, fields: Sequence[str], chunk_size: int = 2000) -> Iterator[tuple]:
+    """
+    참석자 명단 내보내기용 행 이터레이터
+
+    values_list 튜플만 서버 측 커서로 chunk_size 씩 가져오므로 등록 수와 무관하게
+    메모리 사용량이 일정하다. (event, status, id) 인덱스 순서대로 확정자 먼저 나온다.
+    """
+    return (
+        EventRegistration.objects
+        .filter(event_id=event_id)
+        .order_by('status', 'id')
+        .values_list(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def event_dashboard_list() -> QuerySet[Event]:
+    """
+    대시보드 이벤트 목록
+
+    참석자/발표 수는 Event 의 카운터 컬럼을 그대로 읽으므로
+    장소 JOIN 이 포함된 쿼리 한 번으로 끝난다.
+    """
+    return Event.objects.select_related('location').order_by('-event_date', '-start_time', '-id')
@@ -6,11 +6,38 @@ class EventSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = '__all__'
-        read_only_fields = ('created_by', 'created_at', 'updated_at')
+        read_only_fields = ('created_by', 'registration_count', 'created_at', 'updated_at')
 
 
 class EventRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = EventRegistration
         fields = '__all__'
-        read_only_fields = ('registered_at', 'user') 
\ No newline at end of file
+        read_only_fields = ('status', 'registered_at', 'user')
+
+
+class EventDashboardSerializer(serializers.ModelSerializer):
+    location_name = serializers.CharField(source='location.name', read_only=True)
+    seats_remaining = serializers.IntegerField(read_only=True)
+    presentation_counts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Event
+        fields = (
+            'id', 'title', 'event_date', 'start_time', 'end_time', 'status',
+            'location', 'location_name', 'max_participants',
+            'registration_count', 'waitlist_count', 'seats_remaining', 'presentation_counts',
+        )
+        read_only_fields = fields
+
+    def get_presentation_counts(self, obj):
+        return {
+            'submitted': obj.presentation_submitted_count,
+            'selected': obj.presentation_selected_count,
+            'completed': obj.presentation_completed_count,
+            'rejected': obj.presentation_rejected_count,
+        }
+
+
+class EventRegistrationImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
@@ -0,0 +1,516 @@
+from collections import defaultdict
+from datetime import date, time
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from common.intervals import IntervalTree
+from common.services import model_update
+from events.importers import registration_rows_iter
+from events.models import Event, EventRegistration
+from locations.models import Location
+from locations.services import location_schedule_cache_invalidate
+from presentations.models import Presentation
+
+if TYPE_CHECKING:
+    from users.models import User
+
+
+def _seat_claim(*, event_id: int) -> bool:
+    """
+    좌석 하나를 선점한다.
+
+    UPDATE ... WHERE registration_count < max_participants 한 번으로 처리하므로
+    동시 요청이 몰려도 정원을 초과하지 않고, 행을 미리 읽어 둘 필요도 없다.
+    """
+    return bool(
+        Event.objects
+        .filter(pk=event_id, registration_count__lt=F('max_participants'))
+        .update(registration_count=F('registration_count') + 1, updated_at=timezone.now())
+    )
+
+
+def _seat_release(*, event_id: int) -> None:
+    Event.objects.filter(pk=event_id, registration_count__gt=0).update(
+        registration_count=F('registration_count') - 1, updated_at=timezone.now()
+    )
+
+
+def _waitlist_count_add(*, event_id: int, delta: int) -> None:
+    qs = Event.objects.filter(pk=event_id)
+    if delta < 0:
+        qs = qs.filter(waitlist_count__gte=-delta)
+    qs.update(waitlist_count=F('waitlist_count') + delta, updated_at=timezone.now())
+
+
+PRESENTATION_COUNT_FIELDS = {
+    Presentation.Status.SUBMITTED: 'presentation_submitted_count',
+    Presentation.Status.SELECTED: 'presentation_selected_count',
+    Presentation.Status.COMPLETED: 'presentation_completed_count',
+    Presentation.Status.REJECTED: 'presentation_rejected_count',
+}
+
+
+def _event_count_subquery(queryset: QuerySet) -> Coalesce:
+    """이벤트별 행 수를 세는 상관 서브쿼리 (UPDATE ... SET 에 바로 사용)"""
+    counts = (
+        queryset
+        .filter(event=OuterRef('pk'))
+        .order_by()
+        .values('event')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def _registration_count_expressions() -> Dict[str, Coalesce]:
+    return {
+        'registration_count': _event_count_subquery(
+            EventRegistration.objects.filter(status=EventRegistration.Status.CONFIRMED)
+        ),
+        'waitlist_count': _event_count_subquery(
+            EventRegistration.objects.filter(status=EventRegistration.Status.WAITLISTED)
+        ),
+    }
+
+
+def _presentation_count_expressions() -> Dict[str, Coalesce]:
+    return {
+        field: _event_count_subquery(Presentation.objects.filter(status=status))
+        for status, field in PRESENTATION_COUNT_FIELDS.items()
+    }
+
+
+def event_presentation_counts_refresh(*, event_id: int) -> None:
+    """발표 상태별 카운터를 UPDATE 한 번으로 다시 센다"""
+    Event.objects.filter(pk=event_id).update(**_presentation_count_expressions(), updated_at=timezone.now())
+
+
+def event_counters_reconcile(*, event_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    모든 비정규화 카운터를 실제 행 수와 맞춘다.
+
+    실제 값과 다른 이벤트만 골라 갱신하며, 갱신한 이벤트 수를 돌려준다.
+    """
+    expressions = {**_registration_count_expressions(), **_presentation_count_expressions()}
+
+    qs = Event.objects.all()
+    if event_ids is not None:
+        qs = qs.filter(pk__in=list(event_ids))
+
+    drifted = qs.alias(
+        **{f'actual_{field}': expression for field, expression in expressions.items()}
+    ).filter(
+        reduce(or_, [~Q(**{field: F(f'actual_{field}')}) for field in expressions])
+    )
+
+    return Event.objects.filter(pk__in=drifted.values('pk')).update(**expressions, updated_at=timezone.now())
+
+
+def _event_overlapping_qs(
+    *, location_id: int, event_date: date, start_time: time, end_time: time, exclude_id: Optional[int] = None
+) -> QuerySet[Event]:
+    """
+    같은 장소/날짜에서 [start_time, end_time) 과 겹치는 (취소되지 않은) 이벤트
+
+    (location, event_date, start_time) 인덱스로 해당 날짜의 start_time < end_time
+    범위만 훑는다. 끝 시각이 시작 시각과 같으면 겹치지 않는 것으로 본다.
+    """
+    qs = Event.objects.filter(
+        location_id=location_id,
+        event_date=event_date,
+        start_time__lt=end_time,
+        end_time__gt=start_time,
+    ).exclude(status=Event.Status.CANCELLED)
+
+    if exclude_id is not None:
+        qs = qs.exclude(pk=exclude_id)
+
+    return qs
+
+
+def _event_schedule_validate(*, event: Event) -> None:
+    """시간 순서와 장소 중복 예약 검사"""
+    if event.end_time <= event.start_time:
+        raise ValidationError('종료 시간은 시작 시간보다 늦어야 합니다.')
+
+    if event.status == Event.Status.CANCELLED:
+        return
+
+    # 같은 장소의 예약 검사/저장을 직렬화한다 (동시 요청이 둘 다 검사를 통과하지 않도록)
+    Location.objects.select_for_update().filter(pk=event.location_id).first()
+
+    conflict = _event_overlapping_qs(
+        location_id=event.location_id,
+        event_date=event.event_date,
+        start_time=event.start_time,
+        end_time=event.end_time,
+        exclude_id=event.pk,
+    ).order_by('start_time').first()
+
+    if conflict is not None:
+        raise ValidationError(
+            f"해당 장소는 {conflict.event_date} {conflict.start_time:%H:%M}-{conflict.end_time:%H:%M}에 "
+            f"'{conflict.title}' 이벤트로 이미 예약되어 있습니다."
+        )
+
+
+EVENT_SCHEDULE_FIELDS = ('location', 'event_date', 'start_time', 'end_time', 'status')
+
+
+@transaction.atomic
+def event_create(
+    *,
+    title: str,
+    description: str,
+    event_date: date,
+    start_time: time,
+    end_time: time,
+    location: Location,
+    max_participants: int,
+    created_by: 'User',
+    status: str = Event.Status.PLANNING,
+) -> Event:
+    """이벤트 생성 - 같은 장소/시간대에 겹치는 이벤트가 있으면 거부"""
+    event = Event(
+        title=title,
+        description=description,
+        event_date=event_date,
+        start_time=start_time,
+        end_time=end_time,
+        location=location,
+        max_participants=max_participants,
+        status=status,
+        created_by=created_by,
+    )
+    event.full_clean()
+    _event_schedule_validate(event=event)
+    event.save()
+    location_schedule_cache_invalidate()
+
+    return event
+
+
+@transaction.atomic
+def event_update(*, event: Event, data: Dict[str, Any]) -> Event:
+    """
+    이벤트 수정
+
+    장소/날짜/시간/상태가 바뀌면 중복 예약을 다시 검사하고,
+    정원이 바뀌면 남은 좌석만큼 대기자를 확정으로 올린다.
+    """
+    updatable_fields = [
+        'title', 'description', 'event_date', 'start_time', 'end_time',
+        'location', 'max_participants', 'status',
+    ]
+
+    if any(field in data for field in EVENT_SCHEDULE_FIELDS):
+        candidate = Event(
+            pk=event.pk,
+            title=data.get('title', event.title),
+            event_date=data.get('event_date', event.event_date),
+            start_time=data.get('start_time', event.start_time),
+            end_time=data.get('end_time', event.end_time),
+            location_id=data['location'].pk if 'location' in data else event.location_id,
+            status=data.get('status', event.status),
+        )
+        _event_schedule_validate(event=candidate)
+
+    event, has_updated = model_update(instance=event, fields=updatable_fields, data=data)
+
+    if has_updated and any(field in data for field in EVENT_SCHEDULE_FIELDS):
+        location_schedule_cache_invalidate()
+
+    if has_updated and 'max_participants' in data:
+        event_waitlist_promote(event_id=event.pk)
+
+    return event
+
+
+@transaction.atomic
+def event_delete(*, event: Event) -> None:
+    """이벤트 삭제 - 비워진 시간대가 장소 검색에 바로 반영되도록 캐시를 무효화"""
+    event.delete()
+    location_schedule_cache_invalidate()
+
+
+def event_schedule_conflicts(*, proposals: List[Dict[str, Any]]) -> List[Tuple[int, str, int]]:
+    """
+    여러 건의 일정 후보를 한꺼번에 중복 검사한다 (반복 일정 일괄 등록 등).
+
+    각 후보는 location_id, event_date, start_time, end_time 키를 가진 dict.
+    관련 장소/기간의 기존 이벤트를 쿼리 한 번으로 읽고 (장소, 날짜) 별
+    구간 트리를 만들어, 기존 이벤트와 다른 후보 모두를 상대로 검사한다.
+
+    Return value: (후보 인덱스, 'event' 또는 'proposal', 상대 id/인덱스) 목록
+    """
+    if not proposals:
+        return []
+
+    existing = (
+        Event.objects
+        .filter(
+            location_id__in={proposal['location_id'] for proposal in proposals},
+            event_date__in={proposal['event_date'] for proposal in proposals},
+        )
+        .exclude(status=Event.Status.CANCELLED)
+        .values_list('id', 'location_id', 'event_date', 'start_time', 'end_time')
+    )
+
+    slots = defaultdict(list)
+    for event_id, location_id, event_date, start_time, end_time in existing:
+        slots[(location_id, event_date)].append((start_time, end_time, ('event', event_id)))
+    for index, proposal in enumerate(proposals):
+        key = (proposal['location_id'], proposal['event_date'])
+        slots[key].append((proposal['start_time'], proposal['end_time'], ('proposal', index)))
+
+    trees = {key: IntervalTree(intervals) for key, intervals in slots.items()}
+
+    conflicts = []
+    for index, proposal in enumerate(proposals):
+        tree = trees[(proposal['location_id'], proposal['event_date'])]
+        for kind, other in tree.overlaps(proposal['start_time'], proposal['end_time']):
+            if kind == 'proposal' and other == index:
+                continue
+            conflicts.append((index, kind, other))
+
+    return sorted(conflicts)
+
+
+@transaction.atomic
+def event_registration_create(
+    *,
+    event: Event,
+    name: str,
+    email: str,
+    phone: str,
+    company: str,
+    how_did_you_know: str,
+    user: Optional['User'] = None,
+) -> EventRegistration:
+    """
+    이벤트 참석 신청
+
+    좌석이 남아 있으면 확정, 정원이 찼으면 대기자로 등록한다.
+    등록 INSERT가 실패하면 같은 트랜잭션의 좌석 선점도 함께 롤백된다.
+    """
+    claimed = _seat_claim(event_id=event.pk)
+
+    registration = EventRegistration(
+        event=event,
+        name=name,
+        email=email,
+        phone=phone,
+        company=company,
+        how_did_you_know=how_did_you_know,
+        user=user,
+        status=EventRegistration.Status.CONFIRMED if claimed else EventRegistration.Status.WAITLISTED,
+    )
+    # 중복 검사는 unique 제약에 맡긴다 (SELECT 없이 INSERT 한 번)
+    registration.full_clean(exclude=['event', 'user'], validate_unique=False)
+
+    try:
+        with transaction.atomic():
+            registration.save()
+    except IntegrityError:
+        raise ValidationError('이미 해당 이메일로 등록된 이벤트입니다.')
+
+    if not claimed:
+        _waitlist_count_add(event_id=event.pk, delta=1)
+
+    return registration
+
+
+@transaction.atomic
+def event_waitlist_promote(*, event_id: int) -> int:
+    """
+    남은 좌석만큼 대기자를 등록 순서대로 확정으로 올린다.
+
+    Return value: 확정으로 전환된 대기자 수
+    """
+    promoted = 0
+
+    while True:
+        candidate_id = (
+            EventRegistration.objects
+            .filter(event_id=event_id, status=EventRegistration.Status.WAITLISTED)
+            .order_by('id')
+            .values_list('id', flat=True)
+            .first()
+        )
+        if candidate_id is None or not _seat_claim(event_id=event_id):
+            break
+
+        # 다른 요청이 먼저 승격시켰다면 좌석을 돌려놓고 다음 후보를 본다
+        if EventRegistration.objects.filter(
+            pk=candidate_id, status=EventRegistration.Status.WAITLISTED
+        ).update(status=EventRegistration.Status.CONFIRMED):
+            _waitlist_count_add(event_id=event_id, delta=-1)
+            promoted += 1
+        else:
+            _seat_release(event_id=event_id)
+
+    return promoted
+
+
+@transaction.atomic
+def event_registration_cancel(*, registration: EventRegistration) -> None:
+    """참석 취소 - 확정 좌석이었다면 대기자에게 넘긴다"""
+    event_id = registration.event_id
+    was_confirmed = registration.status == EventRegistration.Status.CONFIRMED
+
+    registration.delete()
+
+    if was_confirmed:
+        _seat_release(event_id=event_id)
+        event_waitlist_promote(event_id=event_id)
+    else:
+        _waitlist_count_add(event_id=event_id, delta=-1)
+
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 100
+IMPORT_FIELDS = ('name', 'email', 'phone', 'company', 'how_did_you_know')
+
+
+def _import_row_validate(row: Dict[str, str]) -> Dict[str, str]:
+    """가져오기 행 검증 - 이름/이메일만 필수, 나머지는 빈 값 허용"""
+    data = {field: row.get(field, '') for field in IMPORT_FIELDS}
+
+    if not data['name']:
+        raise ValidationError('이름이 비어 있습니다.')
+    validate_email(data['email'])
+
+    for field in ('name', 'phone', 'company'):
+        max_length = EventRegistration._meta.get_field(field).max_length
+        if len(data[field]) > max_length:
+            raise ValidationError(f'{field} 값은 {max_length}자를 넘을 수 없습니다.')
+
+    return data
+
+
+def _import_batch_write(*, event_id: int, rows: List[Dict[str, str]]) -> Dict[str, int]:
+    """
+    한 배치를 저장한다.
+
+    이벤트 행을 잠근 상태에서 기존 (event, email) 을 한 번에 조회해 걸러내고,
+    남은 좌석만큼 확정, 나머지는 대기로 bulk_create 한다.
+    """
+    with transaction.atomic():
+        event = Event.objects.select_for_update().only('id', 'max_participants', 'registration_count').get(pk=event_id)
+
+        existing = set(
+            EventRegistration.objects
+            .filter(event_id=event_id, email__in=[row['email'] for row in rows])
+            .values_list('email', flat=True)
+        )
+        new_rows = [row for row in rows if row['email'] not in existing]
+
+        remaining = max(event.max_participants - event.registration_count, 0)
+        registrations = [
+            EventRegistration(
+                event_id=event_id,
+                status=(
+                    EventRegistration.Status.CONFIRMED if index < remaining
+                    else EventRegistration.Status.WAITLISTED
+                ),
+                **row
+            )
+            for index, row in enumerate(new_rows)
+        ]
+        EventRegistration.objects.bulk_create(registrations, ignore_conflicts=True)
+
+        # 조회 뒤 다른 요청이 먼저 등록한 이메일은 ignore_conflicts 로 빠진다 - 실제로 들어간 행만 센다.
+        # bulk_create 가 객체마다 채운 registered_at 이 같은 행이 이번에 넣은 행이다
+        ours = {(registration.email, registration.registered_at) for registration in registrations}
+        inserted = [
+            status
+            for email, registered_at, status in EventRegistration.objects
+            .filter(event_id=event_id, email__in=[registration.email for registration in registrations])
+            .values_list('email', 'registered_at', 'status')
+            if (email, registered_at) in ours
+        ]
+
+        # ignore_conflicts 로 빠진 행이 있어도 카운터가 어긋나지 않도록 실제 행 수로 맞춘다
+        Event.objects.filter(pk=event_id).update(**_registration_count_expressions(), updated_at=timezone.now())
+
+    confirmed = inserted.count(EventRegistration.Status.CONFIRMED)
+    return {
+        'created': len(inserted),
+        'confirmed': confirmed,
+        'waitlisted': len(inserted) - confirmed,
+        'duplicates': len(rows) - len(inserted),
+    }
+
+
+def event_registration_import(
+    *, event: Event, file, file_format: Optional[str] = None, batch_size: int = IMPORT_BATCH_SIZE
+) -> Dict[str, Any]:
+    """
+    구글폼/스프레드시트 명단 일괄 가져오기
+
+    파일을 한 행씩 읽어 batch_size 단위로 검증/저장한다. 배치마다 기존 이메일
+    조회 1번, bulk_create 1번이므로 행 수만큼 왕복하지 않는다.
+    이미 등록된 이메일과 파일 안의 중복 이메일은 건너뛴다.
+
+    Return value: created, confirmed, waitlisted, duplicates, invalid 건수와
+    잘못된 행 목록(errors, 최대 100건)
+
+    배치마다 따로 커밋하므로, 읽는 도중 파일이 깨져 있으면(인코딩 오류 등) 읽은 행까지 저장하고
+    결과에 error 와 stopped_at_row 를 붙여 돌려준다. 아무 행도 저장하기 전(헤더 검사 등)이면
+    ValidationError 를 그대로 낸다.
+    """
+    result: Dict[str, Any] = {
+        'created': 0, 'confirmed': 0, 'waitlisted': 0, 'duplicates': 0, 'invalid': 0, 'errors': []
+    }
+    seen_emails = set()
+    batch: List[Dict[str, str]] = []
+    written = False
+
+    def flush():
+        nonlocal written
+        for key, value in _import_batch_write(event_id=event.pk, rows=batch).items():
+            result[key] += value
+        batch.clear()
+        written = True
+
+    rows = registration_rows_iter(file=file, file_format=file_format)
+    row_number = 1  # 1행은 헤더
+    try:
+        for row_number, row in enumerate(rows, start=2):
+            try:
+                data = _import_row_validate(row)
+            except ValidationError as e:
+                result['invalid'] += 1
+                if len(result['errors']) < IMPORT_MAX_REPORTED_ERRORS:
+                    result['errors'].append({'row': row_number, 'error': ' '.join(e.messages)})
+                continue
+
+            # 파일 안에서 같은 이메일이 반복되면 첫 행만 사용
+            if data['email'] in seen_emails:
+                result['duplicates'] += 1
+                continue
+            seen_emails.add(data['email'])
+
+            batch.append(data)
+            if len(batch) >= batch_size:
+                flush()
+    except ValidationError as e:
+        if not written and not batch:
+            raise
+        # 이미 커밋한 배치가 있으므로 400 대신 여기까지 저장한 결과를 알린다
+        result['error'] = ' '.join(e.messages)
+        result['stopped_at_row'] = row_number + 1
+
+    if batch:
+        flush()
+
+    return result
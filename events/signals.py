@@ -0,0 +1,32 @@
+"""
+발표 변경 시 이벤트 대시보드 카운터 갱신
+
+발표는 뷰셋, 폼, 어드민 등 여러 경로에서 저장되므로 모델 시그널로 한곳에서 처리한다.
+"""
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from events.services import event_presentation_counts_refresh
+
+
+@receiver(post_init, sender='presentations.Presentation')
+def presentation_remember_event(sender, instance, **kwargs):
+    # 발표가 다른 이벤트로 옮겨지면 이전 이벤트 카운터도 갱신해야 한다
+    # (지연 로딩된 필드에 접근해 쿼리가 나가지 않도록 __dict__ 에서 읽는다)
+    instance._counted_event_id = instance.__dict__.get('event_id')
+
+
+@receiver(post_save, sender='presentations.Presentation')
+def presentation_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {'status', 'event'} & set(update_fields):
+        return
+
+    event_ids = {instance.event_id, getattr(instance, '_counted_event_id', None)} - {None}
+    for event_id in event_ids:
+        event_presentation_counts_refresh(event_id=event_id)
+    instance._counted_event_id = instance.event_id
+
+
+@receiver(post_delete, sender='presentations.Presentation')
+def presentation_deleted(sender, instance, **kwargs):
+    event_presentation_counts_refresh(event_id=instance.event_id)
@@ -0,0 +1,425 @@
+"""
+Event 서비스 테스트
+Django Styleguide: 서비스는 비즈니스 로직을 담으므로 철저히 테스트
+"""
+import io
+import random
+from datetime import date, time
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from events.models import Event, EventRegistration
+from events.selectors import event_registration_waitlist_position
+from common.intervals import IntervalTree
+from events.services import (
+    event_counters_reconcile, event_create, event_registration_create, event_registration_cancel,
+    event_registration_import, event_schedule_conflicts, event_update, event_waitlist_promote
+)
+from events.tests.factories import CancelledEventFactory, EventFactory, EventRegistrationFactory
+from locations.tests.factories import LocationFactory
+from users.tests.factories import UserFactory
+
+
+def _register(event, email, **kwargs):
+    return event_registration_create(
+        event=event,
+        name='김참석',
+        email=email,
+        phone='010-1234-5678',
+        company='테스트 회사',
+        how_did_you_know='친구 소개',
+        **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestEventRegistrationCreateService:
+    """event_registration_create 서비스 테스트"""
+
+    def test_registration_confirmed_while_seats_remain(self):
+        """좌석이 남아 있으면 확정 등록"""
+        event = EventFactory(max_participants=2)
+        user = UserFactory()
+
+        registration = _register(event, 'a@example.com', user=user)
+
+        event.refresh_from_db()
+        assert registration.status == EventRegistration.Status.CONFIRMED
+        assert registration.user == user
+        assert event.registration_count == 1
+        assert event_registration_waitlist_position(registration=registration) is None
+
+    def test_registration_waitlisted_when_full(self):
+        """정원이 차면 대기자로 등록되고 순번이 매겨짐"""
+        event = EventFactory(max_participants=2)
+        _register(event, 'a@example.com')
+        _register(event, 'b@example.com')
+
+        first_waiting = _register(event, 'c@example.com')
+        second_waiting = _register(event, 'd@example.com')
+
+        event.refresh_from_db()
+        assert event.registration_count == 2
+        assert event.waitlist_count == 2
+        assert first_waiting.status == EventRegistration.Status.WAITLISTED
+        assert event_registration_waitlist_position(registration=first_waiting) == 1
+        assert event_registration_waitlist_position(registration=second_waiting) == 2
+
+    def test_duplicate_email_does_not_consume_seat(self):
+        """중복 이메일 등록 실패 시 좌석 선점도 롤백"""
+        event = EventFactory(max_participants=5)
+        _register(event, 'a@example.com')
+
+        with pytest.raises(ValidationError, match='이미 해당 이메일로 등록된 이벤트입니다'):
+            _register(event, 'a@example.com')
+
+        event.refresh_from_db()
+        assert event.registration_count == 1
+        assert event.registrations.count() == 1
+
+
+@pytest.mark.django_db
+class TestEventRegistrationCancelService:
+    """event_registration_cancel / event_waitlist_promote 서비스 테스트"""
+
+    def test_cancel_confirmed_promotes_first_waitlisted(self):
+        """확정 등록 취소 시 가장 먼저 대기한 사람이 확정됨"""
+        event = EventFactory(max_participants=1)
+        confirmed = _register(event, 'a@example.com')
+        first_waiting = _register(event, 'b@example.com')
+        second_waiting = _register(event, 'c@example.com')
+
+        event_registration_cancel(registration=confirmed)
+
+        first_waiting.refresh_from_db()
+        second_waiting.refresh_from_db()
+        event.refresh_from_db()
+        assert first_waiting.status == EventRegistration.Status.CONFIRMED
+        assert second_waiting.status == EventRegistration.Status.WAITLISTED
+        assert event_registration_waitlist_position(registration=second_waiting) == 1
+        assert event.registration_count == 1
+        assert event.waitlist_count == 1
+
+    def test_cancel_waitlisted_keeps_seat_count(self):
+        """대기자 취소는 확정 좌석 수에 영향 없음"""
+        event = EventFactory(max_participants=1)
+        _register(event, 'a@example.com')
+        waiting = _register(event, 'b@example.com')
+
+        event_registration_cancel(registration=waiting)
+
+        event.refresh_from_db()
+        assert event.registration_count == 1
+        assert event.waitlist_count == 0
+        assert not EventRegistration.objects.filter(id=waiting.id).exists()
+
+    def test_promote_after_capacity_increase(self):
+        """정원 증가 후 남은 좌석만큼 대기자 승격"""
+        event = EventFactory(max_participants=1)
+        _register(event, 'a@example.com')
+        for email in ('b@example.com', 'c@example.com', 'd@example.com'):
+            _register(event, email)
+
+        Event.objects.filter(id=event.id).update(max_participants=3)
+        promoted = event_waitlist_promote(event_id=event.id)
+
+        event.refresh_from_db()
+        assert promoted == 2
+        assert event.registration_count == 3
+        assert event.registrations.filter(status=EventRegistration.Status.WAITLISTED).count() == 1
+
+
+def _csv_file(text, name='registrations.csv'):
+    return SimpleUploadedFile(name, text.encode('utf-8-sig'), content_type='text/csv')
+
+
+@pytest.mark.django_db
+class TestEventRegistrationImportService:
+    """event_registration_import 서비스 테스트"""
+
+    def test_import_google_form_csv(self):
+        """구글폼 CSV 헤더(한글) 가져오기, 정원 초과분은 대기 처리"""
+        event = EventFactory(max_participants=2)
+        csv_text = (
+            "타임스탬프,이름,이메일 주소,연락처,소속,유입 경로\n"
+            "2024. 12. 1 오후 1:00:00,김하나,one@example.com,010-1111-1111,회사A,친구\n"
+            "2024. 12. 1 오후 1:01:00,김둘,two@example.com,010-2222-2222,회사B,링크드인\n"
+            "2024. 12. 1 오후 1:02:00,김셋,three@example.com,010-3333-3333,회사C,웹사이트\n"
+        )
+
+        result = event_registration_import(event=event, file=_csv_file(csv_text))
+
+        event.refresh_from_db()
+        assert result['created'] == 3
+        assert result['confirmed'] == 2
+        assert result['waitlisted'] == 1
+        assert event.registration_count == 2
+        assert event.waitlist_count == 1
+        registration = event.registrations.get(email='one@example.com')
+        assert registration.name == '김하나'
+        assert registration.company == '회사A'
+        assert registration.how_did_you_know == '친구'
+        assert event.registrations.get(email='three@example.com').status == EventRegistration.Status.WAITLISTED
+
+    def test_import_skips_duplicates_and_invalid_rows(self):
+        """기존 등록/파일 내 중복은 건너뛰고, 잘못된 행은 행 번호와 함께 보고"""
+        event = EventFactory(max_participants=100)
+        EventRegistrationFactory(event=event, email='exists@example.com')
+        csv_text = (
+            "name,email,phone,company\n"
+            "기존,exists@example.com,,\n"
+            "신규,new@example.com,,\n"
+            "신규중복,new@example.com,,\n"
+            "잘못된메일,not-an-email,,\n"
+            ",noname@example.com,,\n"
+        )
+
+        result = event_registration_import(event=event, file=_csv_file(csv_text), batch_size=2)
+
+        assert result['created'] == 1
+        assert result['duplicates'] == 2
+        assert result['invalid'] == 2
+        assert [error['row'] for error in result['errors']] == [5, 6]
+        assert event.registrations.count() == 2
+
+    def test_import_stops_midway_with_partial_result(self):
+        """읽는 도중 파일이 깨지면 앞에서 저장한 행 수와 멈춘 위치를 돌려준다"""
+        event = EventFactory(max_participants=1000)
+        lines = ''.join(f"참가자{index},user{index}@example.com\n" for index in range(400))
+        content = ("name,email\n" + lines).encode('utf-8') + b'\xff\xfe,broken@example.com\n'
+
+        result = event_registration_import(
+            event=event, file=SimpleUploadedFile('list.csv', content, content_type='text/csv'), batch_size=50
+        )
+
+        # 디코더는 블록 단위로 읽으므로 깨진 바이트가 든 블록의 행부터 읽지 못한다
+        assert 0 < result['created'] == event.registrations.count() < 400
+        assert result['stopped_at_row'] == result['created'] + 2
+        assert 'UTF-8' in result['error']
+
+    def test_import_counts_only_inserted_rows(self, monkeypatch):
+        """조회 뒤 다른 요청이 먼저 등록한 이메일은 생성 건수에서 빠진다"""
+        event = EventFactory(max_participants=100)
+        bulk_create = EventRegistration.objects.bulk_create
+
+        def register_concurrently_then_bulk_create(objs, **kwargs):
+            # 기존 이메일 조회와 bulk_create 사이에 다른 요청이 같은 이메일로 등록한 상황
+            EventRegistrationFactory(event=event, email='race@example.com')
+            return bulk_create(objs, **kwargs)
+
+        monkeypatch.setattr(EventRegistration.objects, 'bulk_create', register_concurrently_then_bulk_create)
+        csv_text = "name,email\n경쟁,race@example.com\n신규,new@example.com\n"
+
+        result = event_registration_import(event=event, file=_csv_file(csv_text))
+
+        assert (result['created'], result['duplicates']) == (1, 1)
+        assert event.registrations.count() == 2
+
+    def test_import_requires_name_and_email_columns(self):
+        """이름/이메일 열이 없으면 가져오기 실패"""
+        event = EventFactory()
+
+        with pytest.raises(ValidationError, match='이름, 이메일 열이 있어야 합니다'):
+            event_registration_import(event=event, file=_csv_file("foo,bar\n1,2\n"))
+
+    def test_import_rejects_unknown_format(self):
+        """지원하지 않는 형식 거부"""
+        event = EventFactory()
+
+        with pytest.raises(ValidationError, match='지원하지 않는 파일 형식입니다'):
+            event_registration_import(event=event, file=_csv_file("name,email\n", name='list.txt'))
+
+    def test_import_xlsx(self):
+        """XLSX 가져오기"""
+        openpyxl = pytest.importorskip('openpyxl')
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['이름', '이메일', '전화번호'])
+        sheet.append(['김엑셀', 'excel@example.com', '010-1234-5678'])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        event = EventFactory(max_participants=10)
+
+        upload = SimpleUploadedFile('registrations.xlsx', buffer.getvalue())
+        result = event_registration_import(event=event, file=upload)
+
+        assert result['created'] == 1
+        assert event.registrations.get(email='excel@example.com').phone == '010-1234-5678'
+
+
+@pytest.mark.django_db
+class TestEventCountersService:
+    """이벤트 대시보드 카운터 테스트"""
+
+    def test_presentation_counts_follow_status_changes(self):
+        """발표 생성/상태 변경/이동/삭제 시 상태별 카운터 갱신"""
+        from presentations.models import Presentation
+        from presentations.tests.factories import PresentationFactory
+
+        event = EventFactory()
+        other_event = EventFactory()
+        presentation = PresentationFactory(event=event)
+        PresentationFactory(event=event)
+
+        event.refresh_from_db()
+        assert event.presentation_submitted_count == 2
+
+        presentation.status = Presentation.Status.SELECTED
+        presentation.save()
+        event.refresh_from_db()
+        assert event.presentation_submitted_count == 1
+        assert event.presentation_selected_count == 1
+
+        presentation.event = other_event
+        presentation.save()
+        event.refresh_from_db()
+        other_event.refresh_from_db()
+        assert event.presentation_selected_count == 0
+        assert other_event.presentation_selected_count == 1
+
+        presentation.delete()
+        other_event.refresh_from_db()
+        assert other_event.presentation_selected_count == 0
+
+    def test_reconcile_repairs_drifted_counters(self):
+        """어긋난 카운터만 실제 행 수로 복구"""
+        event = EventFactory(max_participants=1)
+        _register(event, 'a@example.com')
+        _register(event, 'b@example.com')
+        untouched = EventFactory()
+
+        Event.objects.filter(id=event.id).update(registration_count=0, waitlist_count=7)
+
+        repaired = event_counters_reconcile()
+
+        event.refresh_from_db()
+        assert repaired == 1
+        assert event.registration_count == 1
+        assert event.waitlist_count == 1
+        assert event_counters_reconcile(event_ids=[event.id, untouched.id]) == 0
+
+    def test_reconcile_command(self):
+        """reconcile_event_counters 관리 명령"""
+        from django.core.management import call_command
+
+        event = EventFactory()
+        EventRegistrationFactory(event=event)
+        out = io.StringIO()
+
+        call_command('reconcile_event_counters', stdout=out)
+
+        event.refresh_from_db()
+        assert event.registration_count == 1
+        assert '1개 이벤트의 카운터를 복구했습니다.' in out.getvalue()
+
+
+def _create_event(location, start, end, **kwargs):
+    return event_create(
+        title='스터디',
+        description='설명',
+        event_date=kwargs.pop('event_date', date(2025, 3, 1)),
+        start_time=start,
+        end_time=end,
+        location=location,
+        max_participants=10,
+        created_by=kwargs.pop('created_by', None) or UserFactory(),
+        **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestEventScheduleService:
+    """장소 중복 예약 검사 테스트"""
+
+    def test_create_rejects_overlapping_event(self):
+        """같은 장소/날짜에 시간대가 겹치면 생성 거부"""
+        location = LocationFactory()
+        _create_event(location, time(10), time(12))
+
+        with pytest.raises(ValidationError, match='이미 예약되어 있습니다'):
+            _create_event(location, time(11), time(13))
+
+    def test_create_allows_adjacent_cancelled_and_other_location(self):
+        """끝과 시작이 맞닿은 일정, 취소된 일정, 다른 장소는 겹치지 않음"""
+        location = LocationFactory()
+        _create_event(location, time(10), time(12))
+        CancelledEventFactory(location=location, event_date=date(2025, 3, 1), start_time=time(12), end_time=time(14))
+
+        _create_event(location, time(12), time(14))
+        _create_event(LocationFactory(), time(10), time(12))
+
+        assert location.events.count() == 3
+
+    def test_create_rejects_end_before_start(self):
+        """종료 시간이 시작 시간보다 빠르면 거부"""
+        with pytest.raises(ValidationError, match='종료 시간은 시작 시간보다 늦어야 합니다'):
+            _create_event(LocationFactory(), time(12), time(10))
+
+    def test_update_rechecks_schedule(self):
+        """시간 변경으로 겹치게 되면 거부, 취소된 이벤트 복구도 검사"""
+        location = LocationFactory()
+        _create_event(location, time(10), time(12))
+        other = _create_event(location, time(13), time(15))
+        cancelled = CancelledEventFactory(
+            location=location, event_date=date(2025, 3, 1), start_time=time(11), end_time=time(12)
+        )
+
+        with pytest.raises(ValidationError):
+            event_update(event=other, data={'start_time': time(11)})
+        with pytest.raises(ValidationError):
+            event_update(event=cancelled, data={'status': Event.Status.PLANNING})
+
+        updated = event_update(event=other, data={'start_time': time(12), 'title': '변경'})
+        assert updated.title == '변경'
+
+    def test_update_capacity_promotes_waitlist(self):
+        """정원 증가 시 대기자 승격"""
+        event = EventFactory(max_participants=1)
+        _register(event, 'a@example.com')
+        _register(event, 'b@example.com')
+
+        event_update(event=event, data={'max_participants': 2})
+
+        event.refresh_from_db()
+        assert event.registration_count == 2
+        assert event.waitlist_count == 0
+
+    def test_schedule_conflicts_batch(self):
+        """일괄 후보 검사 - 기존 이벤트, 후보끼리의 충돌 모두 보고"""
+        location = LocationFactory()
+        existing = _create_event(location, time(10), time(12))
+        day = date(2025, 3, 1)
+        proposals = [
+            {'location_id': location.id, 'event_date': day, 'start_time': time(11), 'end_time': time(12)},
+            {'location_id': location.id, 'event_date': day, 'start_time': time(14), 'end_time': time(16)},
+            {'location_id': location.id, 'event_date': day, 'start_time': time(15), 'end_time': time(17)},
+            {'location_id': location.id, 'event_date': date(2025, 3, 2), 'start_time': time(10), 'end_time': time(12)},
+        ]
+
+        conflicts = event_schedule_conflicts(proposals=proposals)
+
+        assert conflicts == [(0, 'event', existing.id), (1, 'proposal', 2), (2, 'proposal', 1)]
+
+
+class TestIntervalTree:
+    """IntervalTree 테스트"""
+
+    def test_matches_brute_force(self):
+        """무작위 구간에서 전수 비교와 같은 결과"""
+        rng = random.Random(0)
+        intervals = []
+        for index in range(500):
+            start = rng.randrange(0, 1000)
+            intervals.append((start, start + rng.randrange(1, 50), index))
+        tree = IntervalTree(intervals)
+
+        for _ in range(200):
+            start = rng.randrange(0, 1000)
+            end = start + rng.randrange(1, 80)
+            expected = {index for s, e, index in intervals if s < end and e > start}
+            assert set(tree.overlaps(start, end)) == expected
+
+    def test_empty_tree(self):
+        assert IntervalTree([]).overlaps(0, 10) == []
@@ -3,6 +3,7 @@ Event ViewSet 테스트
 Django Styleguide: API 뷰는 HTTP 메서드별로 테스트
 """
 import pytest
+from datetime import date, time
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -28,7 +29,7 @@ class TestEventViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
 
     def test_event_list_authenticated_access(self, authenticated_api_client):
         """인증된 사용자의 이벤트 목록 조회"""
@@ -38,7 +39,83 @@ class TestEventViewSet:
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 5
+        assert len(response.data['results']) == 5
+
+    def test_event_list_cursor_pagination(self, api_client):
+        """커서 페이지네이션으로 중복/누락 없이 전체 목록 순회"""
+        # 같은 날짜/시간을 공유하는 이벤트 포함 (id로 순서 결정)
+        for day in (1, 2, 2, 2, 3):
+            EventFactory(event_date=date(2024, 12, day), start_time=time(19, 0))
+
+        url = reverse('event-list')
+        response = api_client.get(url, {'page_size': 2})
+
+        seen = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data['results']) <= 2
+            seen.extend(item['id'] for item in response.data['results'])
+            if not response.data['next']:
+                break
+            response = api_client.get(response.data['next'])
+
+        expected = list(Event.objects.order_by('-event_date', '-start_time', '-id').values_list('id', flat=True))
+        assert seen == expected
+
+    def test_event_list_conditional_get(self, api_client, django_assert_num_queries):
+        """같은 ETag 로 다시 요청하면 집계 쿼리 한 번 후 304"""
+        EventFactory.create_batch(3)
+        url = reverse('event-list')
+
+        first = api_client.get(url)
+        assert 'no-cache' in first['Cache-Control']
+
+        with django_assert_num_queries(1):
+            second = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second['ETag'] == first['ETag']
+        assert not second.content
+
+    def test_event_etag_changes_with_registration(self, api_client):
+        """참석 신청으로 카운터가 바뀌면 목록/상세 ETag 도 바뀜"""
+        from events.services import event_registration_create
+
+        event = EventFactory(max_participants=5)
+        list_url = reverse('event-list')
+        detail_url = reverse('event-detail', kwargs={'pk': event.id})
+        list_etag = api_client.get(list_url)['ETag']
+        detail_etag = api_client.get(detail_url)['ETag']
+        assert api_client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        event_registration_create(
+            event=event, name='김참석', email='a@example.com', phone='010-1234-5678',
+            company='회사', how_did_you_know='친구'
+        )
+
+        assert api_client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code == status.HTTP_200_OK
+        response = api_client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['registration_count'] == 1
+
+    def test_event_dashboard_single_query(self, api_client, django_assert_num_queries):
+        """대시보드는 카운터 컬럼을 읽어 ETag 집계 1번 + 목록 쿼리 1번으로 조회"""
+        event = EventFactory(max_participants=10)
+        EventFactory.create_batch(3)
+        Event.objects.filter(id=event.id).update(
+            registration_count=4, waitlist_count=0, presentation_selected_count=2
+        )
+
+        url = reverse('event-dashboard')
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 4
+        row = next(item for item in response.data['results'] if item['id'] == event.id)
+        assert row['seats_remaining'] == 6
+        assert row['location_name'] == event.location.name
+        assert row['presentation_counts']['selected'] == 2
 
     def test_event_detail_anonymous_access(self, api_client):
         """비인증 사용자도 이벤트 상세 조회 가능"""
@@ -96,6 +173,27 @@ class TestEventViewSet:
         event = Event.objects.get(id=response.data['id'])
         assert event.created_by is not None
 
+    def test_event_create_rejects_double_booking(self, authenticated_api_client):
+        """같은 장소/시간대에 이미 이벤트가 있으면 400"""
+        existing = EventFactory(event_date=date(2024, 12, 25), start_time=time(19, 0), end_time=time(21, 0))
+
+        url = reverse('event-list')
+        data = {
+            'title': '겹치는 이벤트',
+            'description': '설명',
+            'event_date': '2024-12-25',
+            'start_time': '20:00:00',
+            'end_time': '22:00:00',
+            'location': existing.location_id,
+            'max_participants': 50
+        }
+
+        response = authenticated_api_client.post(url, data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert '이미 예약되어 있습니다' in response.data[0]
+        assert Event.objects.count() == 1
+
     def test_event_create_invalid_data(self, authenticated_api_client):
         """잘못된 데이터로 이벤트 생성 실패"""
         url = reverse('event-list')
@@ -157,6 +255,66 @@ class TestEventViewSet:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Event.objects.filter(id=event_id).exists()
 
+    def test_registration_import_by_event_creator(self, authenticated_api_client, test_user):
+        """이벤트 생성자는 CSV 명단을 가져올 수 있음"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        event = EventFactory(created_by=test_user, max_participants=10)
+        upload = SimpleUploadedFile(
+            'registrations.csv',
+            '이름,이메일\n김가져오기,import@example.com\n'.encode('utf-8'),
+            content_type='text/csv'
+        )
+
+        url = reverse('event-import-registrations', kwargs={'pk': event.id})
+        response = authenticated_api_client.post(url, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['created'] == 1
+        assert EventRegistration.objects.filter(event=event, email='import@example.com').exists()
+
+    def test_registration_import_requires_manager(self, authenticated_api_client):
+        """생성자/어드민이 아니면 가져오기 불가"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        event = EventFactory()
+        upload = SimpleUploadedFile('registrations.csv', b'name,email\n')
+
+        url = reverse('event-import-registrations', kwargs={'pk': event.id})
+        response = authenticated_api_client.post(url, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_registration_export_streams_csv(self, authenticated_api_client, test_user):
+        """참석자 명단 CSV 스트리밍 다운로드 (확정자 먼저)"""
+        event = EventFactory(created_by=test_user)
+        EventRegistrationFactory(event=event, name='김대기', status=EventRegistration.Status.WAITLISTED)
+        EventRegistrationFactory(event=event, name='김확정', email='confirmed@example.com')
+        EventRegistrationFactory(name='다른 이벤트')
+
+        url = reverse('event-export-registrations', kwargs={'pk': event.id})
+        response = authenticated_api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Disposition'] == f'attachment; filename="event_{event.id}_registrations.csv"'
+
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        assert lines[0] == '이름,이메일,전화번호,회사,유입 경로,상태,등록일'
+        assert len(lines) == 3
+        assert lines[1].startswith('김확정,confirmed@example.com,')
+        assert ',확정,' in lines[1]
+        assert lines[2].startswith('김대기,')
+
+    def test_registration_export_requires_manager(self, authenticated_api_client):
+        """생성자/어드민이 아니면 명단 다운로드 불가"""
+        event = EventFactory()
+
+        url = reverse('event-export-registrations', kwargs={'pk': event.id})
+        response = authenticated_api_client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
 
 @pytest.mark.django_db
 class TestEventRegistrationViewSet:
@@ -170,7 +328,25 @@ class TestEventRegistrationViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
+
+    def test_registration_list_cursor_pagination(self, api_client):
+        """등록 목록은 최신 등록순 커서 페이지네이션"""
+        EventRegistrationFactory.create_batch(5)
+
+        url = reverse('eventregistration-list')
+        response = api_client.get(url, {'page_size': 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
+        assert response.data['next'] is not None
+
+        next_response = api_client.get(response.data['next'])
+        assert len(next_response.data['results']) == 2
+        assert next_response.data['next'] is None
+
+        ids = [item['id'] for item in response.data['results'] + next_response.data['results']]
+        assert ids == sorted(ids, reverse=True)
 
     def test_registration_detail_anonymous_access(self, api_client):
         """비인증 사용자도 등록 상세 조회 가능"""
@@ -219,4 +395,26 @@ class TestEventRegistrationViewSet:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['name'] == '김회원'
-        assert response.data['user'] == test_user.id  # 회원
\ No newline at end of file
+        assert response.data['user'] == test_user.id  # 회원
+
+    def test_registration_create_waitlisted_when_full(self, authenticated_api_client):
+        """정원이 찬 이벤트에 등록하면 대기 순번 반환"""
+        event = EventFactory(max_participants=1)
+        EventRegistrationFactory(event=event, status=EventRegistration.Status.CONFIRMED)
+        Event.objects.filter(id=event.id).update(registration_count=1)
+
+        url = reverse('eventregistration-list')
+        data = {
+            'event': event.id,
+            'name': '김대기',
+            'email': 'waiting@example.com',
+            'phone': '010-9999-8888',
+            'company': '회원 회사',
+            'how_did_you_know': '웹사이트'
+        }
+
+        response = authenticated_api_client.post(url, data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['status'] == EventRegistration.Status.WAITLISTED
+        assert response.data['waitlist_position'] == 1
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from events.views import EventViewSet, EventRegistrationViewSet
+from events.views import EventListAsyncApi, EventViewSet, EventRegistrationViewSet
 
 router = DefaultRouter()
 router.register(r'events', EventViewSet)
@@ -8,4 +8,10 @@ router.register(r'registrations', EventRegistrationViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
-] 
\ No newline at end of file
+] 
+
+# ASGI 배포(config.asgi_urls)용 - 이벤트 목록을 같은 경로/이름의 async 뷰로 먼저 매칭
+asgi_urlpatterns = [
+    path('events/', EventListAsyncApi.as_view(), name='event-list'),
+    *urlpatterns,
+]
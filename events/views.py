@@ -1,25 +1,179 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, serializers, status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from common.async_apis import AsyncApiView
+from common.mixins import ConditionalListRetrieveMixin
+from events.exporters import registration_csv_iter
 from events.models import Event, EventRegistration
-from events.serializers import EventSerializer, EventRegistrationSerializer
+from events.serializers import (
+    EventSerializer,
+    EventRegistrationSerializer,
+    EventRegistrationImportSerializer,
+    EventDashboardSerializer,
+)
+from events.pagination import EventCursorPagination, EventRegistrationCursorPagination
+from events.selectors import event_dashboard_list, event_registration_waitlist_position
+from events.services import (
+    event_create,
+    event_delete,
+    event_update,
+    event_registration_create,
+    event_registration_cancel,
+    event_registration_import,
+)
+from users.models import User
 
 
-class EventViewSet(viewsets.ModelViewSet):
+def _can_manage_event(user, event) -> bool:
+    """이벤트 생성자 또는 어드민"""
+    return event.created_by_id == user.id or user.user_type == User.UserType.ADMIN
+
+
+class EventViewSet(ConditionalListRetrieveMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = EventCursorPagination
+
+    def get_validator_aggregates(self):
+        aggregates = super().get_validator_aggregates()
+        if self.action == 'dashboard':
+            # 대시보드에는 장소 이름도 보인다
+            aggregates['location_last_updated'] = Max('location__updated_at')
+        return aggregates
 
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user)
+        try:
+            serializer.instance = event_create(**serializer.validated_data, created_by=self.request.user)
+        except ValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
+    def perform_update(self, serializer):
+        try:
+            serializer.instance = event_update(event=serializer.instance, data=serializer.validated_data)
+        except ValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
+    def perform_destroy(self, instance):
+        event_delete(event=instance)
+
+    @action(detail=False, methods=['get'])
+    def dashboard(self, request):
+        """대시보드 - 이벤트별 참석/대기/잔여 좌석, 발표 상태별 수"""
+        events = event_dashboard_list()
+        self.check_not_modified(events)
+
+        page = self.paginate_queryset(events)
+        serializer = EventDashboardSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=['post'],
+        url_path='registrations/import',
+        parser_classes=[MultiPartParser],
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def import_registrations(self, request, pk=None):
+        """구글폼/스프레드시트 참석자 명단 일괄 가져오기 (CSV, XLSX)"""
+        event = self.get_object()
+        if not _can_manage_event(request.user, event):
+            return Response(
+                {'error': '이벤트 생성자 또는 어드민만 명단을 가져올 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = EventRegistrationImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = event_registration_import(event=event, file=serializer.validated_data['file'])
+        except ValidationError as e:
+            return Response({'error': ' '.join(e.messages)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 읽는 도중 멈췄으면 이미 저장한 배치가 있으므로 400 이 아니라 error/stopped_at_row 가 붙은 결과
+        return Response(result)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='registrations/export',
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def export_registrations(self, request, pk=None):
+        """참석자 명단 CSV 다운로드 (스트리밍)"""
+        event = self.get_object()
+        if not _can_manage_event(request.user, event):
+            return Response(
+                {'error': '이벤트 생성자 또는 어드민만 명단을 내려받을 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
 
+        response = StreamingHttpResponse(
+            registration_csv_iter(event_id=event.id),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="event_{event.id}_registrations.csv"'
+        return response
 
+
+class EventListAsyncApi(AsyncApiView):
+    """EventViewSet.list 의 async 버전 (ASGI 배포용, config.asgi_urls) - 생성(POST)은 EventViewSet 이 처리"""
+    sync_view = EventViewSet.as_view({'get': 'list', 'post': 'create'}, basename='event', detail=False)
+
+    async def get(self, request):
+        events = Event.objects.all()
+        await self.acheck_not_modified(events)
+
+        paginator = EventCursorPagination()
+        # 커서 해석/다음 위치 계산은 DRF 구현을 그대로 쓰고, 페이지 조회 한 번만 ORM 스레드에서 실행한다
+        page = await sync_to_async(paginator.paginate_queryset)(events, Request(request))
+        return self.render({
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'results': EventSerializer(page, many=True).data,
+        })
+
+
+# ConditionalListRetrieveMixin 을 쓰지 않는다 - EventRegistration 에는 updated_at 이 없고,
+# 이름/연락처 수정(PATCH)은 pk/행 수/상태를 바꾸지 않아 그 값으로 만든 ETag 는 수정을 놓친다.
+# 대기자 승격도 queryset.update() 로 상태만 바꾸므로 auto_now 필드를 더해도 갱신되지 않는다.
 class EventRegistrationViewSet(viewsets.ModelViewSet):
     queryset = EventRegistration.objects.all()
     serializer_class = EventRegistrationSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = EventRegistrationCursorPagination
 
-    def perform_create(self, serializer):
-        if self.request.user.is_authenticated:
-            serializer.save(user=self.request.user)
-        else:
-            serializer.save()
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user if request.user.is_authenticated else None
+
+        try:
+            registration = event_registration_create(**serializer.validated_data, user=user)
+        except ValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
+        response_data = {
+            **self.get_serializer(registration).data,
+            'waitlist_position': event_registration_waitlist_position(registration=registration),
+        }
+        return Response(response_data, status=status.HTTP_201_CREATED)
+
+    def perform_update(self, serializer):
+        # 좌석 카운터가 이벤트별로 관리되므로 등록 후 이벤트 변경은 허용하지 않는다
+        event = serializer.validated_data.get('event')
+        if event is not None and event.pk != serializer.instance.event_id:
+            raise serializers.ValidationError({'event': '등록 후에는 이벤트를 변경할 수 없습니다.'})
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        event_registration_cancel(registration=instance)
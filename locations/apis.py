@@ -2,10 +2,18 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
 from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
+from common.async_apis import AsyncApiView
+from common.cache import cache_version_get
+from common.mixins import ConditionalGetMixin
+from common.serializers import compile_serializer
 from locations.services import location_create, location_update, location_delete
-from locations.selectors import location_list, location_get, location_get_suitable_for_participants
+from locations.selectors import (
+    LOCATION_SCHEDULE_CACHE,
+    alocation_list, location_list, location_get, location_get_suitable_for_participants, location_availability
+)
 from locations.models import Location
 from users.models import User
 
@@ -49,7 +57,7 @@ class LocationCreateApi(APIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class LocationListApi(APIView):
+class LocationListApi(ConditionalGetMixin, APIView):
     """장소 목록 API"""
     permission_classes = [IsAuthenticated]
 
@@ -72,12 +80,30 @@ class LocationListApi(APIView):
         filter_serializer.is_valid(raise_exception=True)
 
         location = location_list(filters=filter_serializer.validated_data)
+        self.check_not_modified(location)
 
-        data = self.OutputSerializer(location, many=True).data  # many=True는 여러 객체 직렬화할 때 사용
+        data = compile_serializer(self.OutputSerializer).many(location)
         return Response(data)
 
 
-class LocationDetailApi(APIView):
+class LocationListAsyncApi(AsyncApiView):
+    """장소 목록 API - async 버전 (ASGI 배포용, config.asgi_urls)"""
+    login_required = True
+    sync_view = LocationListApi.as_view()
+
+    async def get(self, request):
+        filter_serializer = LocationListApi.FilterSerializer(data=request.GET)
+        filter_serializer.is_valid(raise_exception=True)
+        filters = filter_serializer.validated_data
+
+        await self.acheck_not_modified(location_list(filters=filters))
+
+        locations = await alocation_list(filters=filters)
+        data = compile_serializer(LocationListApi.OutputSerializer).many(locations)
+        return self.render(data)
+
+
+class LocationDetailApi(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     # URL parameter는 path에서 받으므로 FilterSerializer 불필요
@@ -99,6 +125,7 @@ class LocationDetailApi(APIView):
                 {'error': '장소를 찾을 수 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        self.check_object_not_modified(location)
 
         data = self.OutputSerializer(location).data
         return Response(data)
@@ -184,25 +211,103 @@ class LocationDeleteApi(APIView):
 
 
 class LocationSuitableApi(APIView):
-    """수용 인원 기준 적절한 장소 목록 API"""
+    """수용 인원 기준 적절한 장소 목록 API (날짜/시간대를 주면 비어 있는 장소만)"""
     permission_classes = [IsAuthenticated]
 
+    CACHE_TIMEOUT = 300
+
     class FilterSerializer(serializers.Serializer):
         participant_count = serializers.IntegerField(min_value=1)
+        event_date = serializers.DateField(required=False)
+        start_time = serializers.TimeField(required=False)
+        end_time = serializers.TimeField(required=False)
+
+        def validate(self, attrs):
+            window = [attrs.get(field) for field in ('event_date', 'start_time', 'end_time')]
+            if any(value is not None for value in window) and None in window:
+                raise serializers.ValidationError('event_date, start_time, end_time 은 함께 지정해야 합니다.')
+            if attrs.get('start_time') is not None and attrs['end_time'] <= attrs['start_time']:
+                raise serializers.ValidationError('종료 시간은 시작 시간보다 늦어야 합니다.')
+            return attrs
 
     class OutputSerializer(serializers.Serializer):
         id = serializers.IntegerField()
         name = serializers.CharField()
         max_capacity = serializers.IntegerField()
         display_capacity = serializers.CharField()
+        spare_capacity = serializers.IntegerField()
 
     def get(self, request):
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
+        filters = filter_serializer.validated_data
+
+        # 날짜/시간대 버킷별 결과 캐시 - 이벤트/장소가 바뀌면 세대 번호가 올라가 자동 무효화
+        cache_key = None
+        if 'event_date' in filters:
+            cache_key = 'locations:suitable:{version}:{event_date}:{start_time}-{end_time}:{participant_count}'.format(
+                version=cache_version_get(name=LOCATION_SCHEDULE_CACHE), **filters
+            )
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data)
+
+        location = location_get_suitable_for_participants(**filters)
+
+        data = compile_serializer(self.OutputSerializer).many(location)
+        if cache_key is not None:
+            cache.set(cache_key, data, self.CACHE_TIMEOUT)
+        return Response(data)
+
+
+class LocationAvailabilityApi(APIView):
+    """장소 예약 현황 API - 기간 내 날짜별 예약된 시간대"""
+    permission_classes = [IsAuthenticated]
+
+    MAX_RANGE_DAYS = 92
+
+    class FilterSerializer(serializers.Serializer):
+        start_date = serializers.DateField()
+        end_date = serializers.DateField()
+
+        def validate(self, attrs):
+            if attrs['end_date'] < attrs['start_date']:
+                raise serializers.ValidationError('종료일은 시작일보다 빠를 수 없습니다.')
+            if (attrs['end_date'] - attrs['start_date']).days >= LocationAvailabilityApi.MAX_RANGE_DAYS:
+                raise serializers.ValidationError(
+                    f'조회 기간은 최대 {LocationAvailabilityApi.MAX_RANGE_DAYS}일입니다.'
+                )
+            return attrs
+
+    class OutputSerializer(serializers.Serializer):
+        class BookedSerializer(serializers.Serializer):
+            event_id = serializers.IntegerField()
+            title = serializers.CharField()
+            start_time = serializers.TimeField()
+            end_time = serializers.TimeField()
+
+        date = serializers.DateField()
+        booked = BookedSerializer(many=True)
+
+    def get(self, request, location_id):
+        try:
+            location = location_get(location_id=location_id)
+        except Location.DoesNotExist:
+            return Response(
+                {'error': '장소를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        filter_serializer = self.FilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
 
-        location = location_get_suitable_for_participants(
-            participant_count=filter_serializer.validated_data['participant_count']
+        availability = location_availability(
+            location=location,
+            date_range=(
+                filter_serializer.validated_data['start_date'],
+                filter_serializer.validated_data['end_date'],
+            )
         )
 
-        data = self.OutputSerializer(location, many=True).data
-        return Response(data)
\ No newline at end of file
+        data = self.OutputSerializer(availability, many=True).data
+        return Response(data)
@@ -1,38 +1,99 @@
 from re import search
 
-from django.db.models import QuerySet,Q
-from typing import Optional
+from datetime import date, time, timedelta
+from django.db.models import Exists, F, OuterRef, QuerySet, Q
+from typing import Dict, List, Optional, Tuple
 
+from common.search import search_filter
+from events.models import Event
 from locations.models import Location
 
+# 장소 예약/수용 인원 관련 캐시의 세대 이름 (locations.services.location_schedule_cache_invalidate 로 무효화)
+LOCATION_SCHEDULE_CACHE = 'location_schedule'
+
 def location_list(*,filters:Optional[dict] = None) -> QuerySet[Location]:
     filters = filters or {}
 
     qs = Location.objects.all()
 
-    if 'search' in filters:
-        search_term = filters['search']
-        qs = qs.filter(
-            Q(name__icontains=search_term) | # __icontains는 뭘까?
-            Q(address__icontains=search_term) |
-            Q(description__icontains=search_term)
-        )
     if 'min_capacity' in filters:
         qs = qs.filter(max_capacity__gte=filters['min_capacity']) # __gte는 뭘까?
 
+    if 'search' in filters:
+        # 이름/주소/설명 전문 검색 (common.search), 관련도 순
+        return search_filter(qs, filters['search']).order_by('-search_rank', 'name')
+
     return qs.order_by('name')
 
+async def alocation_list(*, filters: Optional[dict] = None) -> List[Location]:
+    """location_list 의 async 버전 (async 뷰용) - async for 로 평가한 목록"""
+    return [location async for location in location_list(filters=filters)]
+
 def location_get(*,location_id:int) -> Location:
     return Location.objects.get(id=location_id)
 
 def location_get_by_name(*,name:str) -> Location:
     return Location.objects.get(name=name)
 
-def location_get_suitable_for_participants(*,participant_count:int) -> QuerySet[Location]:
-    return Location.objects.filter(max_capacity__gte=participant_count).order_by('max_capacity', 'name')
+def location_get_suitable_for_participants(
+    *,
+    participant_count: int,
+    event_date: Optional[date] = None,
+    start_time: Optional[time] = None,
+    end_time: Optional[time] = None,
+) -> QuerySet[Location]:
+    """
+    수용 인원이 충분한 장소 목록 (남는 좌석이 적은 순)
+
+    event_date 와 시간대를 함께 주면 해당 시간대에 취소되지 않은 이벤트가 있는 장소를
+    NOT EXISTS 서브쿼리로 제외한다. 장소마다 일정을 따로 조회하지 않고 쿼리 한 번으로 끝난다.
+    """
+    qs = Location.objects.filter(max_capacity__gte=participant_count)
+
+    if event_date is not None:
+        booked = Event.objects.filter(
+            location=OuterRef('pk'),
+            event_date=event_date,
+            start_time__lt=end_time,
+            end_time__gt=start_time,
+        ).exclude(status=Event.Status.CANCELLED)
+        qs = qs.filter(~Exists(booked))
+
+    return qs.annotate(
+        spare_capacity=F('max_capacity') - participant_count
+    ).order_by('max_capacity', 'name')
 
 
+def location_availability(*, location: Location, date_range: Tuple[date, date]) -> List[Dict]:
+    """
+    기간 내 날짜별 예약 현황
 
+    date_range 는 (시작일, 종료일) 이며 양 끝을 포함한다. 취소된 이벤트는 제외하고
+    (location, event_date, start_time) 인덱스 순서 그대로 쿼리 한 번으로 읽는다.
 
+    Return value: [{'date': 날짜, 'booked': [{'event_id', 'title', 'start_time', 'end_time'}, ...]}, ...]
+    예약이 없는 날짜도 빈 booked 목록으로 포함된다.
+    """
+    start_date, end_date = date_range
 
+    booked_by_date: Dict[date, List[Dict]] = {}
+    rows = (
+        Event.objects
+        .filter(location=location, event_date__range=(start_date, end_date))
+        .exclude(status=Event.Status.CANCELLED)
+        .order_by('event_date', 'start_time')
+        .values_list('id', 'title', 'event_date', 'start_time', 'end_time')
+    )
+    for event_id, title, event_date, start_time, end_time in rows:
+        booked_by_date.setdefault(event_date, []).append({
+            'event_id': event_id,
+            'title': title,
+            'start_time': start_time,
+            'end_time': end_time,
+        })
 
+    days = (end_date - start_date).days + 1
+    return [
+        {'date': day, 'booked': booked_by_date.get(day, [])}
+        for day in (start_date + timedelta(days=offset) for offset in range(days))
+    ]
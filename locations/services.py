@@ -3,8 +3,10 @@ from typing import Dict,TYPE_CHECKING
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
+from common.cache import cache_version_bump
 from common.services import model_update
 from locations.models import Location
+from locations.selectors import LOCATION_SCHEDULE_CACHE
 
 if TYPE_CHECKING:
     from locations.models import Location
@@ -13,6 +15,11 @@ else:
     from locations.models import Location
 
 
+def location_schedule_cache_invalidate() -> None:
+    """장소 예약 현황 캐시 무효화 - 트랜잭션이 커밋된 뒤에 세대를 올린다"""
+    transaction.on_commit(lambda: cache_version_bump(name=LOCATION_SCHEDULE_CACHE))
+
+
 @transaction.atomic
 def location_create(*,name:str,address:str,max_capacity:int,description:str="")-> Location:
     if Location.objects.filter(name=name).exists(): # 이렇게 하는 이유가 뭐지?
@@ -22,6 +29,7 @@ def location_create(*,name:str,address:str,max_capacity:int,description:str="")-
 
     location.full_clean()
     location.save()
+    location_schedule_cache_invalidate()
 
     return location
 
@@ -37,7 +45,7 @@ def location_update(*, location:Location, data:Dict)-> Location:
     )
     if has_updated:
         # 예: 장소 정보 변경 알림, 로깅 등
-        pass
+        location_schedule_cache_invalidate()
         # _notify_location_updated(updated_location)
 
     return updated_location
@@ -52,3 +60,4 @@ def location_delete(*, location: Location) -> None:
         raise ValidationError("이벤트가 연결된 장소는 삭제할 수 없습니다.")
 
     location.delete()
+    location_schedule_cache_invalidate()
@@ -123,6 +123,24 @@ class TestLocationListApi:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 2
 
+    def test_location_list_conditional_get(self, authenticated_api_client):
+        """목록 ETag - 변경 없으면 304, 장소 추가/수정 후엔 200"""
+        location = LocationFactory(name='마루180')
+        url = reverse('locations:list')
+        etag = authenticated_api_client.get(url)['ETag']
+
+        assert authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        location.description = '변경'
+        location.save()
+        response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        LocationFactory()
+        assert authenticated_api_client.get(
+            url, HTTP_IF_NONE_MATCH=response['ETag']
+        ).status_code == status.HTTP_200_OK
+
     def test_location_list_with_capacity_filter(self, authenticated_api_client):
         """수용인원 필터가 적용된 장소 목록 조회"""
         SmallLocationFactory(max_capacity=30)
@@ -292,6 +310,59 @@ class TestLocationSuitableApi:
         assert 50 in capacities
         assert 200 in capacities
 
+    def test_location_suitable_excludes_booked_locations(self, authenticated_api_client):
+        """날짜/시간대를 주면 겹치는 이벤트가 있는 장소 제외, 남는 좌석이 적은 순"""
+        from datetime import date, time
+        from events.tests.factories import EventFactory, CancelledEventFactory
+
+        booked = SmallLocationFactory(name='회의실A', max_capacity=40)
+        freed = SmallLocationFactory(name='회의실B', max_capacity=50)
+        free = LargeLocationFactory(name='대강당', max_capacity=200)
+        EventFactory(location=booked, event_date=date(2025, 3, 1), start_time=time(18), end_time=time(20))
+        CancelledEventFactory(location=freed, event_date=date(2025, 3, 1), start_time=time(18), end_time=time(20))
+        EventFactory(location=free, event_date=date(2025, 3, 1), start_time=time(10), end_time=time(12))
+
+        url = reverse('locations:suitable')
+        response = authenticated_api_client.get(url, {
+            'participant_count': 30,
+            'event_date': '2025-03-01',
+            'start_time': '19:00',
+            'end_time': '21:00',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [loc['name'] for loc in response.data] == ['회의실B', '대강당']
+        assert [loc['spare_capacity'] for loc in response.data] == [20, 170]
+
+    def test_location_suitable_cache_invalidated_by_new_event(
+        self, authenticated_api_client, django_capture_on_commit_callbacks
+    ):
+        """캐시된 결과도 이벤트 생성이 커밋되면 다시 계산"""
+        from datetime import date, time
+        from events.services import event_create
+
+        location = SmallLocationFactory(name='회의실A', max_capacity=40)
+        url = reverse('locations:suitable')
+        params = {'participant_count': 30, 'event_date': '2025-03-01', 'start_time': '19:00', 'end_time': '21:00'}
+
+        assert len(authenticated_api_client.get(url, params).data) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            event_create(
+                title='스터디', description='설명', event_date=date(2025, 3, 1), start_time=time(18),
+                end_time=time(20), location=location, max_participants=10, created_by=UserFactory()
+            )
+
+        assert authenticated_api_client.get(url, params).data == []
+
+    def test_location_suitable_requires_full_window(self, authenticated_api_client):
+        """날짜만 주고 시간대를 빠뜨리면 400"""
+        url = reverse('locations:suitable')
+
+        response = authenticated_api_client.get(url, {'participant_count': 30, 'event_date': '2025-03-01'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_location_suitable_missing_parameter(self, authenticated_api_client):
         """필수 파라미터 누락"""
         url = reverse('locations:suitable')
@@ -309,6 +380,40 @@ class TestLocationSuitableApi:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+class TestLocationAvailabilityApi:
+    """LocationAvailabilityApi 테스트"""
+
+    def test_location_availability_lists_booked_slots(self, authenticated_api_client):
+        """날짜별 예약 시간대, 취소된 이벤트 제외"""
+        from datetime import date, time
+        from events.tests.factories import EventFactory, CancelledEventFactory
+
+        location = LocationFactory()
+        event = EventFactory(location=location, event_date=date(2025, 3, 2), start_time=time(10), end_time=time(12))
+        CancelledEventFactory(location=location, event_date=date(2025, 3, 2), start_time=time(13), end_time=time(15))
+        EventFactory(event_date=date(2025, 3, 2))  # 다른 장소
+
+        url = reverse('locations:availability', kwargs={'location_id': location.id})
+        response = authenticated_api_client.get(url, {'start_date': '2025-03-01', 'end_date': '2025-03-03'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [day['date'] for day in response.data] == ['2025-03-01', '2025-03-02', '2025-03-03']
+        assert response.data[0]['booked'] == []
+        assert response.data[1]['booked'] == [
+            {'event_id': event.id, 'title': event.title, 'start_time': '10:00:00', 'end_time': '12:00:00'}
+        ]
+
+    def test_location_availability_rejects_reversed_range(self, authenticated_api_client):
+        """종료일이 시작일보다 빠르면 400"""
+        location = LocationFactory()
+        url = reverse('locations:availability', kwargs={'location_id': location.id})
+
+        response = authenticated_api_client.get(url, {'start_date': '2025-03-03', 'end_date': '2025-03-01'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 # Pytest fixtures
 @pytest.fixture
 def api_client():
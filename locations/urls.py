@@ -3,10 +3,12 @@ from django.urls import path, include
 from .apis import (
     LocationCreateApi,
     LocationListApi,
+    LocationListAsyncApi,
     LocationDetailApi,
     LocationUpdateApi,
     LocationDeleteApi,
-    LocationSuitableApi
+    LocationSuitableApi,
+    LocationAvailabilityApi
 )
 
 # Django Styleguide 패턴: 작업별 URL 분리
@@ -17,8 +19,18 @@ location_patterns = [
     path('<int:location_id>/', LocationDetailApi.as_view(), name='detail'),
     path('<int:location_id>/update/', LocationUpdateApi.as_view(), name='update'),
     path('<int:location_id>/delete/', LocationDeleteApi.as_view(), name='delete'),
+    path('<int:location_id>/availability/', LocationAvailabilityApi.as_view(), name='availability'),
 ]
 
 urlpatterns = [
     path('', include((location_patterns, 'locations'))),  # 'locations' namespace 추가
-]
\ No newline at end of file
+]
+
+# ASGI 배포(config.asgi_urls)용 - 목록 API 를 같은 경로/이름의 async 뷰로 먼저 매칭
+async_location_patterns = [
+    path('', LocationListAsyncApi.as_view(), name='list'),
+]
+
+asgi_urlpatterns = [
+    path('', include((async_location_patterns + location_patterns, 'locations'))),
+]
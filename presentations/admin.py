@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Presentation, PresentationComment
+from .models import Presentation, PresentationComment, PresentationPreviewJob
 
 @admin.register(Presentation)
 class PresentationAdmin(admin.ModelAdmin):
@@ -10,4 +10,10 @@ class PresentationAdmin(admin.ModelAdmin):
 @admin.register(PresentationComment)
 class PresentationCommentAdmin(admin.ModelAdmin):
     list_display = ('id', 'presentation', 'author_name', 'created_at')
-    search_fields = ('presentation__title', 'author_name') 
\ No newline at end of file
+    search_fields = ('presentation__title', 'author_name') 
+@admin.register(PresentationPreviewJob)
+class PresentationPreviewJobAdmin(admin.ModelAdmin):
+    list_display = ('file_sha256', 'status', 'attempts', 'run_after', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('file_sha256',)
+    readonly_fields = ('last_error',)
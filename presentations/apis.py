@@ -0,0 +1,148 @@
+"""
+발표 자료 조각 업로드 API (presentations.services 참고)
+
+    POST   uploads/                       {presentation, filename, size} → 201, Location
+    HEAD   uploads/<id>/                  Upload-Offset / Upload-Length 헤더로 받은 위치 확인
+    PATCH  uploads/<id>/                  Content-Type: application/offset+octet-stream,
+                                          Upload-Offset 헤더 위치부터 본문을 이어 쓴다 → 204
+    POST   uploads/<id>/finalize/         Presentation.file_url 에 붙인다 → 발표 응답
+    DELETE uploads/<id>/                  업로드 취소
+"""
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from presentations.models import Presentation
+from presentations.selectors import presentation_upload_get
+from presentations.serializers import PresentationSerializer
+from presentations.services import (
+    presentation_upload_append,
+    presentation_upload_create,
+    presentation_upload_delete,
+    presentation_upload_finalize,
+)
+from users.models import User
+
+UPLOAD_CONTENT_TYPE = 'application/offset+octet-stream'
+
+# 서비스 ValidationError code → 응답 상태
+STATUS_BY_ERROR_CODE = {
+    'conflict': status.HTTP_409_CONFLICT,
+    'too_large': status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+}
+
+
+def _error_response(error: ValidationError) -> Response:
+    return Response(
+        {'error': error.messages[0]},
+        status=STATUS_BY_ERROR_CODE.get(error.code, status.HTTP_400_BAD_REQUEST),
+    )
+
+
+def _upload_headers(upload) -> dict:
+    return {
+        'Upload-Offset': str(upload.offset),
+        'Upload-Length': str(upload.size),
+        'Cache-Control': 'no-store',
+    }
+
+
+class PresentationUploadCreateApi(APIView):
+    """조각 업로드 시작 - 발표자 본인 또는 어드민"""
+    permission_classes = [IsAuthenticated]
+
+    class InputSerializer(serializers.Serializer):
+        presentation = serializers.IntegerField()
+        filename = serializers.CharField(max_length=255)
+        size = serializers.IntegerField(min_value=1)
+
+    class OutputSerializer(serializers.Serializer):
+        id = serializers.UUIDField()
+        presentation = serializers.IntegerField(source='presentation_id')
+        filename = serializers.CharField()
+        size = serializers.IntegerField()
+        offset = serializers.IntegerField()
+        expires_at = serializers.DateTimeField()
+
+    def post(self, request):
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        presentation = get_object_or_404(Presentation, pk=serializer.validated_data['presentation'])
+        if presentation.presenter_id != request.user.id and request.user.user_type != User.UserType.ADMIN:
+            raise PermissionDenied('발표자 본인만 자료를 올릴 수 있습니다.')
+
+        try:
+            upload = presentation_upload_create(
+                presentation=presentation,
+                uploaded_by=request.user,
+                filename=serializer.validated_data['filename'],
+                size=serializer.validated_data['size'],
+            )
+        except ValidationError as e:
+            return _error_response(e)
+
+        headers = {**_upload_headers(upload), 'Location': reverse('presentation-upload', args=[upload.id])}
+        return Response(self.OutputSerializer(upload).data, status=status.HTTP_201_CREATED, headers=headers)
+
+
+class PresentationUploadApi(APIView):
+    """업로드 상태(GET/HEAD), 조각 쓰기(PATCH), 취소(DELETE)"""
+    permission_classes = [IsAuthenticated]
+
+    def get_upload(self, upload_id):
+        upload = presentation_upload_get(upload_id=upload_id, user=self.request.user)
+        if upload is None:
+            raise Http404('업로드를 찾을 수 없습니다.')
+        return upload
+
+    def get(self, request, upload_id):
+        upload = self.get_upload(upload_id)
+        data = PresentationUploadCreateApi.OutputSerializer(upload).data
+        return Response(data, headers=_upload_headers(upload))
+
+    def patch(self, request, upload_id):
+        upload = self.get_upload(upload_id)
+        if request.content_type != UPLOAD_CONTENT_TYPE:
+            return Response(
+                {'error': f'Content-Type 은 {UPLOAD_CONTENT_TYPE} 이어야 합니다.'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except (KeyError, ValueError):
+            return Response({'error': 'Upload-Offset 헤더가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # request.data 를 읽지 않으므로 본문은 파서를 거치지 않고 디스크로 바로 간다
+            upload = presentation_upload_append(
+                upload=upload, offset=offset, length=length, stream=request.stream,
+            )
+        except ValidationError as e:
+            return _error_response(e)
+
+        return Response(status=status.HTTP_204_NO_CONTENT, headers=_upload_headers(upload))
+
+    def delete(self, request, upload_id):
+        presentation_upload_delete(upload=self.get_upload(upload_id))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class PresentationUploadFinalizeApi(PresentationUploadApi):
+    """다 받은 파일을 발표에 붙인다"""
+    http_method_names = ['post', 'options']
+
+    def post(self, request, upload_id):
+        try:
+            presentation = presentation_upload_finalize(upload=self.get_upload(upload_id))
+        except ValidationError as e:
+            return _error_response(e)
+
+        return Response(PresentationSerializer(presentation, context={'request': request}).data)
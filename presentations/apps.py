@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PresentationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'presentations'
+    verbose_name = '발표'
+
+    def ready(self):
+        import presentations.signals  # noqa: F401
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from presentations.services import presentation_file_gc
+
+
+class Command(BaseCommand):
+    help = '어떤 발표도 가리키지 않는 발표 자료 파일을 지웁니다. cron 등으로 주기적으로 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace', type=int, default=None,
+            help='마지막으로 쓰인 지 이 시간(초)이 지난 파일만 지웁니다 (기본 PRESENTATION_FILE_GC_GRACE)',
+        )
+
+    def handle(self, *args, grace, **options):
+        deleted = presentation_file_gc(grace_seconds=grace)
+        self.stdout.write(self.style.SUCCESS(f'참조되지 않는 파일 {deleted}개를 지웠습니다.'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from presentations.services import presentation_upload_purge_expired
+
+
+class Command(BaseCommand):
+    help = '만료된 발표 자료 조각 업로드와 조각 파일을 지웁니다. cron 등으로 주기적으로 실행합니다.'
+
+    def handle(self, *args, **options):
+        deleted = presentation_upload_purge_expired()
+        self.stdout.write(self.style.SUCCESS(f'만료된 업로드 {deleted}개를 지웠습니다.'))
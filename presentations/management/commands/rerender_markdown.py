@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from common.markdown import markdown_renderer_version
+from presentations.services import presentation_content_rerender
+
+
+class Command(BaseCommand):
+    help = '렌더러 버전이 다른 발표 내용(content_md)의 HTML 을 다시 만듭니다. 마크다운 렌더러를 바꾼 뒤 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='버전이 같은 발표도 다시 만듭니다')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, force, batch_size, **options):
+        count = presentation_content_rerender(force=force, batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'발표 {count}개의 HTML 을 다시 만들었습니다 (렌더러 {markdown_renderer_version()}).'
+        ))
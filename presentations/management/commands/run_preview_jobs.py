@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from presentations.services import presentation_preview_jobs_run
+
+
+class Command(BaseCommand):
+    help = '대기 중인 발표 자료 미리보기 작업을 처리합니다. cron 등으로 주기적으로 실행하거나 --poll 로 띄워 둡니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100, help='한 번에 꺼낼 작업 수')
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='렌더링 프로세스 수 (기본 PRESENTATION_PREVIEW_WORKERS)',
+        )
+        parser.add_argument(
+            '--poll', type=int, default=None,
+            help='끝내지 않고 이 간격(초)으로 새 작업을 확인합니다',
+        )
+
+    def handle(self, *args, limit, workers, poll, **options):
+        while True:
+            counts = presentation_preview_jobs_run(limit=limit, workers=workers)
+            if counts:
+                summary = ', '.join(f'{key} {value}개' for key, value in sorted(counts.items()))
+                self.stdout.write(self.style.SUCCESS(f'미리보기 작업을 처리했습니다: {summary}'))
+            if poll is None:
+                if not counts:
+                    self.stdout.write('처리할 미리보기 작업이 없습니다.')
+                return
+            if not counts:
+                time.sleep(poll)
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from common.search import search_index_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0001_initial'),
+    ]
+
+    operations = [
+        search_index_migration('presentations', 'Presentation'),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0002_presentation_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PresentationUpload',
+            fields=[
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='전체 파일 크기 (바이트)')),
+                ('offset', models.PositiveBigIntegerField(default=0, help_text='지금까지 받은 바이트 수')),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('presentation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to='presentations.presentation')),
+                ('uploaded_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='presentation_uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
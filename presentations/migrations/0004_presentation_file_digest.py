@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0003_presentationupload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='presentation',
+            name='file_sha256',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
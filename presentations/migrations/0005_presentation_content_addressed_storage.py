@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:16
+
+import django.core.validators
+import presentations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0004_presentation_file_digest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='presentation',
+            name='file_sha256',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='presentation',
+            name='file_url',
+            field=models.FileField(blank=True, help_text='PDF, PPT, PPTX 파일 업로드 (최대 50MB)', null=True, storage=presentations.models.presentation_storage, upload_to=presentations.models.presentation_upload_to, validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['pdf', 'ppt', 'pptx']), presentations.models.validate_file_size], verbose_name='발표 자료'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:27
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0005_presentation_content_addressed_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='presentation',
+            name='preview_image',
+            field=models.CharField(blank=True, editable=False, help_text='첫 페이지 PNG 저장소 이름', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='preview_text',
+            field=models.TextField(blank=True, editable=False, help_text='본문 앞부분'),
+        ),
+        migrations.CreateModel(
+            name='PresentationPreviewJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('file_sha256', models.CharField(max_length=64, unique=True)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '처리 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='이 시각이 지나야 꺼낸다 (재시도 대기)')),
+                ('locked_until', models.DateTimeField(blank=True, help_text='처리 중인 워커가 이 시각까지 끝내지 못하면 다른 워커가 다시 꺼낸다', null=True)),
+                ('thumbnail', models.CharField(blank=True, max_length=255)),
+                ('text_excerpt', models.TextField(blank=True)),
+                ('last_error', models.TextField(blank=True)),
+            ],
+            options={
+                'ordering': ['run_after'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='presentatio_status_b5aa85_idx')],
+            },
+        ),
+    ]
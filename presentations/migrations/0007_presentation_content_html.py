@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('presentations', '0006_presentation_previews'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='presentation',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='content_html_version',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='content_md_sha256',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
@@ -1,26 +1,41 @@
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import storages
 from django.db import models
+from django.utils import timezone
+from django.utils.safestring import SafeString, mark_safe
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.utils.translation import gettext_lazy as _
 from pathlib import Path
 
+from common.downloads import file_digest
+from common.markdown import markdown_digest, markdown_html, markdown_renderer_version
+from common.storage import content_digest
 from common.models import BaseModel
 from users.models import User
 from events.models import Event
 
 
+PRESENTATION_FILE_EXTENSIONS = ['pdf', 'ppt', 'pptx']
+PRESENTATION_FILE_MAX_SIZE = 50 * 1024 * 1024  # 50MB
+
+
 def validate_file_size(value):
     """파일 크기 검증 (50MB 제한)"""
-    limit = 50 * 1024 * 1024  # 50MB
-    if value.size > limit:
+    if value.size > PRESENTATION_FILE_MAX_SIZE:
         raise ValidationError('파일 크기는 50MB를 초과할 수 없습니다.')
 
 def presentation_upload_to(instance, filename):
-    """발표 자료 업로드 경로"""
-    # Django가 자동으로 파일명 중복 처리
+    """발표 자료 업로드 경로 - 내용 주소 저장소(common.storage)는 이 중 파일명만 쓴다"""
     return f'presentations/{instance.created_at.year}/user_{instance.presenter.id}/{filename}'
 
 
+def presentation_storage():
+    return storages['presentations']
+
+
 class Presentation(BaseModel):
     class Status(models.TextChoices):
         SUBMITTED = 'submitted', _('신청됨')
@@ -36,17 +51,30 @@ class Presentation(BaseModel):
         blank=True,
         help_text='발표 상세 내용을 마크다운으로 작성하세요'
     )
+    # content_md 를 렌더링한 정제된 HTML (common.markdown) - content_md 가 바뀌면 save() 에서 다시 만들고,
+    # 렌더러 버전이 바뀌었으면 읽을 때(rendered_content) 또는 rerender_markdown 명령으로 다시 만든다
+    content_html = models.TextField(blank=True, editable=False)
+    content_md_sha256 = models.CharField(max_length=64, blank=True, editable=False)
+    content_html_version = models.CharField(max_length=100, blank=True, editable=False)
     file_url = models.FileField(
         _('발표 자료'),
         upload_to=presentation_upload_to,
+        storage=presentation_storage,
         validators=[
-            FileExtensionValidator(allowed_extensions=['pdf', 'ppt', 'pptx']),
+            FileExtensionValidator(allowed_extensions=PRESENTATION_FILE_EXTENSIONS),
             validate_file_size,
         ],
         null=True,
         blank=True,
         help_text='PDF, PPT, PPTX 파일 업로드 (최대 50MB)'
     )
+    # 다운로드 ETag/Content-Length 용 (common.downloads) - 파일이 바뀔 때 save() 에서 채운다.
+    # 같은 해시의 행 수가 저장소 blob 의 참조 수다 (presentations.services.presentation_file_gc)
+    file_sha256 = models.CharField(max_length=64, blank=True, editable=False, db_index=True)
+    file_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    # 미리보기 (presentations.services.presentation_preview_*) - 작업이 끝나면 채워지고 페이지는 읽기만 한다
+    preview_image = models.CharField(max_length=255, blank=True, editable=False, help_text='첫 페이지 PNG 저장소 이름')
+    preview_text = models.TextField(blank=True, editable=False, help_text='본문 앞부분')
     status = models.CharField(
         _('상태'),
         max_length=20,
@@ -88,6 +116,42 @@ class Presentation(BaseModel):
         if self.presenter.user_type != User.UserType.REGULAR:
             raise ValidationError('정회원만 발표를 신청할 수 있습니다.')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # save() 에서 파일이 바뀌었는지 비교한다
+        instance._loaded_file_name = instance.__dict__.get('file_url')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # post_save 에서 미리보기 작업을 넣을지 정한다 (presentations.signals)
+        self._file_changed = False
+        if not self.file_url:
+            self._file_changed = bool(getattr(self, '_loaded_file_name', None))
+            self.file_sha256, self.file_size = '', None
+        elif not self.file_url._committed or self.file_url.name != getattr(self, '_loaded_file_name', None):
+            self._file_changed = True
+            # 새로 올렸거나 바꾼 파일 - 내용 주소 저장소는 저장하면서 해시를 구해 이름에 넣으므로
+            # 먼저 저장하고(FileField.pre_save 가 할 일) 이름에서 해시를 읽는다
+            if not self.file_url._committed:
+                self.file_url.save(self.file_url.name, self.file_url.file, save=False)
+            self.file_sha256 = content_digest(self.file_url.name)
+            if self.file_sha256:
+                self.file_size = self.file_url.size
+            else:
+                with self.file_url.open('rb'):
+                    self.file_sha256, self.file_size = file_digest(self.file_url)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content_md' in update_fields:
+            digest = markdown_digest(self.content_md)
+            if digest != self.content_md_sha256 or self.content_html_version != markdown_renderer_version():
+                self.content_html_set(digest=digest)
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'content_html', 'content_md_sha256', 'content_html_version'}
+        super().save(*args, **kwargs)
+        self._loaded_file_name = self.file_url.name if self.file_url else None
+
     @property
     def file_name(self) -> str:
         """업로드된 파일명"""
@@ -98,6 +162,8 @@ class Presentation(BaseModel):
     @property
     def file_size_mb(self) -> float:
         """파일 크기 (MB)"""
+        if self.file_size is not None:
+            return round(self.file_size / (1024 * 1024), 2)
         if self.file_url:
             try:
                 return round(self.file_url.size / (1024 * 1024), 2)
@@ -105,10 +171,112 @@ class Presentation(BaseModel):
                 return 0.0
         return 0.0
 
+    def content_html_set(self, *, digest: str = '') -> None:
+        """content_md 를 지금 렌더러로 렌더링해 content_html 에 넣는다 (저장은 하지 않는다)"""
+        self.content_md_sha256 = digest or markdown_digest(self.content_md)
+        self.content_html = markdown_html(self.content_md, self.content_md_sha256)
+        self.content_html_version = markdown_renderer_version()
+
+    @property
+    def rendered_content(self) -> SafeString:
+        """content_md 의 정제된 HTML - 렌더러가 바뀐 뒤 처음 읽으면 다시 렌더링해 저장한다"""
+        if self.content_html_version != markdown_renderer_version():
+            self.content_html_set()
+            # 그 사이 내용이 바뀌었으면 덮어쓰지 않는다
+            type(self).objects.filter(pk=self.pk, content_md_sha256__in=['', self.content_md_sha256]).update(
+                content_html=self.content_html,
+                content_md_sha256=self.content_md_sha256,
+                content_html_version=self.content_html_version,
+            )
+        return mark_safe(self.content_html)
+
+    @property
+    def preview_image_url(self) -> str:
+        """미리보기 이미지 URL - 아직 없으면 빈 문자열"""
+        if self.preview_image:
+            return self.file_url.storage.url(self.preview_image)
+        return ""
+
     def __str__(self):
         return f"{self.title} - {self.presenter.username}"
 
 
+class PresentationPreviewJob(BaseModel):
+    """
+    발표 자료 미리보기 작업 (presentations.services.presentation_preview_*)
+
+    미리보기는 내용(file_sha256)마다 한 번만 만든다. 파일이 바뀐 발표를 저장하면 작업이 생기고,
+    run_preview_jobs 명령이 꺼내 처리한 뒤 같은 해시를 가진 발표 행에 결과를 적는다.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('대기')
+        RUNNING = 'running', _('처리 중')
+        DONE = 'done', _('완료')
+        FAILED = 'failed', _('실패')
+
+    file_sha256 = models.CharField(max_length=64, unique=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now, help_text='이 시각이 지나야 꺼낸다 (재시도 대기)')
+    locked_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='처리 중인 워커가 이 시각까지 끝내지 못하면 다른 워커가 다시 꺼낸다'
+    )
+    thumbnail = models.CharField(max_length=255, blank=True)
+    text_excerpt = models.TextField(blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['run_after']
+        indexes = [models.Index(fields=['status', 'run_after'])]
+
+    def __str__(self):
+        return f"{self.file_sha256[:12]} ({self.get_status_display()})"
+
+
+class PresentationUpload(BaseModel):
+    """
+    조각 업로드 중인 발표 자료 (presentations.services.presentation_upload_*)
+
+    조각은 PRESENTATION_UPLOAD_DIR/<id>.part 에 이어 쓰고, 다 받으면 finalize 에서
+    Presentation.file_url 로 옮긴 뒤 이 행을 지운다.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    presentation = models.ForeignKey(
+        Presentation,
+        on_delete=models.CASCADE,
+        related_name='uploads'
+    )
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='presentation_uploads'
+    )
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField(help_text='전체 파일 크기 (바이트)')
+    offset = models.PositiveBigIntegerField(default=0, help_text='지금까지 받은 바이트 수')
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    @property
+    def extension(self) -> str:
+        return Path(self.filename).suffix.lstrip('.').lower()
+
+    @property
+    def part_path(self) -> Path:
+        return Path(settings.PRESENTATION_UPLOAD_DIR) / f'{self.id}.part'
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset == self.size
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+
 class PresentationComment(BaseModel):
     presentation = models.ForeignKey(
         Presentation,
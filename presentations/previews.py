@@ -0,0 +1,55 @@
+"""
+발표 자료 미리보기 렌더링 - run_preview_jobs 의 워커 프로세스에서 실행된다
+
+DB 와 설정에 접근하지 않고 경로만 받아 파일을 쓰므로, spawn 으로 띄운 워커에서 Django 를 설정할
+필요가 없다. 결과는 임시 파일에 다 쓴 뒤 os.replace 로 옮기므로 페이지에는 완성된 파일만 보인다.
+
+PDF 렌더링은 PyMuPDF 가 필요하다 (pip install .[previews]).
+"""
+import os
+import tempfile
+
+
+class PreviewUnsupported(Exception):
+    """다시 해도 결과가 같은 실패 (라이브러리 없음, 열 수 없는 PDF) - 재시도하지 않는다"""
+
+
+def _write_atomic(path: str, data: bytes, *, tmp_dir: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def pdf_preview_render(*, source: str, thumbnail: str, text: str, tmp_dir: str, width: int) -> str:
+    """
+    PDF 첫 페이지를 폭 width 픽셀 PNG 로 thumbnail 에, 전체 텍스트를 text 에 쓰고 텍스트를 돌려준다.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        raise PreviewUnsupported('PDF 미리보기를 만들려면 PyMuPDF 패키지가 필요합니다.')
+
+    try:
+        document = pymupdf.open(source, filetype='pdf')
+    except pymupdf.FileDataError as exc:
+        raise PreviewUnsupported(f'PDF 파일을 열 수 없습니다: {exc}')
+    with document:
+        if document.needs_pass:
+            raise PreviewUnsupported('암호가 걸린 PDF 입니다.')
+        if document.page_count == 0:
+            raise PreviewUnsupported('페이지가 없는 PDF 입니다.')
+
+        page = document[0]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        extracted = '\n'.join(each.get_text() for each in document)
+
+    _write_atomic(thumbnail, pixmap.tobytes('png'), tmp_dir=tmp_dir)
+    _write_atomic(text, extracted.encode(), tmp_dir=tmp_dir)
+    return extracted
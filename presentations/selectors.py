@@ -0,0 +1,17 @@
+from typing import Optional
+from uuid import UUID
+
+from django.utils import timezone
+
+from presentations.models import PresentationUpload
+from users.models import User
+
+
+def presentation_upload_get(*, upload_id: UUID, user: User) -> Optional[PresentationUpload]:
+    """user 가 시작한, 만료되지 않은 업로드"""
+    return (
+        PresentationUpload.objects
+        .select_related('presentation__presenter')
+        .filter(pk=upload_id, uploaded_by=user, expires_at__gt=timezone.now())
+        .first()
+    )
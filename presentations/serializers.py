@@ -7,12 +7,25 @@ class PresentationSerializer(serializers.ModelSerializer):
     event_title = serializers.CharField(source='event.title', read_only=True)
     file_name = serializers.CharField(read_only=True)
     file_size_mb = serializers.FloatField(read_only=True)
+    preview_image_url = serializers.CharField(read_only=True)
+    content_html = serializers.CharField(source='rendered_content', read_only=True)
+
+    # 자료 내용이므로 다운로드(IsAuthenticated)처럼 로그인 사용자에게만 보인다
+    PREVIEW_FIELDS = ['preview_image', 'preview_text', 'preview_image_url']
 
     class Meta:
         model = Presentation
         fields = '__all__'
         read_only_fields = ['presenter', 'status', 'created_at', 'updated_at']
 
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or not request.user.is_authenticated:
+            for name in self.PREVIEW_FIELDS:
+                fields.pop(name)
+        return fields
+
     def create(self, validated_data):
         validated_data['presenter'] = self.context['request'].user
         return super().create(validated_data)
@@ -0,0 +1,397 @@
+"""
+발표 자료 조각 업로드 (tus 방식: 만들기 → 조각 PATCH 반복 → finalize)
+
+MultiPartParser 로 50MB 파일을 한 요청에 받으면 느린 클라이언트가 워커를 몇 분씩 붙잡고,
+검증은 전송이 다 끝난 뒤에야 한다. 조각 업로드는
+  - 만들 때 확장자와 전체 크기를, 조각마다 Content-Length 를 본문을 읽기 전에 검사하고
+  - 첫 조각에서 파일 시그니처(매직 바이트)가 확장자와 맞는지 확인하며
+  - 조각을 메모리에 모으지 않고 PRESENTATION_UPLOAD_DIR/<id>.part 에 바로 이어 쓴다.
+요청 하나는 PRESENTATION_UPLOAD_CHUNK_MAX_SIZE 만큼만 받으므로 워커를 오래 잡지 않고,
+끊기면 HEAD 로 받은 위치(offset)를 확인해 이어 보낸다.
+
+finalize 는 조각 파일을 스토리지로 옮겨(같은 파일 시스템이면 rename) Presentation.file_url 에 붙인다.
+
+미리보기(presentation_preview_*)는 파일이 바뀔 때 작업 테이블(PresentationPreviewJob)에 넣고,
+run_preview_jobs 명령이 프로세스 풀에서 만들어 발표 행에 적는다. 요청에서는 적힌 값만 읽는다.
+"""
+import fcntl
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from functools import partial
+from multiprocessing import get_context
+from typing import BinaryIO, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from common.cache import PAGE_CACHE_GENERATIONS, cache_version_bump
+from common.downloads import file_digest
+from common.markdown import markdown_renderer_version
+from common.storage import derivative_name
+from presentations.models import (
+    PRESENTATION_FILE_EXTENSIONS,
+    PRESENTATION_FILE_MAX_SIZE,
+    Presentation,
+    PresentationPreviewJob,
+    PresentationUpload,
+)
+from presentations.previews import PreviewUnsupported, pdf_preview_render
+from users.models import User
+
+# 확장자별 파일 시그니처
+FILE_SIGNATURES = {
+    'pdf': b'%PDF-',
+    'pptx': b'PK\x03\x04',  # OOXML 은 zip
+    'ppt': b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',  # OLE2 복합 문서
+}
+READ_SIZE = 64 * 1024
+
+
+class _PartFile(File):
+    """조각 파일 - temporary_file_path 가 있으면 FileSystemStorage 가 복사 대신 옮긴다"""
+
+    def __init__(self, path):
+        super().__init__(None, name=str(path))
+        self._path = str(path)
+
+    def temporary_file_path(self) -> str:
+        return self._path
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = b''
+    while len(data) < size:
+        piece = stream.read(size - len(data))
+        if not piece:
+            break
+        data += piece
+    return data
+
+
+@transaction.atomic
+def presentation_upload_create(
+    *, presentation: Presentation, uploaded_by: User, filename: str, size: int
+) -> PresentationUpload:
+    """업로드를 시작한다 - 확장자/크기는 본문을 받기 전에 여기서 거른다"""
+    upload = PresentationUpload(
+        presentation=presentation,
+        uploaded_by=uploaded_by,
+        filename=filename,
+        size=size,
+        expires_at=timezone.now() + timedelta(seconds=settings.PRESENTATION_UPLOAD_EXPIRY),
+    )
+    if upload.extension not in PRESENTATION_FILE_EXTENSIONS:
+        raise ValidationError(
+            f"{', '.join(PRESENTATION_FILE_EXTENSIONS)} 파일만 올릴 수 있습니다.", code='invalid_extension'
+        )
+    if size > PRESENTATION_FILE_MAX_SIZE:
+        raise ValidationError('파일 크기는 50MB를 초과할 수 없습니다.', code='too_large')
+    if size < len(FILE_SIGNATURES[upload.extension]):
+        raise ValidationError('파일이 너무 작습니다.', code='invalid')
+
+    upload.save()
+    upload.part_path.parent.mkdir(parents=True, exist_ok=True)
+    upload.part_path.touch()
+    return upload
+
+
+def presentation_upload_append(
+    *, upload: PresentationUpload, offset: int, length: int, stream: BinaryIO
+) -> PresentationUpload:
+    """
+    offset 위치부터 length 바이트 조각을 stream 에서 읽어 이어 쓴다.
+
+    offset 이 지금까지 받은 위치와 다르거나 같은 업로드에 다른 요청이 쓰고 있으면 code='conflict',
+    조각이 크기 제한을 넘으면 본문을 읽기 전에 code='too_large' 로 거절한다.
+    """
+    if length > settings.PRESENTATION_UPLOAD_CHUNK_MAX_SIZE:
+        raise ValidationError(
+            f'조각은 {settings.PRESENTATION_UPLOAD_CHUNK_MAX_SIZE}바이트를 넘을 수 없습니다.', code='too_large'
+        )
+
+    with open(upload.part_path, 'r+b') as part:
+        try:
+            # 조각 쓰기는 파일 잠금으로 직렬화한다 (DB 트랜잭션을 네트워크 대기 동안 잡지 않는다)
+            fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise ValidationError('다른 요청이 이 업로드에 쓰고 있습니다.', code='conflict')
+
+        upload.refresh_from_db(fields=['offset'])
+        if offset != upload.offset:
+            raise ValidationError(f'업로드 위치가 맞지 않습니다 (현재 {upload.offset}).', code='conflict')
+        if offset + length > upload.size:
+            raise ValidationError('선언한 파일 크기를 넘습니다.', code='too_large')
+
+        part.seek(offset)
+        # 이전에 중간에 끊긴 조각의 나머지를 버린다
+        part.truncate()
+        written = 0
+        if offset == 0:
+            signature = FILE_SIGNATURES[upload.extension]
+            if length < len(signature):
+                raise ValidationError('첫 조각에 파일 시그니처가 모두 들어 있어야 합니다.', code='invalid')
+            head = _read_exactly(stream, len(signature))
+            if head != signature:
+                raise ValidationError(f'{upload.extension} 파일이 아닙니다.', code='invalid')
+            part.write(head)
+            written = len(head)
+        while written < length:
+            piece = stream.read(min(READ_SIZE, length - written))
+            if not piece:
+                # 클라이언트가 끊겼다 - 받은 만큼만 반영하고 HEAD 로 확인해 이어 보내게 한다
+                break
+            part.write(piece)
+            written += len(piece)
+
+        upload.offset = offset + written
+        upload.save(update_fields=['offset', 'updated_at'])
+    return upload
+
+
+@transaction.atomic
+def presentation_upload_finalize(*, upload: PresentationUpload) -> Presentation:
+    """다 받은 조각 파일을 Presentation.file_url 로 옮기고 업로드를 지운다"""
+    if not upload.is_complete:
+        raise ValidationError(f'업로드가 끝나지 않았습니다 ({upload.offset}/{upload.size}).', code='incomplete')
+
+    presentation = upload.presentation
+    # 해시/크기는 Presentation.save() 가 저장된 이름에서 읽는다
+    presentation.file_url.save(upload.filename, _PartFile(upload.part_path), save=False)
+    presentation.save(update_fields=['file_url', 'file_sha256', 'file_size', 'updated_at'])
+    # 같은 내용이 이미 있었으면 조각 파일은 옮겨지지 않고 남는다
+    upload.part_path.unlink(missing_ok=True)
+    upload.delete()
+    return presentation
+
+
+def presentation_file_digest_set(*, presentation: Presentation) -> Presentation:
+    """해시/크기가 없는 (필드 추가 전에 올린) 파일의 값을 채운다"""
+    with presentation.file_url.open('rb'):
+        presentation.file_sha256, presentation.file_size = file_digest(presentation.file_url)
+    presentation.save(update_fields=['file_sha256', 'file_size'])
+    return presentation
+
+
+def presentation_file_gc(*, grace_seconds: Optional[int] = None) -> int:
+    """
+    어떤 Presentation 행도 가리키지 않는 저장소 blob 을 지운다. 지운 파일 수를 돌려준다.
+
+    blob 의 참조 수는 같은 file_sha256 을 가진 행 수다. 저장은 끝났지만 행이 아직 커밋되지 않은
+    blob 을 지우지 않도록, 마지막으로 쓰이거나 재사용된 지 grace_seconds 가 지난 것만 지운다.
+    blob 에서 만든 미리보기 파일과 작업 행도 같은 기준으로 지운다.
+    """
+    if grace_seconds is None:
+        grace_seconds = settings.PRESENTATION_FILE_GC_GRACE
+    storage = Presentation._meta.get_field('file_url').storage
+    cutoff = time.time() - grace_seconds
+    referenced = set(
+        Presentation.objects.exclude(file_sha256='').values_list('file_sha256', flat=True).distinct()
+    )
+
+    deleted = 0
+    for digest, path in [*storage.blobs(), *storage.derivatives()]:
+        if digest not in referenced and path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            deleted += 1
+    for path in storage.temp_files():
+        if path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            deleted += 1
+    PresentationPreviewJob.objects.exclude(file_sha256__in=referenced).filter(
+        created_at__lt=timezone.now() - timedelta(seconds=grace_seconds)
+    ).delete()
+    return deleted
+
+
+def presentation_upload_delete(*, upload: PresentationUpload) -> None:
+    upload.part_path.unlink(missing_ok=True)
+    upload.delete()
+
+
+def presentation_upload_purge_expired() -> int:
+    """만료된 업로드와 조각 파일을 지운다. 지운 업로드 수를 돌려준다."""
+    expired = PresentationUpload.objects.filter(expires_at__lt=timezone.now())
+    count = 0
+    for upload in expired.iterator():
+        presentation_upload_delete(upload=upload)
+        count += 1
+    return count
+
+
+def presentation_content_rerender(*, force: bool = False, batch_size: int = 500) -> int:
+    """
+    렌더러 버전이 다른(force 면 전부) 발표의 content_html 을 다시 만든다. 바꾼 행 수를 돌려준다.
+
+    렌더러를 올린 뒤 배포 때 실행해 두면 읽는 요청이 다시 렌더링하지 않는다.
+    같은 내용은 common.markdown 의 LRU 로 한 번만 렌더링한다.
+    """
+    presentations = Presentation.objects.only('id', 'content_md', 'content_md_sha256', 'content_html_version')
+    if not force:
+        presentations = presentations.exclude(content_html_version=markdown_renderer_version())
+
+    count = 0
+    batch = []
+    for presentation in presentations.order_by('pk').iterator(chunk_size=batch_size):
+        presentation.content_html_set()
+        batch.append(presentation)
+        if len(batch) >= batch_size:
+            count += Presentation.objects.bulk_update(batch, ['content_html', 'content_md_sha256', 'content_html_version'])
+            batch = []
+    if batch:
+        count += Presentation.objects.bulk_update(batch, ['content_html', 'content_md_sha256', 'content_html_version'])
+    return count
+
+
+def presentation_preview_enqueue(*, presentation: Presentation) -> Optional[PresentationPreviewJob]:
+    """
+    파일이 바뀐 발표의 미리보기를 비우고 작업을 넣는다. PDF 가 아니면 미리보기가 없다.
+
+    같은 내용의 미리보기가 이미 만들어져 있으면 작업 없이 바로 붙인다.
+    """
+    job = None
+    preview_image, preview_text = '', ''
+    if presentation.file_sha256 and presentation.file_name.lower().endswith('.pdf'):
+        job, _ = PresentationPreviewJob.objects.get_or_create(file_sha256=presentation.file_sha256)
+        if job.status == PresentationPreviewJob.Status.DONE:
+            preview_image, preview_text = job.thumbnail, job.text_excerpt
+        elif job.status == PresentationPreviewJob.Status.FAILED:
+            # 다시 올렸으면 한 번 더 해 본다 (PyMuPDF 를 나중에 설치한 경우 등)
+            job.status, job.attempts, job.run_after = PresentationPreviewJob.Status.PENDING, 0, timezone.now()
+            job.save(update_fields=['status', 'attempts', 'run_after', 'updated_at'])
+
+    Presentation.objects.filter(pk=presentation.pk).update(preview_image=preview_image, preview_text=preview_text)
+    presentation.preview_image, presentation.preview_text = preview_image, preview_text
+    return job
+
+
+def presentation_preview_jobs_claim(*, limit: int) -> List[PresentationPreviewJob]:
+    """
+    처리할 작업을 limit 개까지 꺼낸다 - 대기 중이고 run_after 가 지난 것과, 처리 중이지만 워커가
+    locked_until 까지 끝내지 못한 것 (워커 프로세스가 죽은 경우).
+
+    상태를 조건부 UPDATE 로 바꾸며 가져가므로 명령이 여럿 돌아도 한 작업은 하나만 가져간다
+    (행 잠금을 건너뛰는 SELECT 가 없는 SQLite 에서도).
+    """
+    now = timezone.now()
+    locked_until = now + timedelta(seconds=settings.PRESENTATION_PREVIEW_TIMEOUT)
+    due = PresentationPreviewJob.objects.filter(
+        Q(status=PresentationPreviewJob.Status.PENDING, run_after__lte=now)
+        | Q(status=PresentationPreviewJob.Status.RUNNING, locked_until__lt=now)
+    )
+
+    claimed = []
+    for job in due.order_by('run_after')[:limit]:
+        updated = PresentationPreviewJob.objects.filter(
+            pk=job.pk, status=job.status, attempts=job.attempts
+        ).update(
+            status=PresentationPreviewJob.Status.RUNNING,
+            locked_until=locked_until,
+            attempts=F('attempts') + 1,
+            updated_at=now,
+        )
+        if updated:
+            job.status, job.locked_until = PresentationPreviewJob.Status.RUNNING, locked_until
+            job.attempts += 1
+            claimed.append(job)
+    return claimed
+
+
+@transaction.atomic
+def presentation_preview_complete(*, job: PresentationPreviewJob, thumbnail: str, text: str) -> PresentationPreviewJob:
+    """만든 미리보기를 작업과 같은 내용의 발표 행 전부에 적는다"""
+    job.status = PresentationPreviewJob.Status.DONE
+    job.thumbnail = thumbnail
+    job.text_excerpt = ' '.join(text.split())[:settings.PRESENTATION_PREVIEW_EXCERPT_LENGTH]
+    job.locked_until, job.last_error = None, ''
+    job.save(update_fields=['status', 'thumbnail', 'text_excerpt', 'locked_until', 'last_error', 'updated_at'])
+
+    # 시그널 없이 한 번에 갱신하므로 공개 페이지 캐시 세대는 직접 올린다
+    Presentation.objects.filter(file_sha256=job.file_sha256).update(
+        preview_image=job.thumbnail, preview_text=job.text_excerpt
+    )
+    for name in PAGE_CACHE_GENERATIONS[Presentation._meta.label]:
+        transaction.on_commit(partial(cache_version_bump, name=name))
+    return job
+
+
+def presentation_preview_fail(*, job: PresentationPreviewJob, error: str, retry: bool = True) -> PresentationPreviewJob:
+    """
+    실패한 작업을 다시 대기시킨다. 대기 시간은 실패할 때마다 두 배로 늘리고,
+    PRESENTATION_PREVIEW_MAX_ATTEMPTS 번 실패했거나 retry=False 면 실패로 끝낸다.
+    """
+    if retry and job.attempts < settings.PRESENTATION_PREVIEW_MAX_ATTEMPTS:
+        delay = settings.PRESENTATION_PREVIEW_RETRY_DELAY * 2 ** max(job.attempts - 1, 0)
+        job.status = PresentationPreviewJob.Status.PENDING
+        job.run_after = timezone.now() + timedelta(seconds=delay)
+    else:
+        job.status = PresentationPreviewJob.Status.FAILED
+    job.locked_until, job.last_error = None, error
+    job.save(update_fields=['status', 'run_after', 'locked_until', 'last_error', 'updated_at'])
+    return job
+
+
+def presentation_preview_jobs_run(*, limit: int = 100, workers: Optional[int] = None) -> Counter:
+    """
+    대기 중인 미리보기 작업을 꺼내 프로세스 풀에서 처리한다. 결과별(done/retry/failed/dropped) 수를 돌려준다.
+
+    렌더링은 CPU 와 메모리를 많이 쓰므로 웹 요청 프로세스가 아니라 이 명령이 띄운 워커에서 하고,
+    워커가 죽어도 이 프로세스는 남아 작업을 재시도로 돌린다.
+    """
+    counts = Counter()
+    jobs = presentation_preview_jobs_claim(limit=limit)
+    if not jobs:
+        return counts
+
+    storage = Presentation._meta.get_field('file_url').storage
+    tmp_dir = str(storage.temp_dir())
+    workers = min(workers or settings.PRESENTATION_PREVIEW_WORKERS, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        futures = {}
+        for job in jobs:
+            if job.attempts > settings.PRESENTATION_PREVIEW_MAX_ATTEMPTS:
+                presentation_preview_fail(job=job, error='제한 시간 안에 끝나지 않았습니다.', retry=False)
+                counts['failed'] += 1
+                continue
+            source = (
+                Presentation.objects.filter(file_sha256=job.file_sha256)
+                .exclude(file_url='')
+                .values_list('file_url', flat=True)
+                .first()
+            )
+            if source is None:
+                # 그 사이에 발표가 지워졌거나 파일이 바뀌었다
+                job.delete()
+                counts['dropped'] += 1
+                continue
+            thumbnail = derivative_name(job.file_sha256, 'png')
+            future = pool.submit(
+                pdf_preview_render,
+                source=storage.path(source),
+                thumbnail=storage.path(thumbnail),
+                text=storage.path(derivative_name(job.file_sha256, 'txt')),
+                tmp_dir=tmp_dir,
+                width=settings.PRESENTATION_PREVIEW_WIDTH,
+            )
+            futures[future] = (job, thumbnail)
+
+        for future in as_completed(futures):
+            job, thumbnail = futures[future]
+            try:
+                text = future.result()
+            except PreviewUnsupported as exc:
+                presentation_preview_fail(job=job, error=str(exc), retry=False)
+                counts['failed'] += 1
+            except Exception as exc:
+                # 워커 프로세스가 죽은 경우(BrokenProcessPool)도 여기로 온다
+                job = presentation_preview_fail(job=job, error=f'{type(exc).__name__}: {exc}')
+                counts['retry' if job.status == PresentationPreviewJob.Status.PENDING else 'failed'] += 1
+            else:
+                presentation_preview_complete(job=job, thumbnail=thumbnail, text=text)
+                counts['done'] += 1
+    return counts
@@ -0,0 +1,16 @@
+"""
+발표 자료가 바뀌면 미리보기 작업을 넣는다
+
+파일은 뷰셋, 폼, 조각 업로드, 어드민 등 여러 경로에서 저장되므로 모델 시그널로 한곳에서 처리한다.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from presentations.services import presentation_preview_enqueue
+
+
+@receiver(post_save, sender='presentations.Presentation')
+def presentation_file_saved(sender, instance, raw=False, **kwargs):
+    if raw or not getattr(instance, '_file_changed', False):
+        return
+    presentation_preview_enqueue(presentation=instance)
@@ -0,0 +1,68 @@
+"""
+발표 내용(content_md) HTML 저장/재렌더링 테스트
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from common.markdown import markdown_digest, markdown_renderer_version
+from presentations.models import Presentation
+from presentations.tests.factories import PresentationFactory
+
+
+@pytest.mark.django_db
+class TestPresentationContentHtml:
+    def test_rendered_on_save(self):
+        presentation = PresentationFactory(content_md='발표 <b>내용</b>')
+
+        stored = Presentation.objects.get(pk=presentation.pk)
+        assert stored.content_md_sha256 == markdown_digest('발표 <b>내용</b>')
+        assert stored.content_html_version == markdown_renderer_version()
+        assert '발표' in stored.content_html
+        assert '<b>' not in stored.content_html
+
+    def test_update_fields_with_content_md(self):
+        presentation = PresentationFactory(content_md='처음')
+        presentation.content_md = '고친 내용'
+        presentation.save(update_fields=['content_md'])
+
+        stored = Presentation.objects.get(pk=presentation.pk)
+        assert stored.content_md_sha256 == markdown_digest('고친 내용')
+        assert '고친 내용' in stored.content_html
+
+    def test_stale_version_rerendered_on_read(self):
+        presentation = PresentationFactory(content_md='내용')
+        Presentation.objects.filter(pk=presentation.pk).update(content_html='옛 HTML', content_html_version='0:old')
+
+        stored = Presentation.objects.get(pk=presentation.pk)
+        assert '내용' in stored.rendered_content
+
+        stored = Presentation.objects.get(pk=presentation.pk)
+        assert stored.content_html_version == markdown_renderer_version()
+        assert stored.rendered_content == stored.content_html
+
+    def test_rerender_command(self):
+        stale = PresentationFactory(content_md='오래된')
+        PresentationFactory(content_md='최신')
+        Presentation.objects.filter(pk=stale.pk).update(
+            content_html='', content_md_sha256='', content_html_version=''
+        )
+        out = StringIO()
+
+        call_command('rerender_markdown', stdout=out)
+
+        stale.refresh_from_db()
+        assert stale.content_md_sha256 == markdown_digest('오래된')
+        assert '오래된' in stale.content_html
+        assert '1개' in out.getvalue()
+
+    def test_detail_page(self, client):
+        presentation = PresentationFactory(content_md='<script>alert(1)</script> 본문')
+
+        response = client.get(reverse('presentation_detail', args=[presentation.pk]))
+
+        assert response.status_code == 200
+        assert '본문' in response.content.decode()
+        assert '<script>alert(1)</script>' not in response.content.decode()
@@ -0,0 +1,115 @@
+"""
+발표 자료 다운로드 (Range/If-Range, ETag, 오프로드) 테스트
+"""
+import hashlib
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from presentations.models import Presentation
+from presentations.tests.factories import PresentationWithFileFactory
+
+CONTENT = b"PDF test content " * 1000
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture
+def presentation():
+    return PresentationWithFileFactory()
+
+
+@pytest.fixture
+def url(presentation):
+    return reverse('presentation-download', args=[presentation.id])
+
+
+@pytest.fixture
+def client(api_client, presentation):
+    api_client.force_authenticate(user=presentation.presenter)
+    return api_client
+
+
+def _body(response) -> bytes:
+    return b''.join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestPresentationDownload:
+    """다운로드 액션 테스트"""
+
+    def test_digest_stored_on_upload(self, presentation):
+        """파일을 올리면 해시/크기를 저장한다"""
+        assert presentation.file_sha256 == SHA256
+        assert presentation.file_size == len(CONTENT)
+
+    def test_full_download(self, client, url):
+        """전체 다운로드 - 내용 해시 ETag 와 Accept-Ranges"""
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] == f'"{SHA256}"'
+        assert response['Accept-Ranges'] == 'bytes'
+        assert response['Content-Length'] == str(len(CONTENT))
+        assert _body(response) == CONTENT
+
+    def test_range_resumes(self, client, url):
+        """Range 요청은 그 구간만 206 으로 보낸다"""
+        response = client.get(url, HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE=f'"{SHA256}"')
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response['Content-Range'] == f'bytes 100-199/{len(CONTENT)}'
+        assert response['Content-Length'] == '100'
+        assert _body(response) == CONTENT[100:200]
+
+    def test_suffix_range(self, client, url):
+        """bytes=-N 은 마지막 N 바이트"""
+        response = client.get(url, HTTP_RANGE='bytes=-10')
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert _body(response) == CONTENT[-10:]
+
+    def test_if_range_mismatch_sends_full(self, client, url):
+        """파일이 바뀌었으면(If-Range 불일치) 처음부터 보낸다"""
+        response = client.get(url, HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE='"stale"')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _body(response) == CONTENT
+
+    def test_unsatisfiable_range(self, client, url):
+        """파일 밖 구간은 416"""
+        response = client.get(url, HTTP_RANGE=f'bytes={len(CONTENT)}-')
+
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response['Content-Range'] == f'bytes */{len(CONTENT)}'
+
+    def test_not_modified(self, client, url):
+        """같은 ETag 면 304"""
+        response = client.get(url, HTTP_IF_NONE_MATCH=f'"{SHA256}"')
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_accel_redirect_offload(self, client, url, presentation, settings):
+        """x-accel-redirect 면 본문 없이 nginx 에 넘긴다"""
+        settings.FILE_DOWNLOAD_OFFLOAD = 'x-accel-redirect'
+
+        response = client.get(url)
+
+        assert response['X-Accel-Redirect'] == f'/protected-media/cas/{SHA256[:2]}/{SHA256[2:4]}/{SHA256}'
+        assert response.content == b''
+        assert 'attachment' in response['Content-Disposition']
+
+    def test_digest_backfilled(self, client, url, presentation):
+        """해시가 없는 예전 행은 첫 다운로드 때 채운다"""
+        Presentation.objects.filter(pk=presentation.pk).update(file_sha256='', file_size=None)
+
+        response = client.get(url)
+
+        assert response['ETag'] == f'"{SHA256}"'
+        presentation.refresh_from_db()
+        assert presentation.file_size == len(CONTENT)
@@ -0,0 +1,78 @@
+"""
+발표 자료 내용 주소 저장소(common.storage)와 GC 테스트
+"""
+import hashlib
+from io import StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+
+from common.storage import content_digest
+from presentations.models import Presentation
+from presentations.services import presentation_file_gc
+from presentations.tests.factories import PresentationFactory
+
+CONTENT = b'%PDF-1.7 deck'
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def _blobs(media_root):
+    return sorted(path.name for path in (media_root / 'cas').glob('*/*/*') if path.is_file())
+
+
+def _with_file(filename, content=CONTENT):
+    return PresentationFactory(file_url=SimpleUploadedFile(filename, content))
+
+
+@pytest.mark.django_db
+class TestContentAddressedStorage:
+    """같은 내용은 한 번만 저장한다"""
+
+    def test_duplicate_upload_stored_once(self, media_root):
+        """같은 내용을 다른 이름으로 올려도 blob 은 하나, 파일명은 각자 유지"""
+        first = _with_file('v1.pdf')
+        second = _with_file('v1-typo-fixed.pdf')
+
+        assert _blobs(media_root) == [SHA256]
+        assert first.file_sha256 == second.file_sha256 == content_digest(first.file_url.name) == SHA256
+        assert (first.file_name, second.file_name) == ('v1.pdf', 'v1-typo-fixed.pdf')
+        with second.file_url.open('rb') as f:
+            assert f.read() == CONTENT
+
+    def test_delete_keeps_shared_blob(self, media_root):
+        """행/파일을 지워도 blob 은 GC 가 참조를 확인하고 지운다"""
+        first = _with_file('a.pdf')
+        second = _with_file('b.pdf')
+
+        first.file_url.delete(save=False)
+        first.delete()
+        assert presentation_file_gc(grace_seconds=0) == 0
+        assert _blobs(media_root) == [SHA256]
+
+        second.delete()
+        assert presentation_file_gc(grace_seconds=0) == 1
+        assert _blobs(media_root) == []
+
+    def test_gc_respects_grace_period(self, media_root):
+        """방금 쓰인 blob 은 참조가 없어도 유예 시간 동안 남긴다"""
+        _with_file('a.pdf').delete()
+
+        assert presentation_file_gc(grace_seconds=3600) == 0
+        assert _blobs(media_root) == [SHA256]
+
+    def test_gc_command(self, media_root):
+        """gc_presentation_files 명령"""
+        Presentation.objects.filter(pk=_with_file('a.pdf').pk).delete()
+        out = StringIO()
+
+        call_command('gc_presentation_files', grace=0, stdout=out)
+
+        assert _blobs(media_root) == []
+        assert '1개' in out.getvalue()
@@ -0,0 +1,204 @@
+"""
+발표 자료 미리보기 작업 테스트
+"""
+from datetime import timedelta
+from importlib.util import find_spec
+from io import StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from common.storage import derivative_name
+from presentations.models import Presentation, PresentationPreviewJob
+from presentations.serializers import PresentationSerializer
+from presentations.services import (
+    presentation_file_gc,
+    presentation_preview_complete,
+    presentation_preview_fail,
+    presentation_preview_jobs_claim,
+    presentation_preview_jobs_run,
+)
+from presentations.tests.factories import PresentationFactory
+from users.tests.factories import UserFactory
+
+CONTENT = b'%PDF-1.7 deck'
+HAS_PYMUPDF = find_spec('pymupdf') is not None
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def _with_file(filename='deck.pdf', content=CONTENT):
+    return PresentationFactory(file_url=SimpleUploadedFile(filename, content))
+
+
+@pytest.mark.django_db
+class TestPresentationPreviewEnqueue:
+    """파일이 바뀌면 내용마다 작업 하나"""
+
+    def test_pdf_save_creates_job(self):
+        presentation = _with_file()
+
+        job = PresentationPreviewJob.objects.get()
+        assert job.file_sha256 == presentation.file_sha256
+        assert job.status == PresentationPreviewJob.Status.PENDING
+
+    def test_same_content_shares_job_and_non_pdf_has_none(self):
+        _with_file('a.pdf')
+        _with_file('b.pdf')
+        _with_file('c.pptx', b'PK\x03\x04 deck')
+        PresentationFactory()
+
+        assert PresentationPreviewJob.objects.count() == 1
+
+    def test_done_preview_attached_without_job(self):
+        """같은 내용의 미리보기가 있으면 바로 붙이고, 다른 파일로 바꾸면 비운다"""
+        first = _with_file('a.pdf')
+        presentation_preview_complete(
+            job=PresentationPreviewJob.objects.get(), thumbnail='cas/x.png', text='  첫   페이지\n본문 '
+        )
+        first.refresh_from_db()
+        assert (first.preview_image, first.preview_text) == ('cas/x.png', '첫 페이지 본문')
+
+        second = _with_file('b.pdf')
+        assert second.preview_image == Presentation.objects.get(pk=second.pk).preview_image == 'cas/x.png'
+
+        second.file_url = SimpleUploadedFile('b.pdf', b'%PDF-1.7 other')
+        second.save()
+        second.refresh_from_db()
+        assert second.preview_image == second.preview_text == ''
+        assert PresentationPreviewJob.objects.count() == 2
+
+
+@pytest.mark.django_db
+class TestPresentationPreviewJobs:
+    """작업 꺼내기와 재시도"""
+
+    def test_claim_skips_waiting_and_reclaims_expired_lease(self):
+        now = timezone.now()
+        waiting = PresentationPreviewJob.objects.create(file_sha256='a' * 64, run_after=now + timedelta(minutes=1))
+        stale = PresentationPreviewJob.objects.create(
+            file_sha256='b' * 64, status=PresentationPreviewJob.Status.RUNNING, attempts=1,
+            locked_until=now - timedelta(seconds=1),
+        )
+        PresentationPreviewJob.objects.create(
+            file_sha256='c' * 64, status=PresentationPreviewJob.Status.RUNNING, attempts=1,
+            locked_until=now + timedelta(minutes=1),
+        )
+
+        claimed = presentation_preview_jobs_claim(limit=10)
+
+        assert [job.pk for job in claimed] == [stale.pk]
+        assert claimed[0].attempts == 2
+        assert presentation_preview_jobs_claim(limit=10) == []
+        waiting.refresh_from_db()
+        assert waiting.status == PresentationPreviewJob.Status.PENDING
+
+    def test_fail_backs_off_then_gives_up(self, settings):
+        settings.PRESENTATION_PREVIEW_MAX_ATTEMPTS = 3
+        settings.PRESENTATION_PREVIEW_RETRY_DELAY = 10
+        job = PresentationPreviewJob.objects.create(file_sha256='a' * 64, attempts=2)
+
+        presentation_preview_fail(job=job, error='boom')
+
+        assert job.status == PresentationPreviewJob.Status.PENDING
+        assert timedelta(seconds=19) < job.run_after - timezone.now() <= timedelta(seconds=20)
+
+        job.attempts = 3
+        presentation_preview_fail(job=job, error='boom')
+        job.refresh_from_db()
+        assert (job.status, job.last_error) == (PresentationPreviewJob.Status.FAILED, 'boom')
+
+    def test_run_drops_job_without_presentation(self):
+        presentation = _with_file()
+        presentation.delete()
+
+        assert presentation_preview_jobs_run() == {'dropped': 1}
+        assert not PresentationPreviewJob.objects.exists()
+
+    @pytest.mark.skipif(HAS_PYMUPDF, reason='PyMuPDF 가 없을 때의 동작')
+    def test_run_without_pymupdf_fails_once(self):
+        _with_file()
+        out = StringIO()
+
+        call_command('run_preview_jobs', workers=1, stdout=out)
+
+        job = PresentationPreviewJob.objects.get()
+        assert job.status == PresentationPreviewJob.Status.FAILED
+        assert 'PyMuPDF' in job.last_error
+        assert 'failed 1개' in out.getvalue()
+
+    def test_render_first_page(self, media_root):
+        pymupdf = pytest.importorskip('pymupdf')
+        with pymupdf.open() as document:
+            document.new_page().insert_text((72, 72), 'Hello PyThing')
+            content = document.tobytes()
+        presentation = _with_file(content=content)
+
+        assert presentation_preview_jobs_run(workers=1) == {'done': 1}
+
+        presentation.refresh_from_db()
+        assert presentation.preview_image == derivative_name(presentation.file_sha256, 'png')
+        assert (media_root / presentation.preview_image).read_bytes().startswith(b'\x89PNG')
+        assert 'Hello PyThing' in presentation.preview_text
+
+
+@pytest.mark.django_db
+def test_gc_removes_previews_of_unreferenced_blob(media_root):
+    presentation = _with_file()
+    thumbnail = media_root / derivative_name(presentation.file_sha256, 'png')
+    thumbnail.write_bytes(b'\x89PNG')
+    PresentationPreviewJob.objects.update(created_at=timezone.now() - timedelta(seconds=1))
+
+    assert presentation_file_gc(grace_seconds=0) == 0
+    presentation.delete()
+    assert presentation_file_gc(grace_seconds=0) == 2
+
+    assert not thumbnail.exists()
+    assert not PresentationPreviewJob.objects.exists()
+
+
+@pytest.fixture
+def previewed():
+    presentation = _with_file()
+    presentation_preview_complete(
+        job=PresentationPreviewJob.objects.get(), thumbnail=derivative_name(presentation.file_sha256, 'png'),
+        text='미리보기 본문',
+    )
+    return presentation
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ['presentations', 'presentation_detail'])
+def test_pages_show_preview_only_to_logged_in_users(client, previewed, url_name):
+    """미리보기는 자료 내용이라 다운로드처럼 로그인 사용자에게만 보인다 (비로그인 페이지는 캐시된다)"""
+    thumbnail = f'/{derivative_name(previewed.file_sha256, "png")}'
+    url = reverse(url_name, args=[previewed.pk] if url_name == 'presentation_detail' else [])
+
+    anonymous = client.get(url).content.decode()
+    client.force_login(UserFactory())
+    logged_in = client.get(url).content.decode()
+
+    assert thumbnail not in anonymous and '미리보기 본문' not in anonymous
+    assert thumbnail in logged_in
+    if url_name == 'presentations':
+        assert '미리보기 본문' in logged_in
+
+
+@pytest.mark.django_db
+def test_api_hides_preview_from_anonymous(api_client, previewed):
+    url = reverse('presentation-detail', args=[previewed.pk])
+
+    anonymous = api_client.get(url).json()
+    api_client.force_authenticate(UserFactory())
+    logged_in = api_client.get(url).json()
+
+    assert not set(PresentationSerializer.PREVIEW_FIELDS) & set(anonymous)
+    assert logged_in['preview_text'] == '미리보기 본문'
+    assert logged_in['preview_image_url'].endswith(derivative_name(previewed.file_sha256, 'png'))
@@ -0,0 +1,154 @@
+"""
+발표 자료 조각 업로드 API 테스트
+"""
+import hashlib
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from presentations.models import PresentationUpload
+from presentations.tests.factories import PresentationFactory
+from users.tests.factories import UserFactory
+
+PDF = b'%PDF-1.7\n' + b'x' * 2491
+
+
+@pytest.fixture(autouse=True)
+def upload_dirs(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / 'media'
+    settings.PRESENTATION_UPLOAD_DIR = tmp_path / 'parts'
+    settings.PRESENTATION_UPLOAD_CHUNK_MAX_SIZE = 1024
+
+
+@pytest.fixture
+def presentation():
+    return PresentationFactory()
+
+
+@pytest.fixture
+def presenter_client(api_client, presentation):
+    api_client.force_authenticate(user=presentation.presenter)
+    return api_client
+
+
+def _create(client, presentation, filename='slides.pdf', size=len(PDF)):
+    return client.post(
+        reverse('presentation-upload-create'),
+        {'presentation': presentation.id, 'filename': filename, 'size': size},
+        format='json',
+    )
+
+
+def _patch(client, upload_id, offset, chunk):
+    return client.patch(
+        reverse('presentation-upload', args=[upload_id]),
+        chunk,
+        content_type='application/offset+octet-stream',
+        HTTP_UPLOAD_OFFSET=str(offset),
+    )
+
+
+@pytest.mark.django_db
+class TestPresentationUploadApi:
+    """조각 업로드 API 테스트"""
+
+    def test_chunked_upload_and_finalize(self, presenter_client, presentation, settings):
+        """조각을 이어 보내고 finalize 하면 발표 파일이 된다"""
+        response = _create(presenter_client, presentation)
+        assert response.status_code == status.HTTP_201_CREATED
+        upload_id = response.data['id']
+        assert response['Location'] == reverse('presentation-upload', args=[upload_id])
+
+        for offset in range(0, len(PDF), 1024):
+            response = _patch(presenter_client, upload_id, offset, PDF[offset:offset + 1024])
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            assert response['Upload-Offset'] == str(min(offset + 1024, len(PDF)))
+
+        response = presenter_client.head(reverse('presentation-upload', args=[upload_id]))
+        assert response['Upload-Offset'] == response['Upload-Length'] == str(len(PDF))
+
+        response = presenter_client.post(reverse('presentation-upload-finalize', args=[upload_id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        presentation.refresh_from_db()
+        assert presentation.file_name == 'slides.pdf'
+        assert presentation.file_sha256 == hashlib.sha256(PDF).hexdigest()
+        with presentation.file_url.open('rb') as f:
+            assert f.read() == PDF
+        assert not PresentationUpload.objects.exists()
+        assert not any(settings.PRESENTATION_UPLOAD_DIR.iterdir())
+
+    def test_rejects_extension_and_size_before_upload(self, presenter_client, presentation):
+        """확장자/크기는 만들 때 거른다"""
+        assert _create(presenter_client, presentation, filename='run.exe').status_code == status.HTTP_400_BAD_REQUEST
+        response = _create(presenter_client, presentation, size=51 * 1024 * 1024)
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_rejects_wrong_magic_bytes(self, presenter_client, presentation):
+        """첫 조각의 시그니처가 확장자와 다르면 받지 않는다"""
+        upload_id = _create(presenter_client, presentation, filename='slides.pptx').data['id']
+
+        response = _patch(presenter_client, upload_id, 0, PDF[:1024])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert PresentationUpload.objects.get(pk=upload_id).offset == 0
+
+    def test_offset_mismatch_conflict(self, presenter_client, presentation):
+        """받은 위치와 다른 offset 은 409"""
+        upload_id = _create(presenter_client, presentation).data['id']
+        _patch(presenter_client, upload_id, 0, PDF[:1024])
+
+        response = _patch(presenter_client, upload_id, 0, PDF[:1024])
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert PresentationUpload.objects.get(pk=upload_id).offset == 1024
+
+    def test_chunk_too_large(self, presenter_client, presentation):
+        """조각 최대 크기를 넘으면 413"""
+        upload_id = _create(presenter_client, presentation).data['id']
+
+        response = _patch(presenter_client, upload_id, 0, PDF[:2048])
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_finalize_incomplete(self, presenter_client, presentation):
+        """다 받지 않은 업로드는 붙일 수 없다"""
+        upload_id = _create(presenter_client, presentation).data['id']
+        _patch(presenter_client, upload_id, 0, PDF[:1024])
+
+        response = presenter_client.post(reverse('presentation-upload-finalize', args=[upload_id]))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_only_presenter(self, presenter_client, presentation):
+        """발표자가 아니면 시작할 수 없고, 남의 업로드는 보이지 않는다"""
+        upload_id = _create(presenter_client, presentation).data['id']
+        other = APIClient()
+        other.force_authenticate(user=UserFactory())
+
+        assert _create(other, presentation).status_code == status.HTTP_403_FORBIDDEN
+        assert _patch(other, upload_id, 0, PDF[:1024]).status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_purge_uploads_command(presentation, settings):
+    """만료된 업로드와 조각 파일을 지운다"""
+    upload = PresentationUpload.objects.create(
+        presentation=presentation, uploaded_by=presentation.presenter, filename='a.pdf', size=10,
+        expires_at=timezone.now() - timedelta(hours=1),
+    )
+    upload.part_path.parent.mkdir(parents=True)
+    upload.part_path.write_bytes(b'%PDF-')
+    out = StringIO()
+
+    call_command('purge_uploads', stdout=out)
+
+    assert not PresentationUpload.objects.exists()
+    assert not upload.part_path.exists()
+    assert '1개' in out.getvalue()
@@ -175,3 +175,18 @@ class TestPresentationCommentViewSet:
         detail_url = reverse('presentation-comments-detail', kwargs={'pk': comment.id})
         detail_response = api_client.get(detail_url)
         assert detail_response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestPresentationViewSetSearch:
+    """Presentation 목록 검색 테스트"""
+
+    def test_list_search_by_title(self, api_client):
+        """?search= 로 제목/설명 검색"""
+        match = PresentationFactory(title='장고 성능 최적화', description='쿼리 튜닝')
+        PresentationFactory(title='파이썬 타입 힌트', description='mypy')
+
+        response = api_client.get(reverse('presentation-list'), {'search': '성능 최적화'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['id'] for item in response.data] == [match.id]
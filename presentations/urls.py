@@ -1,8 +1,21 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from presentations.apis import PresentationUploadApi, PresentationUploadCreateApi, PresentationUploadFinalizeApi
 from presentations.viewsets import PresentationCommentViewSet, PresentationViewSet
 
 router = DefaultRouter()
 router.register('presentations', PresentationViewSet)
 router.register('comments', PresentationCommentViewSet, basename='presentation-comments')
 
-urlpatterns = router.urls
+# 발표 자료 조각 업로드 (presentations.apis)
+upload_patterns = [
+    path('uploads/', PresentationUploadCreateApi.as_view(), name='presentation-upload-create'),
+    path('uploads/<uuid:upload_id>/', PresentationUploadApi.as_view(), name='presentation-upload'),
+    path(
+        'uploads/<uuid:upload_id>/finalize/',
+        PresentationUploadFinalizeApi.as_view(),
+        name='presentation-upload-finalize',
+    ),
+]
+
+urlpatterns = upload_patterns + router.urls
@@ -1,4 +1,4 @@
-from django.http import FileResponse, Http404, HttpResponse
+from django.http import Http404, HttpResponse
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
@@ -11,8 +11,11 @@ from django.urls import reverse_lazy
 from django.contrib import messages
 from .forms import PresentationForm
 
+from common.downloads import file_download_response
+from common.search import search_filter
 from presentations.models import Presentation, PresentationComment
 from presentations.serializers import PresentationSerializer, PresentationCommentSerializer
+from presentations.services import presentation_file_digest_set
 from users.models import User
 
 
@@ -22,6 +25,14 @@ class PresentationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     parser_classes = [MultiPartParser, FormParser]
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # ?search= 제목/설명 전문 검색 (common.search), 관련도 순
+        search = self.request.query_params.get('search')
+        if self.action == 'list' and search:
+            qs = search_filter(qs, search).order_by('-search_rank', '-created_at')
+        return qs
+
     def perform_create(self, serializer):
         # 정회원만 발표 신청 가능
         if self.request.user.user_type != User.UserType.REGULAR:
@@ -45,19 +56,22 @@ class PresentationViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def download(self, request, pk=None):
-        """파일 다운로드"""
+        """파일 다운로드 - Range/If-Range 이어 받기, ETag 304 (common.downloads)"""
         presentation = self.get_object()
 
         if not presentation.file_url:
             raise Http404("파일이 없습니다.")
 
         try:
-            response = FileResponse(
-                presentation.file_url.open(),
-                as_attachment=True,
-                filename=presentation.file_name
+            if not presentation.file_sha256:
+                presentation_file_digest_set(presentation=presentation)
+            return file_download_response(
+                request,
+                presentation.file_url,
+                filename=presentation.file_name,
+                sha256=presentation.file_sha256,
+                size=presentation.file_size,
             )
-            return response
         except FileNotFoundError:
             raise Http404("파일을 찾을 수 없습니다.")
 
@@ -1,5 +1,8 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+
 from .models import User
+from .services import user_bulk_make_regular, user_principal_invalidate
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
@@ -9,7 +12,24 @@ class UserAdmin(admin.ModelAdmin):
     fields = ('username', 'email', 'user_type', 'is_active', 'is_staff', 'password')
     actions = ['make_regular']
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            user_principal_invalidate(user_ids=[obj.pk])
+
+    def delete_model(self, request, obj):
+        user_principal_invalidate(user_ids=[obj.pk])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        user_principal_invalidate(user_ids=list(queryset.values_list('pk', flat=True)))
+        super().delete_queryset(request, queryset)
+
     @admin.action(description='선택한 유저를 정회원으로 변경')
     def make_regular(self, request, queryset):
-        updated = queryset.update(user_type=User.UserType.REGULAR)
-        self.message_user(request, f"{updated}명의 유저가 정회원으로 변경되었습니다.")
\ No newline at end of file
+        try:
+            updated = user_bulk_make_regular(users=queryset)
+        except ValidationError as e:
+            self.message_user(request, f"정회원 변경에 실패했습니다: {e.message_dict}", level=messages.ERROR)
+            return
+        self.message_user(request, f"{len(updated)}명의 유저가 정회원으로 변경되었습니다.")
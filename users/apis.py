@@ -4,7 +4,11 @@ from rest_framework.response import Response
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.utils import timezone
 
+from common.mixins import ConditionalGetMixin
+from common.serializers import compile_serializer
 from users.services import user_create, user_update, user_approve
 from users.selectors import user_list, user_get, user_get_pending_approval
 
@@ -49,7 +53,7 @@ class UserCreateApi(APIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class UserListApi(APIView):
+class UserListApi(ConditionalGetMixin, APIView):
     """사용자 목록 API"""
     permission_classes = [IsAuthenticated]
 
@@ -62,6 +66,10 @@ class UserListApi(APIView):
         search = serializers.CharField(required=False)
         has_referrer = serializers.BooleanField(required=False)
 
+    def get_validator_aggregates(self):
+        # 추천인 이름도 응답에 포함된다
+        return {**super().get_validator_aggregates(), 'referrer_last_updated': Max('referrer__updated_at')}
+
     class OutputSerializer(serializers.Serializer):
         id = serializers.IntegerField()
         email = serializers.EmailField()
@@ -77,13 +85,14 @@ class UserListApi(APIView):
         filters_serializer.is_valid(raise_exception=True)
 
         users = user_list(filters=filters_serializer.validated_data)
+        self.check_not_modified(users)
 
         # OutputSerializer로 응답 데이터 직렬화
-        data = self.OutputSerializer(users, many=True).data
+        data = compile_serializer(self.OutputSerializer).many(users)
         return Response(data)
 
 
-class UserDetailApi(APIView):
+class UserDetailApi(ConditionalGetMixin, APIView):
     """사용자 상세 조회 API"""
     permission_classes = [IsAuthenticated]
 
@@ -105,6 +114,7 @@ class UserDetailApi(APIView):
 
     def get(self, request, user_id):
         user = user_get(user_id=user_id)
+        self.check_object_not_modified(user)
 
         # OutputSerializer로 응답 데이터 직렬화
         data = self.OutputSerializer(user).data
@@ -180,7 +190,7 @@ class UserApproveApi(APIView):
         return Response(response_data)
 
 
-class UserPendingApprovalListApi(APIView):
+class UserPendingApprovalListApi(ConditionalGetMixin, APIView):
     """승인 대기 사용자 목록 API"""
     permission_classes = [IsAuthenticated]
 
@@ -195,9 +205,15 @@ class UserPendingApprovalListApi(APIView):
         waiting_days = serializers.SerializerMethodField()
 
         def get_waiting_days(self, obj):
-            from django.utils import timezone
             return (timezone.now().date() - obj.date_joined.date()).days
 
+    def get_validator_aggregates(self):
+        return {**super().get_validator_aggregates(), 'referrer_last_updated': Max('referrer__updated_at')}
+
+    def get_validator_parts(self):
+        # 대기 일수는 날짜가 바뀌면 달라진다
+        return [*super().get_validator_parts(), f'today={timezone.now().date()}']
+
     def get(self, request):
         if request.user.user_type != User.UserType.ADMIN:
             return Response(
@@ -206,7 +222,8 @@ class UserPendingApprovalListApi(APIView):
             )
 
         pending_users = user_get_pending_approval()
+        self.check_not_modified(pending_users)
 
         # OutputSerializer로 응답 데이터 직렬화
-        data = self.OutputSerializer(pending_users, many=True).data
+        data = compile_serializer(self.OutputSerializer).many(pending_users)
         return Response(data)
@@ -4,11 +4,19 @@ from rest_framework.response import Response
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny
 from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth.models import AnonymousUser
 from django.middleware.csrf import get_token
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.utils.decorators import method_decorator
 from django.core.exceptions import ValidationError
 
+from common.async_apis import AsyncApiView
+from common.mixins import ConditionalGetMixin
+from users.authentication import PrincipalSessionAuthentication
+from users.selectors import aprincipal_get
+from users.hashing import password_verify
+from users.services import user_password_set
+
 if TYPE_CHECKING:
     from users.models import User
 else:
@@ -49,7 +57,7 @@ class LoginApi(APIView):
         username = serializer.validated_data['username']
         password = serializer.validated_data['password']
 
-        # Django의 기본 authenticate 함수 사용
+        # Django의 기본 authenticate 함수 사용 - 해시는 PooledModelBackend 가 프로세스 풀에서 계산
         user = authenticate(request, username=username, password=password)
 
         if user is None:
@@ -82,8 +90,9 @@ class LogoutApi(APIView):
         return Response({'message': '로그아웃되었습니다.'})
 
 
-class MeApi(APIView):
-    """현재 로그인한 사용자 정보 API"""
+class MeApi(ConditionalGetMixin, APIView):
+    """현재 로그인한 사용자 정보 API - 사용자는 캐시된 Principal (users.selectors.principal_get)"""
+    authentication_classes = [PrincipalSessionAuthentication]
 
     class OutputSerializer(serializers.Serializer):
         id = serializers.IntegerField()
@@ -100,11 +109,31 @@ class MeApi(APIView):
                 {'error': '인증되지 않은 사용자입니다.'},
                 status=status.HTTP_401_UNAUTHORIZED
             )
+        self.check_object_not_modified(request.user)
 
         serializer = self.OutputSerializer(request.user)
         return Response(serializer.data)
 
 
+class MeAsyncApi(AsyncApiView):
+    """현재 로그인한 사용자 정보 API - async 버전 (ASGI 배포용, config.asgi_urls)"""
+    sync_view = MeApi.as_view()
+
+    async def aget_user(self, request):
+        return await aprincipal_get(request=request) or AnonymousUser()
+
+    async def get(self, request):
+        if not self.user.is_authenticated:
+            return self.render(
+                {'error': '인증되지 않은 사용자입니다.'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        self.check_object_not_modified(self.user)
+
+        serializer = MeApi.OutputSerializer(self.user)
+        return self.render(serializer.data)
+
+
 class ChangePasswordApi(APIView):
     """비밀번호 변경 API"""
 
@@ -127,21 +156,22 @@ class ChangePasswordApi(APIView):
         new_password = serializer.validated_data['new_password']
 
         # 현재 비밀번호 확인
-        if not user.check_password(current_password):
+        is_correct, _ = password_verify(password=current_password, encoded=user.password)
+        if not is_correct:
             return Response(
                 {'error': '현재 비밀번호가 올바르지 않습니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # 새 비밀번호 설정
-        user.set_password(new_password)
-        user.save()
+        user_password_set(user=user, password=new_password)
 
         return Response({'message': '비밀번호가 변경되었습니다.'})
 
 
 class CheckAuthApi(APIView):
-    """인증 상태 확인 API (Next.js용)"""
+    """인증 상태 확인 API (Next.js용) - 사용자는 캐시된 Principal (users.selectors.principal_get)"""
+    authentication_classes = [PrincipalSessionAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -159,4 +189,28 @@ class CheckAuthApi(APIView):
         return Response({
             'authenticated': False,
             'user': None
-        })
\ No newline at end of file
+        })
+
+class CheckAuthAsyncApi(AsyncApiView):
+    """인증 상태 확인 API - async 버전 (ASGI 배포용, config.asgi_urls)"""
+    sync_view = CheckAuthApi.as_view()
+
+    async def aget_user(self, request):
+        return await aprincipal_get(request=request) or AnonymousUser()
+
+    async def get(self, request):
+        if self.user.is_authenticated:
+            return self.render({
+                'authenticated': True,
+                'user': {
+                    'id': self.user.id,
+                    'email': self.user.email,
+                    'username': self.user.username,
+                    'user_type': self.user.user_type,
+                }
+            })
+
+        return self.render({
+            'authenticated': False,
+            'user': None
+        })
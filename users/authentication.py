@@ -0,0 +1,61 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from rest_framework.authentication import SessionAuthentication
+
+from users.hashing import password_make, password_verify
+from users.selectors import principal_get
+from users.services import user_password_set
+
+
+class PrincipalSessionAuthentication(SessionAuthentication):
+    """
+    세션 인증 - request.user 대신 캐시된 Principal 을 사용자로 쓴다.
+
+    세션(cached_db)과 Principal 이 모두 캐시에 있으면 SQL 없이 끝나므로
+    페이지 이동마다 호출되는 MeApi/CheckAuthApi 처럼 사용자 요약만 필요한 API 에 쓴다.
+    """
+
+    def authenticate(self, request):
+        principal = principal_get(request=request._request)
+        if principal is None:
+            return None
+
+        self.enforce_csrf(request)
+        return (principal, None)
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend 와 같지만 비밀번호 해시를 users.hashing 프로세스 풀에서 계산한다.
+
+    예전 방식/파라미터로 저장된 해시는 로그인에 성공하면 선호 방식으로 다시 해시해 저장한다.
+
+    이전 세션이 저장한 백엔드 경로를 받아 주도록 AUTHENTICATION_BACKENDS 에 ModelBackend 를 뒤에
+    남겨 두므로, 비밀번호를 확인한 뒤 실패하면 PermissionDenied 로 끝내 ModelBackend 가 요청 스레드에서
+    같은 해시를 다시 계산하지 않게 한다.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # 없는 사용자도 해시 한 번만큼 시간을 써서 응답 시간으로 가입 여부를 알 수 없게 한다
+            password_make(password=password)
+            raise PermissionDenied
+
+        is_correct, must_update = password_verify(password=password, encoded=user.password)
+        if not is_correct or not self.user_can_authenticate(user):
+            raise PermissionDenied
+        if must_update:
+            user_password_set(user=user, password=password)
+        return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        return await sync_to_async(self.authenticate)(request, username=username, password=password, **kwargs)
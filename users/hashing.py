@@ -0,0 +1,147 @@
+"""
+비밀번호 해시 계산 (로그인/가입 몰림 대비)
+
+PBKDF2/Argon2 해시 한 번은 CPU 를 수백 ms 쓴다. 로그인이 몰리면 요청 스레드가 전부
+해시 계산에 묶여 다른 API 까지 느려지므로
+  1) 계산은 전용 프로세스 풀(PASSWORD_HASH_WORKERS 개)에서 하고
+  2) 웹 워커 프로세스마다 동시에 계산/대기하는 해시를 PASSWORD_HASH_MAX_CONCURRENCY 개로
+     제한한다. 자리가 PASSWORD_HASH_QUEUE_TIMEOUT 초 안에 나지 않으면 PasswordHashBusy(503)
+로 바로 돌려보내 요청 스레드가 줄지어 기다리지 않게 한다.
+
+해시 방식은 settings.PASSWORD_HASHERS 를 따른다 (argon2-cffi 가 있으면 TunedArgon2PasswordHasher).
+예전 방식/파라미터의 해시는 로그인 때 다시 해시한다 (users.authentication.PooledModelBackend).
+
+PASSWORD_HASH_WORKERS = 0 이면 풀 없이 요청 스레드에서 계산한다 (동시 실행 제한은 그대로).
+"""
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, make_password, verify_password
+from django.core.signals import setting_changed
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+DEFAULTS = {
+    'PASSWORD_HASH_WORKERS': 2,
+    'PASSWORD_HASH_MAX_CONCURRENCY': 4,
+    'PASSWORD_HASH_QUEUE_TIMEOUT': 5,
+}
+
+
+def _setting(name: str):
+    return getattr(settings, name, DEFAULTS[name])
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id - 메모리 19 MiB, 2회, 병렬 1 (OWASP 권장 최소값)
+
+    Django 기본값(100 MiB, 병렬 8)은 해시 하나가 코어를 여러 개 쓰므로, 동시 로그인 수만큼
+    메모리/코어가 늘어나는 웹 서버에서는 한 건당 비용을 낮추고 동시 실행 수로 조절한다.
+    파라미터를 바꾸면 기존 해시는 로그인 때 다시 해시된다 (must_update).
+    """
+
+    time_cost = 2
+    memory_cost = 19_456
+    parallelism = 1
+
+
+class PasswordHashBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '로그인 요청이 많습니다. 잠시 후 다시 시도해 주세요.'
+    default_code = 'password_hash_busy'
+    # DRF 예외 처리기가 Retry-After 헤더로 내보낸다
+    wait = 1
+
+
+_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+
+
+def _init_worker(hashers) -> None:
+    # 풀 프로세스는 해시만 계산하므로 앱 로딩 없이 PASSWORD_HASHERS 만 설정한다
+    settings.configure(PASSWORD_HASHERS=hashers)
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = _setting('PASSWORD_HASH_WORKERS')
+    if workers <= 0:
+        return None
+    with _lock:
+        if _pool is None:
+            # fork 는 요청 스레드/DB 연결까지 복제하므로 새 인터프리터로 띄운다
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(list(settings.PASSWORD_HASHERS),),
+            )
+        return _pool
+
+
+def _get_slots() -> threading.BoundedSemaphore:
+    global _slots
+    with _lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(_setting('PASSWORD_HASH_MAX_CONCURRENCY'))
+        return _slots
+
+
+def password_hash_pool_shutdown() -> None:
+    """풀 프로세스를 내리고 동시 실행 제한을 설정값으로 다시 만든다 (다음 해시 때 새로 띄운다)"""
+    global _pool, _slots
+    with _lock:
+        pool, _pool, _slots = _pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _reset_on_setting_changed(*, setting, **kwargs):
+    if setting == 'PASSWORD_HASHERS' or setting in DEFAULTS:
+        password_hash_pool_shutdown()
+
+
+setting_changed.connect(_reset_on_setting_changed, dispatch_uid='users.hashing.reset')
+atexit.register(password_hash_pool_shutdown)
+
+
+@contextmanager
+def password_hash_slot():
+    """해시 계산 자리 하나를 잡는다 - PASSWORD_HASH_QUEUE_TIMEOUT 초 안에 못 잡으면 PasswordHashBusy"""
+    slots = _get_slots()
+    if not slots.acquire(timeout=_setting('PASSWORD_HASH_QUEUE_TIMEOUT')):
+        raise PasswordHashBusy()
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def _run(func: Callable, *args):
+    with password_hash_slot():
+        pool = _get_pool()
+        if pool is None:
+            return func(*args)
+        return pool.submit(func, *args).result()
+
+
+def password_verify(*, password: str, encoded: str) -> Tuple[bool, bool]:
+    """
+    (비밀번호가 맞는지, 다시 해시해야 하는지) 를 돌려준다.
+
+    다시 해시해야 하는 경우는 선호 해시 방식(PASSWORD_HASHERS[0])이나 그 파라미터가 바뀐 경우다.
+    """
+    if password is None:
+        return False, False
+    return _run(verify_password, password, encoded)
+
+
+def password_make(*, password: str) -> str:
+    return _run(make_password, password)
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from common.search import search_index_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_remove_user_name_alter_user_username'),
+    ]
+
+    operations = [
+        search_index_migration('users', 'User'),
+    ]
@@ -36,11 +36,18 @@ class User(AbstractUser):
     def clean(self):
         """모델 검증 - 간단한 비관계형 필드 검증만"""
         super().clean()
-        if self.referrer == self:
+        if self._refers_to_self('referrer'):
             raise ValidationError("자기 자신을 추천인으로 설정할 수 없습니다.")
-        if self.approved_by == self:
+        if self._refers_to_self('approved_by'):
             raise ValidationError("자기 자신을 승인자로 설정할 수 없습니다.")
 
+    def _refers_to_self(self, field_name: str) -> bool:
+        """관계 객체를 DB 에서 읽지 않고 비교한다 (일괄 수정에서 행마다 쿼리가 나가지 않게)"""
+        field = self._meta.get_field(field_name)
+        if field.is_cached(self):
+            return getattr(self, field_name) == self
+        return self.pk is not None and getattr(self, field.attname) == self.pk
+
     @property
     def is_approved_member(self) -> bool:
         """간단한 파생 값 - 모델 속성으로 적합"""
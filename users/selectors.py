@@ -1,7 +1,14 @@
-from django.contrib.auth import get_user_model
+from dataclasses import dataclass
+from datetime import datetime
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.core.cache import caches
 from django.db.models import QuerySet,Q,Count
+from django.utils.crypto import constant_time_compare
 from typing import Optional,TYPE_CHECKING
 
+from common.search import search_filter
+
 if TYPE_CHECKING:
     from users.models import User
 else:
@@ -20,19 +27,16 @@ def user_list(*,filters:Optional[dict]=None) -> QuerySet[User]:
     if 'newsletter_subscribed' in filters:
         qs = qs.filter(newsletter_subscribed=filters['newsletter_subscribed'])
 
-    if 'search' in filters:
-        search_term = filters['search']
-        qs = qs.filter(
-            Q(username__icontains=search_term) |
-            Q(email__icontains=search_term) |
-            Q(company__icontains=search_term)
-        )
     if 'has_referrer' in filters:
         if filters['has_referrer']:
             qs = qs.filter(referrer__isnull=False)
         else:
             qs = qs.filter(referrer__isnull=True)
 
+    if 'search' in filters:
+        # 사용자명/이메일/회사 전문 검색 (common.search), 관련도 순
+        return search_filter(qs, filters['search']).order_by('-search_rank', '-date_joined')
+
     return qs.order_by('-date_joined')
 
 def user_get(*,user_id:int) -> User:
@@ -50,3 +54,118 @@ def user_get_pending_approval() -> QuerySet[User]:
         approved_by__isnull=True
     ).select_related('referrer').order_by('date_joined')
 
+
+# 세션 사용자 요약(Principal) 캐시 - users.services.user_principal_invalidate 로 무효화
+#
+# 무효화는 PRINCIPAL_CACHE_ALIAS 캐시에서만 지우므로, 캐시가 프로세스마다 따로(LocMemCache)면 다른
+# 워커에는 비밀번호 변경/비활성화 전의 Principal 이 PRINCIPAL_CACHE_TIMEOUT 초 동안 남는다.
+# 공유 캐시(Redis/Memcached)를 쓰지 않는 동안에는 TTL 을 초 단위로 짧게 둔다.
+DEFAULTS = {
+    'PRINCIPAL_CACHE_ALIAS': 'default',
+    'PRINCIPAL_CACHE_TIMEOUT': 5,
+}
+
+
+def _setting(name: str):
+    return getattr(settings, name, DEFAULTS[name])
+
+
+def principal_cache():
+    return caches[_setting('PRINCIPAL_CACHE_ALIAS')]
+
+
+def principal_cache_key(user_id) -> str:
+    return f'principal:{user_id}'
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증 확인용 사용자 요약 - User 와 같은 이름의 속성을 가지므로
+    MeApi.OutputSerializer 로 그대로 직렬화하고 ConditionalGetMixin 의 검증값으로 쓸 수 있다.
+    """
+    id: int
+    username: str
+    email: str
+    user_type: str
+    newsletter_subscribed: bool
+    updated_at: datetime
+    # 비밀번호가 바뀌면 달라지는 값 - 세션에 저장된 값과 같아야 인증된 것으로 본다
+    session_auth_hash: str
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    @property
+    def is_approved_member(self) -> bool:
+        return self.user_type == User.UserType.REGULAR
+
+    @property
+    def full_display_name(self) -> str:
+        return f"{self.username} ({self.email})"
+
+    @classmethod
+    def from_user(cls, user: User) -> 'Principal':
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            user_type=user.user_type,
+            newsletter_subscribed=user.newsletter_subscribed,
+            updated_at=user.updated_at,
+            session_auth_hash=user.get_session_auth_hash(),
+        )
+
+
+def _principal_matches_session(principal: Optional[Principal], session_hash: Optional[str]) -> bool:
+    return principal is not None and constant_time_compare(session_hash or '', principal.session_auth_hash)
+
+
+def principal_get(*, request) -> Optional[Principal]:
+    """
+    세션 사용자 요약 - 캐시에 있고 세션의 인증 해시와 맞으면 User 행을 읽지 않는다.
+
+    캐시에 없거나 맞지 않으면 request.user (django 의 세션 인증 - 해시 불일치 시 세션 삭제)로
+    확인한 뒤 캐시에 넣는다. 비로그인이면 None.
+    """
+    session = request.session
+    user_id = session.get(SESSION_KEY)
+    if user_id is None or session.get(BACKEND_SESSION_KEY) not in settings.AUTHENTICATION_BACKENDS:
+        return None
+
+    principal = principal_cache().get(principal_cache_key(user_id))
+    if _principal_matches_session(principal, session.get(HASH_SESSION_KEY)):
+        return principal
+
+    user = request.user
+    if not user.is_authenticated:
+        return None
+
+    principal = Principal.from_user(user)
+    principal_cache().set(principal_cache_key(user.pk), principal, _setting('PRINCIPAL_CACHE_TIMEOUT'))
+    return principal
+
+
+async def aprincipal_get(*, request) -> Optional[Principal]:
+    """principal_get 의 async 버전 (async 뷰용)"""
+    session = request.session
+    user_id = await session.aget(SESSION_KEY)
+    if user_id is None or await session.aget(BACKEND_SESSION_KEY) not in settings.AUTHENTICATION_BACKENDS:
+        return None
+
+    principal = await principal_cache().aget(principal_cache_key(user_id))
+    if _principal_matches_session(principal, await session.aget(HASH_SESSION_KEY)):
+        return principal
+
+    user = await request.auser()
+    if not user.is_authenticated:
+        return None
+
+    principal = Principal.from_user(user)
+    await principal_cache().aset(principal_cache_key(user.pk), principal, _setting('PRINCIPAL_CACHE_TIMEOUT'))
+    return principal
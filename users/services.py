@@ -1,9 +1,13 @@
-from typing import Dict, Optional, TYPE_CHECKING
+from functools import partial
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import QuerySet
 
-from common.services import model_update
+from common.services import model_bulk_update, model_update
+from users.hashing import password_make
+from users.selectors import principal_cache, principal_cache_key
 
 if TYPE_CHECKING:
     from users.models import User
@@ -33,7 +37,8 @@ def user_create(*, email: str, username: str, password: str, referrer_id: Option
         user.referrer = referrer
         user.user_type = User.UserType.ASSOCIATE
 
-    user.set_password(password)
+    # 해시는 users.hashing 프로세스 풀에서 계산한다
+    user.password = password_make(password=password)
     user.full_clean()
     user.save()
 
@@ -44,13 +49,35 @@ def user_create(*, email: str, username: str, password: str, referrer_id: Option
     return user
 
 
+@transaction.atomic
+def user_password_set(*, user: User, password: str) -> User:
+    """비밀번호 변경 (로그인 때 예전 방식 해시를 다시 해시하는 것도 이것으로 한다)"""
+    user.password = password_make(password=password)
+    user.save(update_fields=['password'])
+    # 세션 인증 해시가 바뀌었으므로 캐시된 Principal 로 기존 세션이 인증되지 않게 한다
+    user_principal_invalidate(user_ids=[user.pk])
+    return user
+
+
 @transaction.atomic
 def user_update(*, user: User, data: Dict) -> User:
     updatable_fields = ['username', 'phone', 'company', 'newsletter_subscribed']
     updated_user, has_updated = model_update(instance=user, fields=updatable_fields, data=data)
+    if has_updated:
+        user_principal_invalidate(user_ids=[user.pk])
     return updated_user
 
 
+@transaction.atomic
+def user_bulk_make_regular(*, users: QuerySet[User]) -> Dict[int, List[str]]:
+    """선택한 사용자들을 정회원으로 변경 - 이미 정회원인 사용자는 건너뛴다"""
+    users = list(users)
+    data_by_pk = {user.pk: {'user_type': User.UserType.REGULAR} for user in users}
+    updated = model_bulk_update(instances=users, fields=['user_type'], data_by_pk=data_by_pk)
+    user_principal_invalidate(user_ids=updated)
+    return updated
+
+
 @transaction.atomic
 def user_approve(*, user: User, approved_by: User) -> User:
     if approved_by.user_type != User.UserType.ADMIN:
@@ -66,6 +93,7 @@ def user_approve(*, user: User, approved_by: User) -> User:
     user.approved_by = approved_by
     user.full_clean()
     user.save()
+    user_principal_invalidate(user_ids=[user.pk])
 
     return user
 
@@ -88,4 +116,17 @@ def user_set_referrer(*, user: User, referrer: User) -> User:
 
     user.full_clean()
     user.save()
-    return user
\ No newline at end of file
+    user_principal_invalidate(user_ids=[user.pk])
+    return user
+
+
+def user_principal_invalidate(*, user_ids: Iterable[int]) -> None:
+    """
+    세션 사용자 요약(users.selectors.Principal) 캐시를 커밋 후 지운다.
+
+    Principal 에 들어가는 값(사용자명/이메일/유형/뉴스레터/비밀번호)을 바꾸는 곳에서 호출한다.
+    이 프로세스가 보는 캐시에서만 지운다 (users.selectors 의 PRINCIPAL_CACHE_TIMEOUT 참고).
+    """
+    keys = [principal_cache_key(user_id) for user_id in user_ids]
+    if keys:
+        transaction.on_commit(partial(principal_cache().delete_many, keys))
\ No newline at end of file
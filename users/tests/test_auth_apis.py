@@ -1,6 +1,9 @@
 """
 Auth API 테스트
 """
+import time
+from types import SimpleNamespace
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -133,6 +136,23 @@ class TestMeApi:
         assert response.data['user_type'] == user.user_type
         assert 'is_approved_member' in response.data
 
+    def test_get_current_user_not_modified(self, api_client):
+        """정보가 그대로면 304, 수정되면 새 응답"""
+        from users.services import user_update
+
+        user = UserFactory()
+        api_client.force_authenticate(user=user)
+        url = reverse('auth:me')
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        user_update(user=user, data={'username': '새이름'})
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['username'] == '새이름'
+
     def test_get_current_user_unauthenticated(self, api_client):
         """인증되지 않은 사용자 정보 조회"""
         url = reverse('auth:me')
@@ -247,6 +267,103 @@ class TestCheckAuthApi:
         assert response.data['user'] is None
 
 
+@pytest.mark.django_db
+class TestPrincipalFastPath:
+    """세션 로그인 사용자의 인증 확인 - 캐시된 Principal 사용"""
+
+    @pytest.fixture
+    def user(self):
+        return UserFactory(username='김테스트')
+
+    @pytest.fixture
+    def logged_in(self, client, user):
+        client.force_login(user)
+        return client
+
+    @pytest.mark.parametrize('url_name', ['auth:check', 'auth:me'])
+    def test_zero_queries_when_cached(self, logged_in, django_assert_num_queries, url_name):
+        """세션과 Principal 이 캐시에 있으면 SQL 없이 응답한다"""
+        logged_in.get(reverse(url_name))
+
+        with django_assert_num_queries(0):
+            response = logged_in.get(reverse(url_name))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_user_update_invalidates(self, logged_in, user, django_capture_on_commit_callbacks):
+        """user_update 후에는 바뀐 값이 보인다"""
+        from users.services import user_update
+
+        logged_in.get(reverse('auth:check'))
+        with django_capture_on_commit_callbacks(execute=True):
+            user_update(user=user, data={'username': '박테스트'})
+
+        response = logged_in.get(reverse('auth:check'))
+
+        assert response.json()['user']['username'] == '박테스트'
+
+    def test_user_approve_invalidates(self, client, django_capture_on_commit_callbacks):
+        """user_approve 후에는 바뀐 사용자 유형이 보인다"""
+        from users.services import user_approve
+        from users.tests.factories import AdminUserFactory, AssociateMemberFactory
+
+        associate = AssociateMemberFactory()
+        client.force_login(associate)
+        client.get(reverse('auth:me'))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user_approve(user=associate, approved_by=AdminUserFactory())
+        response = client.get(reverse('auth:me'))
+
+        assert response.json()['user_type'] == User.UserType.REGULAR
+        assert response.json()['is_approved_member'] is True
+
+    def test_password_change_ends_other_sessions(self, logged_in, user, django_capture_on_commit_callbacks):
+        """비밀번호를 바꾸면 캐시된 Principal 로 기존 세션이 인증되지 않는다"""
+        logged_in.get(reverse('auth:check'))
+        api_client = APIClient()
+        api_client.force_authenticate(user=user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(reverse('auth:change-password'), {
+                'current_password': 'testpass123',
+                'new_password': 'newpass123',
+                'confirm_password': 'newpass123',
+            })
+        response = logged_in.get(reverse('auth:check'))
+
+        assert response.json()['authenticated'] is False
+
+    def test_stale_principal_on_other_worker_expires(
+        self, logged_in, user, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        """무효화가 닿지 않은 다른 워커의 예전 Principal 도 몇 초 안에 만료되어 기존 세션이 끊긴다"""
+        from django.core.cache.backends import locmem
+
+        from users.services import user_password_set
+
+        logged_in.get(reverse('auth:check'))
+        # 커밋 후 무효화를 실행하지 않는다 - 다른 워커의 캐시에는 예전 Principal 이 남는다
+        with django_capture_on_commit_callbacks(execute=False):
+            user_password_set(user=user, password='newpass123')
+
+        assert logged_in.get(reverse('auth:check')).json()['authenticated'] is True
+
+        later = time.time() + 10
+        monkeypatch.setattr(locmem, 'time', SimpleNamespace(time=lambda: later))
+        response = logged_in.get(reverse('auth:check'))
+
+        assert response.json()['authenticated'] is False
+
+    def test_me_not_modified(self, logged_in):
+        """Principal 로도 ETag 가 같다"""
+        etag = logged_in.get(reverse('auth:me'))['ETag']
+
+        response = logged_in.get(reverse('auth:me'), headers={'If-None-Match': etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
 # Pytest fixtures
 @pytest.fixture
 def api_client():
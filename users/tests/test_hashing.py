@@ -0,0 +1,75 @@
+"""
+비밀번호 해시 프로세스 풀(users.hashing)과 로그인 때 다시 해시 테스트
+"""
+import pytest
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.urls import reverse
+from rest_framework import status
+
+from users.hashing import password_hash_slot, password_make, password_verify
+from users.tests.factories import UserFactory
+
+
+class TestPasswordHashing:
+    """password_verify / password_make 테스트"""
+
+    def test_verify_in_pool(self):
+        """풀 프로세스에서 만든 해시를 풀 프로세스에서 검증한다"""
+        encoded = password_make(password='testpass123')
+
+        assert encoded.startswith(f'{get_hasher().algorithm}$')
+        assert password_verify(password='testpass123', encoded=encoded) == (True, False)
+        assert password_verify(password='wrongpass', encoded=encoded) == (False, False)
+
+    def test_outdated_hash_must_update(self):
+        """선호 방식이 아닌 해시는 다시 해시해야 한다고 알려 준다"""
+        encoded = make_password('testpass123', hasher='pbkdf2_sha1')
+
+        assert password_verify(password='testpass123', encoded=encoded) == (True, True)
+
+    def test_in_thread_without_workers(self, settings):
+        """PASSWORD_HASH_WORKERS = 0 이면 요청 스레드에서 계산한다"""
+        settings.PASSWORD_HASH_WORKERS = 0
+
+        encoded = password_make(password='testpass123')
+
+        assert password_verify(password='testpass123', encoded=encoded) == (True, False)
+
+
+@pytest.mark.django_db
+class TestLoginHashing:
+    """로그인 API 의 해시 처리 테스트"""
+
+    def test_login_rehashes_outdated_hash(self, api_client):
+        """예전 방식으로 저장된 해시는 로그인에 성공하면 선호 방식으로 다시 저장한다"""
+        user = UserFactory(username='olduser')
+        user.password = make_password('testpass123', hasher='pbkdf2_sha1')
+        user.save()
+
+        response = api_client.post(reverse('auth:login'), {'username': 'olduser', 'password': 'testpass123'})
+
+        assert response.status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.password.startswith(f'{get_hasher().algorithm}$')
+        assert user.check_password('testpass123')
+
+    def test_session_from_previous_backend_kept(self, client):
+        """ModelBackend 로 로그인한 기존 세션은 배포 뒤에도 로그인 상태로 남는다"""
+        client.force_login(UserFactory(), backend='django.contrib.auth.backends.ModelBackend')
+
+        response = client.get(reverse('auth:check'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['authenticated'] is True
+
+    def test_busy_returns_503(self, api_client, settings):
+        """해시 자리를 기다리다 시간이 지나면 503 과 Retry-After 로 돌려보낸다"""
+        settings.PASSWORD_HASH_MAX_CONCURRENCY = 1
+        settings.PASSWORD_HASH_QUEUE_TIMEOUT = 0
+        UserFactory(username='busyuser')
+
+        with password_hash_slot():
+            response = api_client.post(reverse('auth:login'), {'username': 'busyuser', 'password': 'testpass123'})
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '1'
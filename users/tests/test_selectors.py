@@ -67,6 +67,75 @@ class TestUserListSelector:
         assert users_without_referrer.count() == 5, f"기대값: 5, 실제값: {users_without_referrer.count()}" # 3 + 2 (추천인들)
 
 
+@pytest.mark.django_db
+class TestUserListSearch:
+    """user_list 전문 검색 테스트 (common.search)"""
+
+    def test_search_finds_substring_in_any_field(self):
+        """3글자 이상 검색어는 인덱스로 부분 문자열 검색"""
+        by_name = UserFactory(username='김철수영', company='')
+        by_company = UserFactory(username='이영희', company='철수영 컴퍼니')
+        UserFactory(username='박민수', company='다른 회사')
+
+        results = list(user_list(filters={'search': '철수영'}))
+
+        assert set(results) == {by_name, by_company}
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """저장/삭제 시 색인이 바로 갱신됨"""
+        from users.services import user_update
+
+        user = UserFactory(username='예전이름', company='')
+        user_update(user=user, data={'username': '새로운이름'})
+
+        assert list(user_list(filters={'search': '새로운이름'})) == [user]
+        assert list(user_list(filters={'search': '예전이름'})) == []
+
+        user.delete()
+        assert list(user_list(filters={'search': '새로운이름'})) == []
+
+    def test_search_ranks_better_matches_first(self):
+        """여러 필드에서 일치할수록 앞에 옴"""
+        weak = UserFactory(username='검색어하나', company='')
+        strong = UserFactory(username='검색어둘', company='검색어 회사')
+
+        results = list(user_list(filters={'search': '검색어'}))
+
+        assert results == [strong, weak]
+
+    def test_search_composes_with_queryset_methods(self):
+        """검색 결과에 values/count/슬라이스/다른 정렬을 이어 붙일 수 있음"""
+        strong = UserFactory(username='조합검색둘', company='조합검색 회사')
+        weak = UserFactory(username='조합검색하나', company='')
+        UserFactory(username='관계없음', company='')
+
+        results = user_list(filters={'search': '조합검색'})
+
+        assert results.count() == 2
+        assert list(results.values_list('pk', flat=True)[:1]) == [strong.pk]
+        assert list(results.order_by('search_rank').values_list('username', flat=True)) == [
+            weak.username, strong.username,
+        ]
+        assert results.values('username', 'search_rank')[0]['search_rank'] > 0
+
+    def test_rebuild_search_index_command(self):
+        """rebuild_search_index 명령이 원본 테이블로 색인을 다시 만듦"""
+        import io
+        from django.core.management import call_command
+        from django.db import connection
+
+        user = UserFactory(username='재색인대상', company='')
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM users_user_fts')
+        assert list(user_list(filters={'search': '재색인대상'})) == []
+
+        out = io.StringIO()
+        call_command('rebuild_search_index', model=['users.User'], stdout=out)
+
+        assert list(user_list(filters={'search': '재색인대상'})) == [user]
+        assert '1개 모델의 검색 인덱스를 다시 만들었습니다.' in out.getvalue()
+
+
 @pytest.mark.django_db
 class TestUserGetSelectors:
     """user_get 관련 셀렉터 테스트"""
@@ -6,7 +6,7 @@ import pytest
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 
-from users.services import user_create, user_update, user_approve, user_set_referrer
+from users.services import user_create, user_update, user_approve, user_set_referrer, user_bulk_make_regular
 from users.tests.factories import UserFactory, RegularMemberFactory, AdminUserFactory
 
 User = get_user_model()
@@ -185,4 +185,23 @@ class TestUserSetReferrerService:
         non_member_referrer = UserFactory(user_type=User.UserType.NON_MEMBER)
 
         with pytest.raises(ValidationError, match="비회원은 추천인이 될 수 없습니다"):
-            user_set_referrer(user=user, referrer=non_member_referrer)
\ No newline at end of file
+            user_set_referrer(user=user, referrer=non_member_referrer)
+
+
+@pytest.mark.django_db
+class TestUserBulkMakeRegularService:
+    """user_bulk_make_regular 서비스 테스트"""
+
+    def test_bulk_make_regular(self, django_assert_max_num_queries):
+        """바뀐 사용자만 보고하고, 검증/쓰기는 행 수와 무관한 쿼리 수로 처리"""
+        associates = UserFactory.create_batch(5, user_type=User.UserType.ASSOCIATE)
+        regular = RegularMemberFactory()
+        ids = [user.id for user in [*associates, regular]]
+
+        # 조회 1 + (SAVEPOINT) + bulk_update 1
+        with django_assert_max_num_queries(4):
+            updated = user_bulk_make_regular(users=User.objects.filter(id__in=ids))
+
+        assert set(updated) == {user.id for user in associates}
+        assert all(fields == ['user_type', 'updated_at'] for fields in updated.values())
+        assert User.objects.filter(id__in=ids, user_type=User.UserType.REGULAR).count() == 6
@@ -12,9 +12,11 @@ from users.auth_apis import (
     LoginApi,
     LogoutApi,
     MeApi,
+    MeAsyncApi,
     CSRFTokenApi,
     ChangePasswordApi,
-    CheckAuthApi
+    CheckAuthApi,
+    CheckAuthAsyncApi
 )
 
 # Django Styleguide 패턴: 작업별 URL 분리
@@ -41,3 +43,14 @@ urlpatterns = [
     path('', include((user_patterns, 'users'))),  # 'users' namespace 추가
     path('auth/', include((auth_patterns, 'auth'))),  # 이 줄 추가!
 ]
+
+# ASGI 배포(config.asgi_urls)용 - 자주 호출되는 읽기 API 를 같은 경로/이름의 async 뷰로 먼저 매칭
+async_auth_patterns = [
+    path('me/', MeAsyncApi.as_view(), name='me'),
+    path('check/', CheckAuthAsyncApi.as_view(), name='check'),
+]
+
+asgi_urlpatterns = [
+    path('', include((user_patterns, 'users'))),
+    path('auth/', include((async_auth_patterns + auth_patterns, 'auth'))),
+]